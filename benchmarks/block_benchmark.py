@@ -0,0 +1,95 @@
+import sys
+import os
+import random
+from time import perf_counter
+
+sys.path.insert(0, os.getcwd())
+
+from chip8_emulator.chip8 import Chip8
+from chip8_emulator.block_compiler import BlockCache
+from chip8_emulator.tiered_execution import TieredExecutor
+from benchmarks.null_io import NullScreen, NullKeyboard
+
+_ROM_PATH = 'roms/pong.rom'
+_INSTRUCTIONS = 200000
+# Register arithmetic loop without drawing: 6005 7101 8014 8202 8313 A300
+# F01E 8406 1200
+_ARITHMETIC_ROM = bytes([
+    0x60, 0x05, 0x71, 0x01, 0x80, 0x14, 0x82, 0x02, 0x83, 0x13,
+    0xA3, 0x00, 0xF0, 0x1E, 0x84, 0x06, 0x12, 0x00,
+])
+
+
+def _init_chip8(rom_bytes, hotness_threshold=None):
+    random.seed(0)
+    chip8 = Chip8(NullScreen(), NullKeyboard(), hotness_threshold,
+                  headless=True)
+    chip8.memory.load_rom(rom_bytes)
+
+    return chip8
+
+
+def _interpret(rom_bytes, instructions):
+    chip8 = _init_chip8(rom_bytes)
+    start = perf_counter()
+
+    for _ in range(instructions):
+        chip8.step()
+
+    return instructions / (perf_counter() - start)
+
+
+def _run_blocks(rom_bytes, instructions):
+    chip8 = _init_chip8(rom_bytes)
+    block_cache = BlockCache(chip8.memory)
+    executed_instructions = 0
+    start = perf_counter()
+
+    while executed_instructions < instructions:
+        block = block_cache.get_block(chip8.memory.program_counter)
+        executed_instructions += block(chip8)
+
+    return executed_instructions / (perf_counter() - start)
+
+
+def _run_tiered(rom_bytes, instructions):
+    chip8 = _init_chip8(rom_bytes, TieredExecutor.DEFAULT_HOTNESS_THRESHOLD)
+    tiered_executor = chip8.tiered_executor
+    statistics = tiered_executor.get_statistics()
+    start = perf_counter()
+
+    while statistics.interpreted_instructions \
+            + statistics.compiled_instructions < instructions:
+        tiered_executor.step()
+
+    executed_instructions = statistics.interpreted_instructions \
+        + statistics.compiled_instructions
+
+    return executed_instructions / (perf_counter() - start)
+
+
+def _report(name, rom_bytes, instructions):
+    interpreted_per_second = _interpret(rom_bytes, instructions)
+    compiled_per_second = _run_blocks(rom_bytes, instructions)
+    tiered_per_second = _run_tiered(rom_bytes, instructions)
+
+    print(name)
+    print('  Interpreter:     {:>12.0f} instructions/s'.format(interpreted_per_second))
+    print('  Compiled blocks: {:>12.0f} instructions/s ({:.1f}x)'.format(
+        compiled_per_second, compiled_per_second / interpreted_per_second))
+    print('  Tiered:          {:>12.0f} instructions/s ({:.1f}x)'.format(
+        tiered_per_second, tiered_per_second / interpreted_per_second))
+
+
+def main(rom_path=_ROM_PATH, instructions=_INSTRUCTIONS):
+    instructions = int(instructions)
+
+    with open(rom_path, 'rb') as rom_handle:
+        rom_bytes = rom_handle.read()
+
+    _report('Arithmetic loop', _ARITHMETIC_ROM, instructions)
+    _report(rom_path, rom_bytes, instructions // 10)
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
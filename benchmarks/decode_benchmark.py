@@ -0,0 +1,48 @@
+import sys
+import os
+from timeit import timeit
+
+sys.path.insert(0, os.getcwd())
+
+from chip8_emulator.opcode_parser import parse_operation_and_parameters
+from chip8_emulator.opcode_parser import decode_operation_and_parameters
+
+_ROM_PATH = 'roms/pong.rom'
+_REPETITIONS = 200
+
+
+def _get_rom_opcodes(rom_path):
+    with open(rom_path, 'rb') as rom_handle:
+        rom_bytes = rom_handle.read()
+
+    return [rom_bytes[index:index + 2] for index in range(0, len(rom_bytes) - 1, 2)]
+
+
+def _parse_with_string_parser(opcodes):
+    for opcode in opcodes:
+        parse_operation_and_parameters(opcode)
+
+
+def _decode_with_decode_table(opcodes):
+    for opcode in opcodes:
+        decode_operation_and_parameters(opcode)
+
+
+def main(rom_path=_ROM_PATH):
+    opcodes = _get_rom_opcodes(rom_path)
+    opcodes_int = [int.from_bytes(opcode, byteorder='big') for opcode in opcodes]
+    decoded_opcodes = len(opcodes) * _REPETITIONS
+
+    parser_seconds = timeit(lambda: _parse_with_string_parser(opcodes),
+                            number=_REPETITIONS)
+    table_seconds = timeit(lambda: _decode_with_decode_table(opcodes_int),
+                           number=_REPETITIONS)
+
+    print('Decoded {} opcodes from {}'.format(decoded_opcodes, rom_path))
+    print('String parser: {:>12.0f} opcodes/s'.format(decoded_opcodes / parser_seconds))
+    print('Decode table:  {:>12.0f} opcodes/s'.format(decoded_opcodes / table_seconds))
+    print('Speedup:       {:>12.1f}x'.format(parser_seconds / table_seconds))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
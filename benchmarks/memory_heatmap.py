@@ -0,0 +1,48 @@
+import sys
+import os
+import random
+
+sys.path.insert(0, os.getcwd())
+
+from chip8_emulator.chip8 import Chip8
+from benchmarks.null_io import NullScreen, NullKeyboard
+
+_ROM_PATH = 'roms/pong.rom'
+_DISPATCHES = 20000
+# Delay timer ticks every this many dispatches instead of at 60 Hz
+_DISPATCHES_PER_TIMER_TICK = 10
+_REPORT_PATH = 'memory_report.json'
+_HEATMAP_PATH = 'memory_heatmap.png'
+
+
+def main(rom_path=_ROM_PATH, dispatches=_DISPATCHES, report_path=_REPORT_PATH,
+         heatmap_path=_HEATMAP_PATH):
+    dispatches = int(dispatches)
+
+    with open(rom_path, 'rb') as rom_handle:
+        rom_bytes = rom_handle.read()
+
+    random.seed(0)
+    chip8 = Chip8(NullScreen(), NullKeyboard(), headless=True,
+                  profile_memory=True)
+    chip8.reset(rom_bytes)
+    memory_profiler = chip8.memory_profiler
+
+    for dispatch in range(dispatches):
+        memory_profiler.step()
+
+        if dispatch % _DISPATCHES_PER_TIMER_TICK == 0:
+            chip8.memory.decrement_delay_timer()
+
+    memory_profiler.save_report(report_path)
+    memory_profiler.save_heatmap(heatmap_path)
+    report = memory_profiler.get_report()
+
+    print('Fetches: {fetches:>10}  Reads: {reads:>10}  Writes: {writes:>10}'
+          .format(**report))
+    print('Report written to {}, heatmap to {}'.format(report_path,
+                                                        heatmap_path))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
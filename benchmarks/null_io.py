@@ -0,0 +1,35 @@
+class NullScreen:
+
+    def __init__(self):
+        self.width = None
+        self.height = None
+
+    def init(self):
+        pass
+
+    def clear(self):
+        pass
+
+    def draw_pixel(self, x, y):
+        pass
+
+    def clear_pixel(self, x, y):
+        pass
+
+    def refresh(self, rectangles):
+        pass
+
+
+class NullKeyboard:
+
+    def __init__(self):
+        self.pressed_key = None
+
+    def listen(self):
+        pass
+
+    def get_pressed_key(self):
+        return self.pressed_key
+
+    def wait_for_key(self):
+        return 0x0
@@ -0,0 +1,143 @@
+import math
+import sys
+import os
+import random
+from collections import Counter
+from time import perf_counter
+
+sys.path.insert(0, os.getcwd())
+
+from chip8_emulator.chip8 import Chip8
+from chip8_emulator.superinstructions import get_executed_instructions, \
+    get_fusion_report
+from benchmarks.null_io import NullScreen, NullKeyboard
+
+_ROM_PATH = 'roms/pong.rom'
+_INSTRUCTIONS = 20000
+# Delay timer ticks every this many instructions instead of at 60 Hz, so that
+# single and fused runs go through the same program states
+_INSTRUCTIONS_PER_TIMER_TICK = 10
+_MOST_COMMON_SEQUENCES = 10
+# Timings are noisy, the fastest of this many runs is reported
+_TIMED_RUNS = 5
+
+
+def _init_chip8(rom_bytes, fusion_enabled, count_fused_operations=False):
+    random.seed(0)
+    chip8 = Chip8(NullScreen(), NullKeyboard(), headless=True,
+                  count_fused_operations=count_fused_operations)
+    chip8.memory.fusion_enabled = fusion_enabled
+    chip8.memory.load_rom(rom_bytes)
+
+    return chip8
+
+
+def _get_timer_ticks(chip8, instructions, operations=None):
+    # Fused runs take fewer dispatches, both run the same instructions. The
+    # timer ticks due after each dispatch are returned to be replayed timed
+    memory = chip8.memory
+    timer_ticks = []
+    executed_instructions = 0
+    next_timer_tick = 0
+
+    while executed_instructions < instructions:
+        address = memory.program_counter
+        operation, _ = memory.get_current_instruction()
+
+        if operations is not None:
+            operations.append(operation)
+
+        chip8.step()
+        executed_instructions += get_executed_instructions(
+            operation, address, memory.program_counter)
+        dispatch_timer_ticks = 0
+
+        while executed_instructions >= next_timer_tick:
+            memory.decrement_delay_timer()
+            next_timer_tick += _INSTRUCTIONS_PER_TIMER_TICK
+            dispatch_timer_ticks += 1
+
+        timer_ticks.append(dispatch_timer_ticks)
+
+    return timer_ticks
+
+
+def _run(chip8, timer_ticks):
+    memory = chip8.memory
+    start = perf_counter()
+
+    for dispatch_timer_ticks in timer_ticks:
+        chip8.step()
+
+        for _ in range(dispatch_timer_ticks):
+            memory.decrement_delay_timer()
+
+    return perf_counter() - start
+
+
+def _time_fastest_runs(rom_bytes, instructions):
+    # Single and fused runs alternate, so that both see the same machine load
+    timer_ticks = {
+        fusion_enabled: _get_timer_ticks(
+            _init_chip8(rom_bytes, fusion_enabled), instructions)
+        for fusion_enabled in (False, True)
+    }
+    fastest_seconds = dict.fromkeys(timer_ticks, math.inf)
+
+    for _ in range(_TIMED_RUNS):
+        for fusion_enabled, fusion_timer_ticks in timer_ticks.items():
+            seconds = _run(_init_chip8(rom_bytes, fusion_enabled),
+                           fusion_timer_ticks)
+            fastest_seconds[fusion_enabled] = min(
+                fastest_seconds[fusion_enabled], seconds)
+
+    return fastest_seconds[False], fastest_seconds[True]
+
+
+def _print_sequences(title, sequences):
+    print(title)
+
+    for sequence, count in sequences.most_common(_MOST_COMMON_SEQUENCES):
+        print('  {:<24} {:>8}'.format(';'.join(sequence), count))
+
+
+def main(rom_path=_ROM_PATH, instructions=_INSTRUCTIONS):
+    instructions = int(instructions)
+
+    with open(rom_path, 'rb') as rom_handle:
+        rom_bytes = rom_handle.read()
+
+    operations = []
+    _get_timer_ticks(_init_chip8(rom_bytes, fusion_enabled=False),
+                     instructions, operations)
+    _print_sequences('Most frequent pairs', Counter(zip(operations,
+                                                        operations[1:])))
+    _print_sequences('Most frequent triples', Counter(zip(operations,
+                                                          operations[1:],
+                                                          operations[2:])))
+
+    single_seconds, fused_seconds = _time_fastest_runs(rom_bytes,
+                                                       instructions)
+    # Counted in a separate run, so that counting is not timed
+    counting_chip8 = _init_chip8(rom_bytes, fusion_enabled=True,
+                                 count_fused_operations=True)
+    _get_timer_ticks(counting_chip8, instructions)
+    fusion_report = get_fusion_report(counting_chip8.fusion_counts)
+    saved_dispatches = sum(fusion['saved_dispatches'] for fusion in fusion_report)
+
+    print('Fusions fired')
+
+    for fusion in fusion_report:
+        print('  {operation:<24} {count:>8} fired {saved_dispatches:>8} '
+              'dispatches saved'.format(**fusion))
+
+    print('Single instructions: {:>12.0f} instructions/s'.format(
+        instructions / single_seconds))
+    print('Fused instructions:  {:>12.0f} instructions/s'.format(
+        instructions / fused_seconds))
+    print('Dispatches saved:    {:>12.1%}'.format(
+        saved_dispatches / instructions))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
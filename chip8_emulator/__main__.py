@@ -1,18 +1,72 @@
+import argparse
 import sys
 import os
 
 sys.path.insert(0, os.getcwd())
 
-from chip8_emulator.chip8 import Chip8
+from chip8_emulator.chip8 import Chip8, SCREEN_ENGINES
 from chip8_emulator.pygame_screen import PygameScreen
 from chip8_emulator.pygame_keyboard import PygameKeyboard
+from chip8_emulator.rom_compiler import save_compiled_rom
 
 
-def main():
-    screen = PygameScreen()
+def _parse_run_arguments(arguments):
+    parser = argparse.ArgumentParser(prog='chip8_emulator')
+    parser.add_argument('rom_path')
+    parser.add_argument('--hotness-threshold', type=int, default=None,
+                        help='compile blocks executed more than this many times')
+    parser.add_argument('--cache-dir', default=None,
+                        help='directory holding the compiled ROMs')
+    parser.add_argument('--screen-engine', choices=sorted(SCREEN_ENGINES),
+                        default='python',
+                        help='framebuffer implementation, numpy needs NumPy')
+    parser.add_argument('--scale', type=int,
+                        default=PygameScreen.DEFAULT_SCALATION_FACTOR,
+                        help='window pixels per CHIP-8 pixel')
+    parser.add_argument('--window-size', type=int, nargs=2, default=None,
+                        metavar=('WIDTH', 'HEIGHT'),
+                        help='window size, overrides --scale')
+
+    return parser.parse_args(arguments)
+
+
+def _parse_compile_arguments(arguments):
+    parser = argparse.ArgumentParser(prog='chip8_emulator compile')
+    parser.add_argument('rom_path')
+    parser.add_argument('--cache-dir', default=None,
+                        help='directory holding the compiled ROMs')
+
+    return parser.parse_args(arguments)
+
+
+def run(arguments):
+    arguments = _parse_run_arguments(arguments)
+    window_size = None if arguments.window_size is None \
+        else tuple(arguments.window_size)
+    screen = PygameScreen(arguments.scale, window_size)
     keyboard = PygameKeyboard()
-    chip8 = Chip8(screen, keyboard)
-    chip8.main(sys.argv[1])
+    chip8 = Chip8(screen, keyboard, arguments.hotness_threshold,
+                  arguments.cache_dir, screen_engine=arguments.screen_engine)
+    chip8.main(arguments.rom_path)
+
+
+def compile_rom(arguments):
+    arguments = _parse_compile_arguments(arguments)
+
+    with open(arguments.rom_path, 'rb') as rom_handle:
+        rom_bytes = rom_handle.read()
+
+    compiled_rom_path = save_compiled_rom(rom_bytes, arguments.cache_dir)
+    print(compiled_rom_path)
+
+
+def main():
+    arguments = sys.argv[1:]
+
+    if arguments and arguments[0] == 'compile':
+        compile_rom(arguments[1:])
+    else:
+        run(arguments)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,232 @@
+import random
+from .opcode_parser import DECODE_TABLE
+
+MAX_BLOCK_INSTRUCTIONS = 64
+
+_BLOCK_PROLOGUE = (
+    'def {name}(chip8):',
+    '    memory = chip8.memory',
+    '    v = memory.v_registers',
+    '    handlers = chip8._operations',
+)
+
+# Straight-line operations translated into Python statements. They must
+# keep exactly the semantics of the matching Chip8 operation methods.
+_INLINE_OPERATION_TEMPLATES = {
+    '6xkk': ('v[{x}] = {kk}',),
+    '7xkk': ('v[{x}] = (v[{x}] + {kk}) & 0xFF',),
+    '8xy0': ('v[{x}] = v[{y}]',),
+    '8xy1': ('v[{x}] |= v[{y}]',),
+    '8xy2': ('v[{x}] &= v[{y}]',),
+    '8xy3': ('v[{x}] ^= v[{y}]',),
+    '8xy4': (
+        'result = v[{x}] + v[{y}]',
+        'v[{x}] = result & 0xFF',
+        'v[0xF] = 0x00 if result <= 0xFF else 0x01',
+    ),
+    '8xy5': (
+        'vx, vy = v[{x}], v[{y}]',
+        'v[0xF] = 0x01 if vx > vy else 0x00',
+        'v[{x}] = abs(vx - vy)',
+    ),
+    '8xy6': (
+        'vx = v[{x}]',
+        'v[{x}] = vx >> 1',
+        'v[0xF] = vx & 0x01',
+    ),
+    '8xy7': (
+        'vx, vy = v[{x}], v[{y}]',
+        'v[0xF] = 0x01 if vy > vx else 0x00',
+        'v[{x}] = abs(vy - vx)',
+    ),
+    '8xye': (
+        'vx = v[{x}]',
+        'v[{x}] = (vx << 1) & 0xFF',
+        'v[0xF] = vx & 0x01',
+    ),
+    'annn': ('memory.i_register = {nnn}',),
+    'cxkk': ('v[{x}] = random.getrandbits(8) & {kk}',),
+    'fx1e': ('memory.i_register += v[{x}]',),
+}
+
+# Operations ending a block, translated into the final program counter update
+_TERMINATOR_OPERATION_TEMPLATES = {
+    '1nnn': ('memory.program_counter = {nnn}',),
+    '2nnn': (
+        'memory.add_to_stack({address})',
+        'memory.program_counter = {nnn}',
+    ),
+    'bnnn': ('memory.program_counter = {nnn} + v[0x0]',),
+    '3xkk': ('memory.program_counter = {skip} if v[{x}] == {kk} else {next}',),
+    '4xkk': ('memory.program_counter = {skip} if v[{x}] != {kk} else {next}',),
+    '5xy0': ('memory.program_counter = {skip} if v[{x}] == v[{y}] else {next}',),
+    '9xy0': ('memory.program_counter = {skip} if v[{x}] != v[{y}] else {next}',),
+}
+
+BLOCK_TERMINATOR_OPERATIONS = {
+    '00ee', 'ex9e', 'exa1',
+} | set(_TERMINATOR_OPERATION_TEMPLATES)
+
+# Operations writing to program memory end the block, so that the
+# instructions after them are fetched again once they are invalidated
+_PROGRAM_MEMORY_WRITER_OPERATIONS = {'fx33', 'fx55'}
+
+_PARAMETER_NAMES_PER_ARITY = {
+    0: (),
+    1: ('x',),
+    2: ('x', 'y'),
+    3: ('x', 'y', 'n'),
+}
+
+
+def _get_template_parameters(operation, parameters, address):
+    if operation[1:] == 'nnn':
+        template_parameters = {'nnn': parameters[0]}
+    elif operation[1:] == 'xkk':
+        template_parameters = {'x': parameters[0], 'kk': parameters[1]}
+    else:
+        parameter_names = _PARAMETER_NAMES_PER_ARITY[len(parameters)]
+        template_parameters = dict(zip(parameter_names, parameters))
+
+    template_parameters['address'] = address
+    template_parameters['next'] = address + 2
+    template_parameters['skip'] = address + 4
+
+    return template_parameters
+
+
+def _get_handler_call_lines(operation, parameters, address):
+    arguments = ', '.join(str(parameter) for parameter in parameters)
+
+    return (
+        'memory.program_counter = {}'.format(address),
+        "handlers['{}']({})".format(operation, arguments),
+    )
+
+
+def _is_possible_idle_loop_jump(operation, parameters, address):
+    return operation == '1nnn' and parameters[0] in (address, address - 4)
+
+
+def _get_instruction_lines(operation, parameters, address):
+    if _is_possible_idle_loop_jump(operation, parameters, address):
+        # Chip8._1nnn detects idle loops, so it is not inlined
+        return _get_handler_call_lines(operation, parameters, address)
+    if operation in _INLINE_OPERATION_TEMPLATES:
+        templates = _INLINE_OPERATION_TEMPLATES[operation]
+    elif operation in _TERMINATOR_OPERATION_TEMPLATES:
+        templates = _TERMINATOR_OPERATION_TEMPLATES[operation]
+    else:
+        return _get_handler_call_lines(operation, parameters, address)
+
+    template_parameters = _get_template_parameters(operation, parameters,
+                                                   address)
+
+    return tuple(template.format(**template_parameters)
+                 for template in templates)
+
+
+def find_basic_block(program_memory, address_start):
+    instructions = []
+    address = address_start
+    last_address = len(program_memory) - 2
+
+    while address <= last_address \
+            and len(instructions) < MAX_BLOCK_INSTRUCTIONS:
+        opcode = (program_memory[address] << 8) | program_memory[address + 1]
+        operation, parameters = DECODE_TABLE[opcode]
+
+        if operation is None:
+            break
+
+        instructions.append((address, operation, parameters))
+        address += 2
+
+        if operation in BLOCK_TERMINATOR_OPERATIONS \
+                or operation in _PROGRAM_MEMORY_WRITER_OPERATIONS:
+            break
+
+    return instructions
+
+
+def generate_block_source(instructions, function_name):
+    lines = [line.format(name=function_name) for line in _BLOCK_PROLOGUE]
+
+    for address, operation, parameters in instructions:
+        for line in _get_instruction_lines(operation, parameters, address):
+            lines.append('    ' + line)
+
+    last_address, last_operation, _ = instructions[-1]
+
+    if last_operation not in BLOCK_TERMINATOR_OPERATIONS:
+        lines.append('    memory.program_counter = {}'.format(last_address + 2))
+
+    lines.append('    return {}'.format(len(instructions)))
+
+    return '\n'.join(lines) + '\n'
+
+
+def get_block_function_name(address_start):
+    return 'block_{:03x}'.format(address_start)
+
+
+def compile_block(program_memory, address_start):
+    instructions = find_basic_block(program_memory, address_start)
+
+    if not instructions:
+        return None, address_start + 2
+
+    function_name = get_block_function_name(address_start)
+    source = generate_block_source(instructions, function_name)
+    namespace = {'random': random}
+    exec(compile(source, '<chip8 {}>'.format(function_name), 'exec'), namespace)
+
+    last_address = instructions[-1][0]
+
+    return namespace[function_name], last_address + 2
+
+
+class BlockCache:
+
+    def __init__(self, memory):
+        self.memory = memory
+        self._blocks = {}
+        self.invalidations = 0
+        self.memory.add_program_memory_write_listener(self.invalidate)
+
+    def get_compiled_block(self, address):
+        compiled_block = self._blocks.get(address)
+
+        return None if compiled_block is None else compiled_block[0]
+
+    def get_block(self, address):
+        try:
+            return self._blocks[address][0]
+        except KeyError:
+            block, address_end = compile_block(self.memory.program_memory,
+                                               address)
+            self._blocks[address] = (block, address_end)
+
+            return block
+
+    def get_blocks(self):
+        return dict(self._blocks)
+
+    def add_blocks(self, blocks):
+        self._blocks.update(blocks)
+
+    def invalidate(self, address_start, address_end):
+        invalidated_addresses = [
+            block_address_start
+            for block_address_start, (_, block_address_end) in self._blocks.items()
+            if block_address_start < address_end
+            and address_start < block_address_end
+        ]
+
+        for block_address_start in invalidated_addresses:
+            del self._blocks[block_address_start]
+
+        self.invalidations += len(invalidated_addresses)
+
+    def clear(self):
+        self._blocks.clear()
@@ -1,17 +1,116 @@
+import importlib
+import math
 import random
-from .screen_proxy import ScreenProxy
-from .opcode_parser import parse_operation_and_parameters
+from collections import Counter
+from time import sleep
+from .opcode_parser import OPERATIONS
 from .memory import Memory
 from .delay_timer_thread import DelayTimerThread
+from .exceptions import InvalidOpcodeError
+from .tiered_execution import TieredExecutor
+from .superinstructions import FUSED_OPERATIONS
+from . import save_state
+from .rewind import RewindBuffer
+from .rom_image import get_rom_image
+from .memory_profiler import MemoryProfiler
+from .watchdog import Watchdog
+
+# Module and class of each engine, imported only once it is chosen, so that
+# numpy is not imported unless the NumPy engine is used
+SCREEN_ENGINES = {
+    'python': ('.screen_proxy', 'ScreenProxy'),
+    'numpy': ('.numpy_screen_proxy', 'NumpyScreenProxy'),
+}
+
+
+def _get_screen_proxy_class(screen_engine):
+    module_name, class_name = SCREEN_ENGINES[screen_engine]
+
+    return getattr(importlib.import_module(module_name, __package__),
+                   class_name)
 
 
 class Chip8:
 
-    def __init__(self, screen, keyboard):
+    __slots__ = (
+        'headless', 'memory', 'screen_proxy', 'keyboard', 'delay_timer_thread',
+        'count_fused_operations', 'fusion_counts', '_operations',
+        'code_cache_directory', 'tiered_executor', 'rewind_buffer',
+        'memory_profiler',
+    )
+
+    _IDLE_SLEEP_SECONDS = 1 / 60
+
+    def __init__(self, screen, keyboard, hotness_threshold=None,
+                 code_cache_directory=None, headless=False,
+                 rewind_memory_limit=None, profile_memory=False,
+                 screen_engine='python', count_fused_operations=False):
+        self.headless = headless
         self.memory = Memory()
-        self.screen_proxy = ScreenProxy(screen)
+        self.screen_proxy = _get_screen_proxy_class(screen_engine)(screen)
         self.keyboard = keyboard
         self.delay_timer_thread = DelayTimerThread(self.memory)
+        self.count_fused_operations = count_fused_operations
+        self.fusion_counts = Counter()
+        self._operations = self._get_operations()
+        self.code_cache_directory = code_cache_directory
+        self.tiered_executor = None
+        self.rewind_buffer = None
+        self.memory_profiler = None
+
+        if hotness_threshold is not None:
+            self.tiered_executor = TieredExecutor(self, hotness_threshold)
+
+        if rewind_memory_limit is not None:
+            self.rewind_buffer = RewindBuffer(self, rewind_memory_limit)
+
+        if profile_memory:
+            self.memory_profiler = MemoryProfiler(self)
+            self.memory_profiler.enable()
+
+    def _get_operations(self):
+        operations = {
+            operation: getattr(self, '_' + operation)
+            for operation in OPERATIONS + tuple(FUSED_OPERATIONS.values())
+        }
+
+        if self.count_fused_operations:
+            # Opt-in, counting would slow down every fused operation
+            for fused_operation in FUSED_OPERATIONS.values():
+                operations[fused_operation] = self._get_counting_operation(
+                    fused_operation, operations[fused_operation])
+
+        return operations
+
+    def get_operation_handler(self, operation):
+        return self._operations[operation]
+
+    def set_operation_handler(self, operation, handler):
+        # Lets tools such as the memory profiler wrap an operation
+        self._operations[operation] = handler
+
+    def fork(self, screen=None, keyboard=None):
+        # Program memory is only 4 KiB, so it is copied unless it still
+        # shares a ROM image, and the framebuffer is 32 integer rows
+        forked_chip8 = Chip8.__new__(Chip8)
+        forked_chip8.headless = self.headless
+        forked_chip8.memory = self.memory.fork()
+        forked_chip8.screen_proxy = self.screen_proxy.fork(screen)
+        forked_chip8.keyboard = self.keyboard if keyboard is None else keyboard
+        forked_chip8.delay_timer_thread = DelayTimerThread(forked_chip8.memory)
+        forked_chip8.count_fused_operations = self.count_fused_operations
+        forked_chip8.fusion_counts = Counter()
+        forked_chip8._operations = forked_chip8._get_operations()
+        forked_chip8.code_cache_directory = self.code_cache_directory
+        forked_chip8.tiered_executor = None
+        forked_chip8.rewind_buffer = None
+        forked_chip8.memory_profiler = None
+
+        if self.tiered_executor is not None:
+            forked_chip8.tiered_executor = \
+                self.tiered_executor.fork(forked_chip8)
+
+        return forked_chip8
 
     def _00e0(self):
         self.screen_proxy.clear_screen()
@@ -23,6 +122,13 @@ class Chip8:
         self.memory.increment_program_counter()
 
     def _1nnn(self, address):
+        jump_address = self.memory.program_counter
+
+        if address == jump_address:
+            self._idle(0)
+        elif address == jump_address - 4:
+            self._detect_delay_timer_polling(address)
+
         self.memory.program_counter = address
 
     def _2nnn(self, address):
@@ -116,7 +222,7 @@ class Chip8:
     def _8xye(self, vx_index):
         vx_value = self.memory.v_registers[vx_index]
         vx_last_bit = vx_value & 0x01
-        left_shifted_vx_value = vx_value << 1
+        left_shifted_vx_value = (vx_value << 1) & 0xFF
         self.memory.v_registers[vx_index] = left_shifted_vx_value
         self.memory.v_registers[0xF] = vx_last_bit
 
@@ -142,9 +248,7 @@ class Chip8:
     def _dxyn(self, vx_index, vy_index, sprite_height):
         x_coordinate = self.memory.v_registers[vx_index]
         y_coordinate = self.memory.v_registers[vy_index]
-        sprite_address_start = self.memory.i_register
-        sprite_address_end = sprite_address_start + sprite_height
-        sprite = self.memory.program_memory[sprite_address_start:sprite_address_end]
+        sprite = self.memory.read_bytes(self.memory.i_register, sprite_height)
         self.screen_proxy.draw_sprite(sprite, x_coordinate, y_coordinate)
         self.memory.v_registers[0xF] = self.screen_proxy.collision
         self.memory.increment_program_counter()
@@ -166,6 +270,8 @@ class Chip8:
         self.memory.increment_program_counter()
 
     def _fx0a(self, vx_index):
+        # Whatever was drawn must be visible while the program waits
+        self.screen_proxy.present()
         key = self.keyboard.wait_for_key()
         self.memory.v_registers[vx_index] = key
         self.memory.increment_program_counter()
@@ -189,62 +295,132 @@ class Chip8:
         self.memory.increment_program_counter()
 
     def _fx33(self, vx_index):
-        vx_value = '{:03}'.format(self.memory.v_registers[vx_index])
-        vx_value_digits = [int(digit) for digit in str(vx_value)]
-        addresses = self.memory.get_addresses_from_i_register_to_offset(3)
-
-        for address in addresses:
-            self.memory.program_memory[address] = vx_value_digits.pop(0)
-
+        vx_value = self.memory.v_registers[vx_index]
+        vx_value_digits = (vx_value // 100, vx_value // 10 % 10, vx_value % 10)
+        self.memory.write_bytes(self.memory.i_register, vx_value_digits)
         self.memory.increment_program_counter()
 
     def _fx55(self, vx_index):
-        addresses = self.memory.get_addresses_from_i_register_to_offset(
-            vx_index + 1)
-        v_register_values = self.memory.v_registers[:vx_index + 1]
-
-        for address in addresses:
-            self.memory.program_memory[address] = v_register_values.pop(0)
-
+        self.memory.write_bytes(self.memory.i_register,
+                                self.memory.v_registers[:vx_index + 1])
         self.memory.increment_program_counter()
 
     def _fx65(self, vx_index):
-        addresses = self.memory.get_addresses_from_i_register_to_offset(
-            vx_index + 1)
-
-        for v_index in range(0, vx_index + 1):
-            address = addresses.pop(0)
-            self.memory.v_registers[v_index] = self.memory.program_memory[address]
-
+        memoryview(self.memory.v_registers)[:vx_index + 1] = \
+            self.memory.read_bytes(self.memory.i_register, vx_index + 1)
         self.memory.increment_program_counter()
 
+    # Fused operations inline the bodies of the operations they replace, as
+    # calling the single operation handlers would cost the saved dispatches
+    def _6xkk_6xkk(self, first_v_index, first_value, second_v_index,
+                   second_value):
+        memory = self.memory
+        memory.v_registers[first_v_index] = first_value
+        memory.v_registers[second_v_index] = second_value
+        memory.program_counter += 4
+
+    def _6xkk_exa1(self, v_index, value, vx_index):
+        memory = self.memory
+        memory.v_registers[v_index] = value
+        memory.program_counter += 4
+
+        if memory.v_registers[vx_index] != self.keyboard.get_pressed_key():
+            memory.program_counter += 2
+
+    def _6xkk_8xy2(self, v_index, value, vx_index, vy_index):
+        v_registers = self.memory.v_registers
+        v_registers[v_index] = value
+        v_registers[vx_index] &= v_registers[vy_index]
+        self.memory.program_counter += 4
+
+    def _annn_dxyn(self, value, vx_index, vy_index, sprite_height):
+        memory = self.memory
+        memory.i_register = value
+        memory.program_counter += 2
+        sprite = memory.read_bytes(value, sprite_height)
+        self.screen_proxy.draw_sprite(sprite, memory.v_registers[vx_index],
+                                      memory.v_registers[vy_index])
+        memory.v_registers[0xF] = self.screen_proxy.collision
+        memory.program_counter += 2
+
+    def _7xkk_3xkk(self, add_v_index, add_value, v_index, instruction):
+        memory = self.memory
+        v_registers = memory.v_registers
+        v_registers[add_v_index] = (v_registers[add_v_index] + add_value) & 0xFF
+
+        if v_registers[v_index] == instruction:
+            memory.program_counter += 6
+        else:
+            memory.program_counter += 4
+
+    def _3xkk_1nnn(self, v_index, instruction, address):
+        memory = self.memory
+
+        if memory.v_registers[v_index] == instruction:
+            memory.program_counter += 4
+            return
+
+        jump_address = memory.program_counter + 2
+
+        if address == jump_address:
+            self._idle(0)
+        elif address == jump_address - 4:
+            self._detect_delay_timer_polling(address)
+
+        memory.program_counter = address
+
+    def _fx07_3xkk_1nnn(self, timer_v_index, v_index, instruction, address):
+        memory = self.memory
+        memory.set_v_value_to_delay_timer(timer_v_index)
+
+        if memory.v_registers[v_index] == instruction:
+            memory.program_counter += 6
+            return
+
+        jump_address = memory.program_counter + 4
+
+        if address == jump_address:
+            self._idle(0)
+        elif address == jump_address - 4 and timer_v_index == v_index:
+            # Polling the delay timer, as seen by _detect_delay_timer_polling
+            self._idle(instruction)
+
+        memory.program_counter = address
+
+    def _get_counting_operation(self, fused_operation, operation_function):
+        fusion_counts = self.fusion_counts
+
+        def counting_operation(*parameters):
+            fusion_counts[fused_operation] += 1
+            operation_function(*parameters)
+
+        return counting_operation
+
+    def _idle(self, delay_timer_value):
+        if self.headless:
+            self.memory.fast_forward_timers(delay_timer_value)
+        else:
+            sleep(self._IDLE_SLEEP_SECONDS)
+
+    def _detect_delay_timer_polling(self, loop_address):
+        # Fx07; 3xkk; 1nnn back to Fx07 waits for the delay timer to be kk
+        read_timer_operation, read_timer_parameters = \
+            self.memory.decode_opcode(loop_address)
+        compare_operation, compare_parameters = \
+            self.memory.decode_opcode(loop_address + 2)
+
+        if read_timer_operation == 'fx07' and compare_operation == '3xkk' \
+                and read_timer_parameters[0] == compare_parameters[0]:
+            self._idle(compare_parameters[1])
+
     def _execute_operation(self, operation, parameters):
-        # @TODO: refactor operation calling
-        operation_name_in_class = '_' + operation
-        operation_function = getattr(self, operation_name_in_class)
-        if operation_name_in_class.startswith('_00'):
-            operation_function()
-        elif operation_name_in_class.startswith('_0') \
-                or operation_name_in_class.startswith('_1') \
-                or operation_name_in_class.startswith('_2') \
-                or operation_name_in_class.startswith('_a') \
-                or operation_name_in_class.startswith('_b') \
-                or operation_name_in_class.startswith('_e') \
-                or operation_name_in_class.startswith('_f') \
-                or operation_name_in_class.startswith('_8xy6') \
-                or operation_name_in_class.startswith('_8xye'):
-            operation_function(parameters[0])
-        elif operation_name_in_class.startswith('_3') \
-                or operation_name_in_class.startswith('_4') \
-                or operation_name_in_class.startswith('_5') \
-                or operation_name_in_class.startswith('_6') \
-                or operation_name_in_class.startswith('_7') \
-                or operation_name_in_class.startswith('_8') \
-                or operation_name_in_class.startswith('_9') \
-                or operation_name_in_class.startswith('_c'):
-            operation_function(parameters[0], parameters[1])
-        elif operation_name_in_class.startswith('_d'):
-            operation_function(parameters[0], parameters[1], parameters[2])
+        try:
+            operation_function = self._operations[operation]
+        except KeyError:
+            raise InvalidOpcodeError(self.memory.get_current_opcode_int(),
+                                     self.memory.program_counter) from None
+
+        operation_function(*parameters)
 
     def _get_rom_bytes(self, rom_path):
         with open(rom_path, 'rb') as rom_handle:
@@ -252,19 +428,118 @@ class Chip8:
 
         return rom_bytes
 
+    def _load_compiled_blocks(self, rom_image):
+        compiled_blocks = rom_image.get_compiled_blocks(
+            self.code_cache_directory)
+
+        if compiled_blocks is None:
+            return
+
+        if self.tiered_executor is None:
+            # Only the precompiled blocks run compiled, the rest is interpreted
+            self.tiered_executor = TieredExecutor(self, math.inf)
+
+        self.tiered_executor.block_cache.add_blocks(compiled_blocks)
+
+    def _check_rom_analysis(self):
+        invalid_instructions = self.memory.rom_analysis.invalid_instructions
+
+        if invalid_instructions:
+            address, opcode = min(invalid_instructions)
+            raise InvalidOpcodeError(opcode, address)
+
+    def save_state(self, state_path):
+        save_state.save_state(self, state_path)
+
+    def load_state(self, state_path):
+        save_state.load_state(self, state_path)
+
+    def _load_rom(self, rom_bytes):
+        rom_image = get_rom_image(rom_bytes, self.memory.fusion_enabled)
+        self.memory.load_rom_image(rom_image)
+        self._check_rom_analysis()
+        self._load_compiled_blocks(rom_image)
+
+        if self.memory_profiler is not None:
+            # Loading the ROM is not an access made by the program
+            self.memory_profiler.clear()
+
+    def reset(self, rom_bytes=None):
+        # Loading a ROM replaces the whole program memory anyway
+        self.memory.reset(clear_program_memory=rom_bytes is None)
+        self.screen_proxy.reset()
+        self.keyboard.pressed_key = None
+        self.fusion_counts.clear()
+
+        if self.tiered_executor is not None:
+            self.tiered_executor.reset()
+
+        if self.rewind_buffer is not None:
+            self.rewind_buffer.clear()
+
+        if self.memory_profiler is not None:
+            self.memory_profiler.clear()
+
+        if rom_bytes is not None:
+            self._load_rom(rom_bytes)
+
+    def run_batch(self, rom_bytes, max_instructions=None, max_seconds=None):
+        # Unlike main, always returns, with the reason why the ROM stopped
+        watchdog = Watchdog(self, max_instructions, max_seconds)
+
+        return watchdog.run(rom_bytes)
+
+    def stop(self):
+        self.delay_timer_thread.stop()
+
     def _initialize(self, rom_path):
-        self.memory.load_rom(self._get_rom_bytes(rom_path))
+        self._load_rom(self._get_rom_bytes(rom_path))
         self.screen_proxy.init_screen()
         self.delay_timer_thread.start()
 
-    def _mainloop(self):
-        opcode = self.memory.get_current_opcode()
-        operation, parameters = parse_operation_and_parameters(opcode)
+    def step(self):
+        operation, parameters = self.memory.get_current_instruction()
         self._execute_operation(operation, parameters)
         self.keyboard.listen()
 
+    def _get_rewinding_step(self, step):
+        def rewinding_step():
+            step()
+            self.rewind_buffer.capture_if_new_frame()
+
+        return rewinding_step
+
+    def _get_presenting_step(self, step):
+        # The screen is presented once per 60 Hz frame, not after every draw
+        delay_timer_thread = self.delay_timer_thread
+        screen_proxy = self.screen_proxy
+        presented_frame_count = delay_timer_thread.frame_count
+
+        def presenting_step():
+            nonlocal presented_frame_count
+            step()
+
+            if delay_timer_thread.frame_count != presented_frame_count:
+                presented_frame_count = delay_timer_thread.frame_count
+                screen_proxy.present()
+
+        return presenting_step
+
     def main(self, rom_path):
         self._initialize(rom_path)
+        step = self.step
+
+        if self.tiered_executor is not None:
+            step = self.tiered_executor.step
+
+        if self.memory_profiler is not None:
+            # Compiled blocks don't fetch their instructions one by one
+            step = self.memory_profiler.step
+
+        if self.rewind_buffer is not None:
+            step = self._get_rewinding_step(step)
+
+        step = self._get_presenting_step(step)
 
         while True:
-            self._mainloop()
+            step()
@@ -1,5 +1,4 @@
-from threading import Thread
-from time import sleep
+from threading import Event, Thread
 
 
 class DelayTimerThread(Thread):
@@ -7,10 +6,18 @@ class DelayTimerThread(Thread):
     _FREQUENCY_HZ = 60
 
     def __init__(self, memory):
-        Thread.__init__(self)
+        Thread.__init__(self, daemon=True)
         self.memory = memory
+        self.frame_count = 0
+        self._stop_event = Event()
 
     def run(self):
-        while True:
+        while not self._stop_event.wait(1 / self._FREQUENCY_HZ):
             self.memory.decrement_delay_timer()
-            sleep(1 / self._FREQUENCY_HZ)
+            self.frame_count += 1
+
+    def stop(self):
+        self._stop_event.set()
+
+        if self.is_alive():
+            self.join()
@@ -0,0 +1,57 @@
+class InvalidOpcodeError(Exception):
+
+    def __init__(self, opcode, address):
+        super().__init__(
+            'Invalid opcode 0x{:04X} at address 0x{:03X}'.format(opcode, address)
+        )
+        self.opcode = opcode
+        self.address = address
+
+
+class MemoryAccessError(Exception):
+
+    def __init__(self, address, length):
+        super().__init__(
+            'Memory access of {} bytes at address 0x{:03X} is out of bounds'
+            .format(length, address)
+        )
+        self.address = address
+        self.length = length
+
+
+class StackOverflowError(Exception):
+
+    def __init__(self, address):
+        super().__init__(
+            'Stack overflow calling a subroutine at address 0x{:03X}'
+            .format(address)
+        )
+        self.address = address
+
+
+class StackUnderflowError(Exception):
+
+    def __init__(self, address):
+        super().__init__(
+            'Stack underflow returning from a subroutine at address 0x{:03X}'
+            .format(address)
+        )
+        self.address = address
+
+
+class InvalidDigitSpriteError(Exception):
+
+    def __init__(self, digit, address):
+        super().__init__(
+            'No digit sprite for value 0x{:02X} at address 0x{:03X}'
+            .format(digit, address)
+        )
+        self.digit = digit
+        self.address = address
+
+
+class InvalidSaveStateError(Exception):
+
+    def __init__(self, reason):
+        super().__init__('Invalid save state: {}'.format(reason))
+        self.reason = reason
@@ -1,12 +1,33 @@
+from array import array
 from threading import Lock
+from .opcode_parser import DECODE_TABLE
+from .superinstructions import MAX_FUSED_OPERATIONS, fuse_instructions
+from .rom_analyzer import analyze_program_memory
+from .watchpoint import Watchpoint
+from .exceptions import (InvalidDigitSpriteError, MemoryAccessError,
+                         StackOverflowError, StackUnderflowError)
 
 
 class Memory:
 
+    __slots__ = (
+        'fusion_enabled', 'program_memory', 'decoded_instructions',
+        '_program_memory_write_listeners', '_program_write_listeners',
+        'rom_analysis', 'stack',
+        'stack_pointer', 'v_registers', 'i_register', 'program_counter',
+        '_delay_timer', '_delay_timer_mutex', '_sound_timer',
+        '_sound_timer_mutex', '_shares_rom_image', 'dirty_pages',
+        '_watchpoints',
+    )
+
     PROGRAM_COUNTER_START = 0x200
-    PROGRAM_MEMORY_LENGTH = 0xE9F
-    STACK_LENGTH_BYTES = 48
+    PROGRAM_MEMORY_LENGTH = 0x1000
+    PAGE_LENGTH_BYTES = 0x100
+    STACK_DEPTH = 16
     V_REGISTERS_LENGTH_BYTES = 16
+    _EMPTY_PROGRAM_MEMORY = bytes(PROGRAM_MEMORY_LENGTH)
+    _EMPTY_STACK = array('H', [0x000] * STACK_DEPTH)
+    _EMPTY_V_REGISTERS = array('B', bytes(V_REGISTERS_LENGTH_BYTES))
     PRELOADED_SPRITES = {
         0x000: (0xF0, 0x90, 0x90, 0x90, 0xF0),  # 0
         0x005: (0x20, 0x60, 0x20, 0x20, 0x70),  # 1
@@ -25,19 +46,76 @@ class Memory:
         0x046: (0xF0, 0x80, 0xF0, 0x80, 0xF0),  # E
         0x04B: (0xF0, 0x80, 0xF0, 0x80, 0x80),  # F
     }
+    _PRELOADED_SPRITE_ADDRESSES = tuple(PRELOADED_SPRITES)
 
-    def __init__(self):
-        self.program_memory = [0x00] * self.PROGRAM_MEMORY_LENGTH
-        self.stack = []
-        self.v_registers = [0x00] * self.V_REGISTERS_LENGTH_BYTES
-        self.i_register = None
+    def __init__(self, fusion_enabled=True):
+        self.fusion_enabled = fusion_enabled
+        self.program_memory = bytearray(self.PROGRAM_MEMORY_LENGTH)
+        self.decoded_instructions = [None] * self.PROGRAM_MEMORY_LENGTH
+        self._program_memory_write_listeners = []
+        self._program_write_listeners = []
+        self.rom_analysis = None
+        self.stack = array('H', [0x000] * self.STACK_DEPTH)
+        self.stack_pointer = 0
+        self.v_registers = array('B', bytes(self.V_REGISTERS_LENGTH_BYTES))
+        self.i_register = 0x000
         self.program_counter = self.PROGRAM_COUNTER_START
         self._delay_timer = 0
         self._delay_timer_mutex = Lock()
         self._sound_timer = 0
         self._sound_timer_mutex = Lock()
+        self._shares_rom_image = False
+        self.dirty_pages = 0
+        self._watchpoints = []
         self._load_digit_sprites()
 
+    def reset(self, clear_program_memory=True):
+        # Callers loading a ROM image next skip clearing, which would copy
+        # a shared image only to throw it away
+        if clear_program_memory:
+            self._get_writable_program_memory()[:] = self._EMPTY_PROGRAM_MEMORY
+            self._load_digit_sprites()
+            # Sent once the font is back, so that listeners see final bytes
+            self.notify_program_memory_write(0, len(self.program_memory),
+                                             is_program_write=False)
+
+        self.rom_analysis = None
+        self.stack[:] = self._EMPTY_STACK
+        self.stack_pointer = 0
+        self.v_registers[:] = self._EMPTY_V_REGISTERS
+        self.i_register = 0x000
+        self.program_counter = self.PROGRAM_COUNTER_START
+        self.set_timers(0, 0)
+
+    def fork(self):
+        forked_memory = Memory.__new__(Memory)
+        forked_memory.fusion_enabled = self.fusion_enabled
+        forked_memory._shares_rom_image = self._shares_rom_image
+        forked_memory.dirty_pages = self.dirty_pages
+        forked_memory._watchpoints = []
+
+        if self._shares_rom_image:
+            forked_memory.program_memory = self.program_memory
+            forked_memory.decoded_instructions = self.decoded_instructions
+        else:
+            forked_memory.program_memory = bytearray(self.program_memory)
+            forked_memory.decoded_instructions = list(self.decoded_instructions)
+
+        forked_memory._program_memory_write_listeners = []
+        forked_memory._program_write_listeners = []
+        forked_memory.rom_analysis = self.rom_analysis
+        forked_memory.stack = self.stack[:]
+        forked_memory.stack_pointer = self.stack_pointer
+        forked_memory.v_registers = self.v_registers[:]
+        forked_memory.i_register = self.i_register
+        forked_memory.program_counter = self.program_counter
+        forked_memory._delay_timer, forked_memory._sound_timer = \
+            self.get_timers()
+        forked_memory._delay_timer_mutex = Lock()
+        forked_memory._sound_timer_mutex = Lock()
+
+        return forked_memory
+
     def _load_digit_sprites(self):
         for memory_address_start, sprite in self.PRELOADED_SPRITES.items():
             sprite_size = len(sprite)
@@ -45,14 +123,28 @@ class Memory:
             self.program_memory[memory_address_start:memory_address_end] = sprite
 
     def get_address_of_preloaded_sprite(self, sprite_value):
-        sprites_addresses = list(self.PRELOADED_SPRITES)
-        return sprites_addresses[sprite_value]
+        if not 0 <= sprite_value < len(self._PRELOADED_SPRITE_ADDRESSES):
+            raise InvalidDigitSpriteError(sprite_value, self.program_counter)
+
+        return self._PRELOADED_SPRITE_ADDRESSES[sprite_value]
 
     def add_to_stack(self, memory_address):
-        self.stack.append(memory_address)
+        if self.stack_pointer == self.STACK_DEPTH:
+            raise StackOverflowError(self.program_counter)
+
+        self.stack[self.stack_pointer] = memory_address
+        self.stack_pointer += 1
 
     def pop_from_stack(self):
-        return self.stack.pop()
+        if self.stack_pointer == 0:
+            raise StackUnderflowError(self.program_counter)
+
+        self.stack_pointer -= 1
+
+        return self.stack[self.stack_pointer]
+
+    def get_stack_addresses(self):
+        return self.stack[:self.stack_pointer].tolist()
 
     def increment_program_counter(self):
         self.program_counter += 2
@@ -63,15 +155,172 @@ class Memory:
 
         return bytes([opcode_first_byte, opcode_last_byte])
 
-    def get_addresses_from_i_register_to_offset(self, offset):
-        return [self.i_register + index for index in range(0, offset)]
+    def get_current_opcode_int(self):
+        opcode_first_byte = self.program_memory[self.program_counter]
+        opcode_last_byte = self.program_memory[self.program_counter + 1]
+
+        return (opcode_first_byte << 8) | opcode_last_byte
+
+    def get_current_instruction(self):
+        instruction = self.decoded_instructions[self.program_counter]
+
+        if instruction is None:
+            instruction = self._decode_instruction(self.program_counter)
+
+        return instruction
+
+    def decode_opcode(self, address):
+        opcode = (self.program_memory[address] << 8) \
+            | self.program_memory[address + 1]
+
+        return DECODE_TABLE[opcode]
+
+    def _decode_instruction(self, address):
+        instruction = self.decode_opcode(address)
+
+        if self.fusion_enabled:
+            last_address = min(address + 2 * MAX_FUSED_OPERATIONS,
+                               len(self.program_memory)) - 1
+            instructions = (self.decode_opcode(instruction_address)
+                            for instruction_address
+                            in range(address, last_address, 2))
+            instruction = fuse_instructions(instructions) or instruction
+
+        self.decoded_instructions[address] = instruction
+
+        return instruction
+
+    def _decode_instructions(self, addresses):
+        for address in addresses:
+            self._decode_instruction(address)
+
+    def _get_writable_program_memory(self):
+        # A shared ROM image is copied the first time this instance writes
+        if self._shares_rom_image:
+            self.program_memory = bytearray(self.program_memory)
+            self.decoded_instructions = list(self.decoded_instructions)
+            self._shares_rom_image = False
+
+        return self.program_memory
+
+    def notify_program_memory_write(self, address_start, address_end,
+                                    is_program_write=True):
+        self._get_writable_program_memory()
+        # Words starting one byte before the written range also changed, and
+        # so did the fused instructions covering any of them
+        invalidated_address_start = max(
+            address_start - 2 * MAX_FUSED_OPERATIONS + 1, 0)
+        invalidated_length = address_end - invalidated_address_start
+        self.decoded_instructions[invalidated_address_start:address_end] = \
+            [None] * invalidated_length
+
+        self._notify_program_memory_write_listeners(address_start, address_end,
+                                                    is_program_write)
+
+    def _notify_program_memory_write_listeners(self, address_start,
+                                               address_end,
+                                               is_program_write=False):
+        first_page = address_start // self.PAGE_LENGTH_BYTES
+        last_page = (address_end - 1) // self.PAGE_LENGTH_BYTES
+        self.dirty_pages |= ((1 << (last_page + 1)) - 1) ^ ((1 << first_page) - 1)
+
+        for listener in self._program_memory_write_listeners:
+            listener(address_start, address_end)
+
+        # Loaded ROMs, resets and restored states are not written by the
+        # program, so they are only seen by listeners of every change
+        if is_program_write:
+            for listener in self._program_write_listeners:
+                listener(address_start, address_end)
+
+    def add_program_memory_write_listener(self, listener,
+                                          program_writes_only=False):
+        if program_writes_only:
+            self._program_write_listeners.append(listener)
+        else:
+            self._program_memory_write_listeners.append(listener)
+
+    def remove_program_memory_write_listener(self, listener):
+        if listener in self._program_write_listeners:
+            self._program_write_listeners.remove(listener)
+        else:
+            self._program_memory_write_listeners.remove(listener)
+
+    def get_dirty_pages(self):
+        return [page for page in range(len(self.program_memory)
+                                       // self.PAGE_LENGTH_BYTES)
+                if self.dirty_pages & (1 << page)]
+
+    def clear_dirty_pages(self):
+        self.dirty_pages = 0
+
+    def add_watchpoint(self, address_start, address_end, callback, value=None):
+        self._check_bounds(address_start, address_end - address_start)
+        watchpoint = Watchpoint(address_start, address_end, callback, value)
+
+        # The write listener is only installed while there are watchpoints.
+        # They fire on writes by the program, not on ROM loads, resets or
+        # restored states
+        if not self._watchpoints:
+            self.add_program_memory_write_listener(self._check_watchpoints,
+                                                   program_writes_only=True)
+
+        self._watchpoints.append(watchpoint)
+
+        return watchpoint
+
+    def remove_watchpoint(self, watchpoint):
+        self._watchpoints.remove(watchpoint)
+
+        if not self._watchpoints:
+            self.remove_program_memory_write_listener(self._check_watchpoints)
+
+    def _check_watchpoints(self, address_start, address_end):
+        for watchpoint in tuple(self._watchpoints):
+            watchpoint.check(self.program_memory, address_start, address_end)
+
+    def _check_bounds(self, address, length):
+        if address < 0 or address + length > len(self.program_memory):
+            raise MemoryAccessError(address, length)
+
+    def read_bytes(self, address, length):
+        self._check_bounds(address, length)
+
+        return memoryview(self.program_memory)[address:address + length]
+
+    def _store_bytes(self, address, data, is_program_write):
+        data_length = len(data)
+        self._check_bounds(address, data_length)
+        program_memory = self._get_writable_program_memory()
+        program_memory[address:address + data_length] = data
+        self.notify_program_memory_write(address, address + data_length,
+                                         is_program_write)
+
+    def write_bytes(self, address, data):
+        self._store_bytes(address, data, is_program_write=True)
+
+    def load_bytes(self, address, data):
+        # Like write_bytes, for data put in memory from outside the program,
+        # such as a restored state
+        self._store_bytes(address, data, is_program_write=False)
 
     def load_rom(self, rom_bytes):
-        memory_index = self.PROGRAM_COUNTER_START
+        rom_end = self.PROGRAM_COUNTER_START + len(rom_bytes)
+        self.load_bytes(self.PROGRAM_COUNTER_START, rom_bytes)
+
+        # Only reachable code is predecoded, anything else is decoded if run
+        self.rom_analysis = analyze_program_memory(
+            self.program_memory, self.PROGRAM_COUNTER_START, rom_end)
+        self._decode_instructions(self.rom_analysis.instructions)
 
-        for rom_byte in rom_bytes:
-            self.program_memory[memory_index] = rom_byte
-            memory_index += 1
+    def load_rom_image(self, rom_image):
+        # Memory and decoded instructions are shared until the first write;
+        # slots decoded lazily in the meantime are valid for every sharer
+        self.program_memory = rom_image.program_memory
+        self.decoded_instructions = rom_image.decoded_instructions
+        self._shares_rom_image = True
+        self.rom_analysis = rom_image.rom_analysis
+        self._notify_program_memory_write_listeners(0, len(self.program_memory))
 
     def decrement_delay_timer(self):
         self._delay_timer_mutex.acquire()
@@ -103,3 +352,29 @@ class Memory:
         self._sound_timer_mutex.acquire()
         self._sound_timer = self.v_registers[v_index]
         self._sound_timer_mutex.release()
+
+    def get_timers(self):
+        self._delay_timer_mutex.acquire()
+        self._sound_timer_mutex.acquire()
+        timers = (self._delay_timer, self._sound_timer)
+        self._sound_timer_mutex.release()
+        self._delay_timer_mutex.release()
+
+        return timers
+
+    def set_timers(self, delay_timer_value, sound_timer_value):
+        self._delay_timer_mutex.acquire()
+        self._sound_timer_mutex.acquire()
+        self._delay_timer = delay_timer_value
+        self._sound_timer = sound_timer_value
+        self._sound_timer_mutex.release()
+        self._delay_timer_mutex.release()
+
+    def fast_forward_timers(self, delay_timer_value):
+        self._delay_timer_mutex.acquire()
+        self._sound_timer_mutex.acquire()
+        elapsed_ticks = max(self._delay_timer - delay_timer_value, 0)
+        self._delay_timer -= elapsed_ticks
+        self._sound_timer = max(self._sound_timer - elapsed_ticks, 0)
+        self._sound_timer_mutex.release()
+        self._delay_timer_mutex.release()
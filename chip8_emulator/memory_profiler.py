@@ -0,0 +1,175 @@
+import json
+import math
+from array import array
+from .superinstructions import FUSED_OPERATION_LENGTHS
+
+HEATMAP_WIDTH = 64
+
+_HEATMAP_COLD_COLOR = (0x00, 0x00, 0x40)
+_HEATMAP_HOT_COLOR = (0xFF, 0xD0, 0x00)
+_HEATMAP_WRITE_COLOR = (0xFF, 0x30, 0x30)
+
+
+class MemoryProfiler:
+    # Counts are only gathered while enabled: the profiler wraps the Chip8
+    # operation handlers reading memory and listens for memory writes, so a
+    # machine that is not being profiled runs the usual handlers untouched
+
+    __slots__ = (
+        'chip8', 'fetch_counts', 'read_counts', 'write_counts', 'enabled',
+        '_original_operations',
+    )
+
+    def __init__(self, chip8):
+        self.chip8 = chip8
+        memory_length = len(chip8.memory.program_memory)
+        self.fetch_counts = array('L', [0]) * memory_length
+        self.read_counts = array('L', [0]) * memory_length
+        self.write_counts = array('L', [0]) * memory_length
+        self.enabled = False
+        self._original_operations = None
+
+    def enable(self):
+        if self.enabled:
+            return
+
+        counting_handler_getters = {
+            'dxyn': self._get_counting_dxyn,
+            'fx65': self._get_counting_fx65,
+            'annn_dxyn': self._get_counting_annn_dxyn,
+        }
+        self._original_operations = {}
+
+        for operation, get_counting_handler in counting_handler_getters.items():
+            handler = self.chip8.get_operation_handler(operation)
+            self._original_operations[operation] = handler
+            self.chip8.set_operation_handler(operation,
+                                             get_counting_handler(handler))
+
+        # Loads, resets and restored states rewrite memory without being
+        # accesses by the program
+        self.chip8.memory.add_program_memory_write_listener(
+            self._count_write, program_writes_only=True)
+        self.enabled = True
+
+    def disable(self):
+        if not self.enabled:
+            return
+
+        for operation, handler in self._original_operations.items():
+            self.chip8.set_operation_handler(operation, handler)
+
+        self._original_operations = None
+        self.chip8.memory.remove_program_memory_write_listener(self._count_write)
+        self.enabled = False
+
+    def clear(self):
+        for counts in (self.fetch_counts, self.read_counts, self.write_counts):
+            counts[:] = array('L', [0]) * len(counts)
+
+    def _count_range(self, counts, address_start, length):
+        # Out of bounds accesses are left to Memory to report
+        for address in range(address_start,
+                             min(address_start + length, len(counts))):
+            counts[address] += 1
+
+    def _count_write(self, address_start, address_end):
+        self._count_range(self.write_counts, address_start,
+                          address_end - address_start)
+
+    def _get_counting_dxyn(self, dxyn):
+        def counting_dxyn(vx_index, vy_index, sprite_height):
+            self._count_range(self.read_counts, self.chip8.memory.i_register,
+                              sprite_height)
+            dxyn(vx_index, vy_index, sprite_height)
+
+        return counting_dxyn
+
+    def _get_counting_fx65(self, fx65):
+        def counting_fx65(vx_index):
+            self._count_range(self.read_counts, self.chip8.memory.i_register,
+                              vx_index + 1)
+            fx65(vx_index)
+
+        return counting_fx65
+
+    def _get_counting_annn_dxyn(self, annn_dxyn):
+        def counting_annn_dxyn(value, vx_index, vy_index, sprite_height):
+            self._count_range(self.read_counts, value, sprite_height)
+            annn_dxyn(value, vx_index, vy_index, sprite_height)
+
+        return counting_annn_dxyn
+
+    def step(self):
+        # Instructions are interpreted one by one so that every fetch is seen
+        memory = self.chip8.memory
+        operation, _ = memory.get_current_instruction()
+        instruction_length = 2 * FUSED_OPERATION_LENGTHS.get(operation, 1)
+        self._count_range(self.fetch_counts, memory.program_counter,
+                          instruction_length)
+        self.chip8.step()
+
+    def get_access_counts(self):
+        return array('L', (fetch_count + read_count + write_count
+                           for fetch_count, read_count, write_count
+                           in zip(self.fetch_counts, self.read_counts,
+                                  self.write_counts)))
+
+    def get_report(self):
+        addresses = []
+
+        for address, (fetch_count, read_count, write_count) in enumerate(
+                zip(self.fetch_counts, self.read_counts, self.write_counts)):
+            if fetch_count or read_count or write_count:
+                addresses.append({
+                    'address': address,
+                    'fetches': fetch_count,
+                    'reads': read_count,
+                    'writes': write_count,
+                })
+
+        return {
+            'fetches': sum(self.fetch_counts),
+            'reads': sum(self.read_counts),
+            'writes': sum(self.write_counts),
+            'addresses': addresses,
+        }
+
+    def save_report(self, report_path):
+        with open(report_path, 'w') as report_handle:
+            json.dump(self.get_report(), report_handle, indent=2)
+
+    def save_heatmap(self, image_path, scale=8):
+        import pygame
+
+        access_counts = self.get_access_counts()
+        max_access_count = max(access_counts)
+        heatmap_height = len(access_counts) // HEATMAP_WIDTH
+        heatmap = pygame.Surface((HEATMAP_WIDTH, heatmap_height))
+        heatmap.fill(_HEATMAP_COLD_COLOR)
+
+        for address, access_count in enumerate(access_counts):
+            if not access_count:
+                continue
+
+            if self.write_counts[address]:
+                color = _HEATMAP_WRITE_COLOR
+            else:
+                color = _get_heat_color(access_count, max_access_count)
+
+            heatmap.set_at((address % HEATMAP_WIDTH, address // HEATMAP_WIDTH),
+                           color)
+
+        heatmap = pygame.transform.scale(
+            heatmap, (HEATMAP_WIDTH * scale, heatmap_height * scale))
+        pygame.image.save(heatmap, image_path)
+
+
+def _get_heat_color(access_count, max_access_count):
+    # Logarithmic, the hottest loops are executed orders of magnitude more
+    heat = math.log1p(access_count) / math.log1p(max_access_count)
+
+    return tuple(
+        round(cold + (hot - cold) * heat)
+        for cold, hot in zip(_HEATMAP_COLD_COLOR, _HEATMAP_HOT_COLOR)
+    )
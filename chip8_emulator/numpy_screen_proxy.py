@@ -0,0 +1,126 @@
+from functools import lru_cache
+from .screen_proxy import SPRITE_CACHE_SIZE, BaseScreenProxy
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_SPRITE_WIDTH_BITS = 8
+
+
+@lru_cache(maxsize=SPRITE_CACHE_SIZE)
+def _get_sprite_pixels(sprite_bytes):
+    # Unpacked once per sprite, along with the (row, bit) of its lit pixels
+    sprite_pixels = numpy.unpackbits(
+        numpy.frombuffer(sprite_bytes, dtype=numpy.uint8)
+    ).reshape(-1, _SPRITE_WIDTH_BITS)
+    sprite_pixels.flags.writeable = False
+    lit_pixels = tuple(zip(*(indices.tolist()
+                             for indices in numpy.nonzero(sprite_pixels))))
+
+    return sprite_pixels, lit_pixels
+
+
+@lru_cache(maxsize=SPRITE_CACHE_SIZE)
+def _get_wrapped_region_index(x_coordinate, y_coordinate, sprite_height):
+    rows = (y_coordinate + numpy.arange(sprite_height)) \
+        % BaseScreenProxy.LOGICAL_HEIGHT
+    columns = (x_coordinate + numpy.arange(_SPRITE_WIDTH_BITS)) \
+        % BaseScreenProxy.LOGICAL_WIDTH
+
+    return numpy.ix_(rows, columns)
+
+
+class NumpyScreenProxy(BaseScreenProxy):
+    # Same interface as ScreenProxy, with the framebuffer stored as a 32x64
+    # uint8 array of 0 and 1, so that it can be handed to NumPy code as is
+
+    __slots__ = ('_pixels',)
+
+    def __init__(self, screen):
+        if numpy is None:
+            raise ImportError('NumpyScreenProxy requires numpy')
+
+        super().__init__(screen)
+        self._pixels = numpy.zeros((self.LOGICAL_HEIGHT, self.LOGICAL_WIDTH),
+                                   dtype=numpy.uint8)
+
+    def _clear_pixels(self):
+        self._pixels.fill(0)
+
+    def _fork_pixels(self, forked_screen_proxy):
+        forked_screen_proxy._pixels = self._pixels.copy()
+
+    def get_framebuffer_array(self):
+        # Zero-copy view, read-only so that consumers can't draw behind the
+        # screen's back
+        framebuffer_array = self._pixels.view()
+        framebuffer_array.flags.writeable = False
+
+        return framebuffer_array
+
+    def get_logical_row(self, logical_row_index):
+        return int.from_bytes(
+            numpy.packbits(self._pixels[logical_row_index]).tobytes(), 'big')
+
+    def get_logical_rows(self):
+        return tuple(int.from_bytes(row_bytes.tobytes(), 'big')
+                     for row_bytes in numpy.packbits(self._pixels, axis=1))
+
+    def _refresh_sprite_pixels(self, region, lit_pixels, x_coordinate,
+                               y_coordinate):
+        region_rows = region.tolist()
+
+        # Only the pixels under the sprite can have changed
+        for row_offset, bit in lit_pixels:
+            row = (y_coordinate + row_offset) % self.LOGICAL_HEIGHT
+            column = (x_coordinate + bit) % self.LOGICAL_WIDTH
+
+            if region_rows[row_offset][bit]:
+                self.screen.draw_pixel(column, row)
+            else:
+                self.screen.clear_pixel(column, row)
+
+    def draw_sprite(self, sprite, x_coordinate, y_coordinate):
+        x_coordinate %= self.LOGICAL_WIDTH
+        y_coordinate %= self.LOGICAL_HEIGHT
+        sprite_pixels, lit_pixels = _get_sprite_pixels(bytes(sprite))
+        sprite_height = len(sprite_pixels)
+        row_end = y_coordinate + sprite_height
+        column_end = x_coordinate + _SPRITE_WIDTH_BITS
+
+        if row_end <= self.LOGICAL_HEIGHT and column_end <= self.LOGICAL_WIDTH:
+            # A plain slice is a view, so the XOR is done in place
+            region = self._pixels[y_coordinate:row_end,
+                                  x_coordinate:column_end]
+            self.collision = bool((region & sprite_pixels).any())
+            region ^= sprite_pixels
+        else:
+            # Sprites wrap around, so the region is indexed rather than sliced
+            # and written back
+            region_index = _get_wrapped_region_index(
+                x_coordinate, y_coordinate, sprite_height)
+            region = self._pixels[region_index]
+            self.collision = bool((region & sprite_pixels).any())
+            region ^= sprite_pixels
+            self._pixels[region_index] = region
+
+        self._refresh_sprite_pixels(region, lit_pixels, x_coordinate,
+                                    y_coordinate)
+        self.dirty_rectangles.add_sprite(x_coordinate, y_coordinate,
+                                         sprite_height)
+
+    def get_framebuffer(self):
+        return numpy.packbits(self._pixels).tobytes()
+
+    def set_framebuffer(self, framebuffer):
+        self.clear_screen()
+        self._pixels[:] = numpy.unpackbits(
+            numpy.frombuffer(bytes(framebuffer), dtype=numpy.uint8)
+        ).reshape(self.LOGICAL_HEIGHT, self.LOGICAL_WIDTH)
+        rows, columns = numpy.nonzero(self._pixels)
+
+        # Only lit pixels are drawn, the screen has just been cleared
+        for row, column in zip(rows.tolist(), columns.tolist()):
+            self.screen.draw_pixel(column, row)
@@ -102,3 +102,93 @@ def parse_operation_and_parameters(opcode):
     operation, parameters = parse_function(opcode)
 
     return operation, parameters
+
+
+OPERATIONS_WITHOUT_PARAMETERS = {
+    0x00E0: '00e0',
+    0x00EE: '00ee',
+}
+NNN_OPERATIONS_PER_PREFIX = {
+    0x1: '1nnn',
+    0x2: '2nnn',
+    0xA: 'annn',
+    0xB: 'bnnn',
+}
+XKK_OPERATIONS_PER_PREFIX = {
+    0x3: '3xkk',
+    0x4: '4xkk',
+    0x6: '6xkk',
+    0x7: '7xkk',
+    0xC: 'cxkk',
+}
+XY_OPERATIONS_PER_PREFIX_AND_SUFFIX = {
+    (0x5, 0x0): '5xy0',
+    (0x8, 0x0): '8xy0',
+    (0x8, 0x1): '8xy1',
+    (0x8, 0x2): '8xy2',
+    (0x8, 0x3): '8xy3',
+    (0x8, 0x4): '8xy4',
+    (0x8, 0x5): '8xy5',
+    (0x8, 0x7): '8xy7',
+    (0x9, 0x0): '9xy0',
+}
+X_OPERATIONS_PER_PREFIX_AND_SUFFIX = {
+    (0x8, 0x06): '8xy6',
+    (0x8, 0x0E): '8xye',
+    (0xE, 0x9E): 'ex9e',
+    (0xE, 0xA1): 'exa1',
+    (0xF, 0x07): 'fx07',
+    (0xF, 0x0A): 'fx0a',
+    (0xF, 0x15): 'fx15',
+    (0xF, 0x18): 'fx18',
+    (0xF, 0x1E): 'fx1e',
+    (0xF, 0x29): 'fx29',
+    (0xF, 0x33): 'fx33',
+    (0xF, 0x55): 'fx55',
+    (0xF, 0x65): 'fx65',
+}
+OPERATIONS = tuple(OPERATIONS_WITHOUT_PARAMETERS.values()) \
+    + tuple(NNN_OPERATIONS_PER_PREFIX.values()) \
+    + tuple(XKK_OPERATIONS_PER_PREFIX.values()) \
+    + tuple(XY_OPERATIONS_PER_PREFIX_AND_SUFFIX.values()) \
+    + tuple(X_OPERATIONS_PER_PREFIX_AND_SUFFIX.values()) \
+    + ('dxyn',)
+INVALID_OPERATION = (None, ())
+
+
+def _decode_opcode(opcode):
+    prefix = opcode >> 12
+    x = (opcode >> 8) & 0x0F
+    y = (opcode >> 4) & 0x0F
+    n = opcode & 0x0F
+    kk = opcode & 0xFF
+
+    if opcode in OPERATIONS_WITHOUT_PARAMETERS:
+        return OPERATIONS_WITHOUT_PARAMETERS[opcode], ()
+    if prefix in NNN_OPERATIONS_PER_PREFIX:
+        return NNN_OPERATIONS_PER_PREFIX[prefix], (opcode & 0x0FFF,)
+    if prefix in XKK_OPERATIONS_PER_PREFIX:
+        return XKK_OPERATIONS_PER_PREFIX[prefix], (x, kk)
+    if prefix == 0xD:
+        return 'dxyn', (x, y, n)
+    if (prefix, n) in XY_OPERATIONS_PER_PREFIX_AND_SUFFIX:
+        return XY_OPERATIONS_PER_PREFIX_AND_SUFFIX[(prefix, n)], (x, y)
+
+    x_suffix = n if prefix == 0x8 else kk
+    if (prefix, x_suffix) in X_OPERATIONS_PER_PREFIX_AND_SUFFIX:
+        return X_OPERATIONS_PER_PREFIX_AND_SUFFIX[(prefix, x_suffix)], (x,)
+
+    return INVALID_OPERATION
+
+
+def _build_decode_table():
+    return tuple(_decode_opcode(opcode) for opcode in range(0x10000))
+
+
+# Indexed by the 16-bit opcode; every entry is an (operation, parameters)
+# pair whose parameters match the arity of the Chip8 operation handler.
+DECODE_TABLE = _build_decode_table()
+
+
+def decode_operation_and_parameters(opcode_int):
+    return DECODE_TABLE[opcode_int]
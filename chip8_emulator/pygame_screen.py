@@ -2,30 +2,52 @@ import pygame
 
 
 class PygameScreen:
+    # Pixels are drawn on a surface at the CHIP-8 resolution, which is only
+    # scaled up to the window when the frame is presented
 
     _SCREEN_COLOR_RGB = (0, 0, 0)
     _PIXEL_COLOR_RGB = (255, 255, 255)
+    DEFAULT_SCALATION_FACTOR = 8
 
-    def __init__(self):
+    def __init__(self, scalation_factor=DEFAULT_SCALATION_FACTOR,
+                 window_size=None):
         self.width = None
         self.height = None
+        self.scalation_factor = scalation_factor
+        self.window_size = window_size
         self.screen = None
+        self.framebuffer_surface = None
 
     def init(self):
-        self.screen = pygame.display.set_mode((self.width, self.height))
+        if self.window_size is None:
+            self.window_size = (self.width * self.scalation_factor,
+                                self.height * self.scalation_factor)
 
-    def clear(self):
-        self.screen.fill(self._SCREEN_COLOR_RGB)
-        pygame.display.flip()
+        self.screen = pygame.display.set_mode(self.window_size)
+        self.framebuffer_surface = pygame.Surface((self.width, self.height))
+        self.framebuffer_surface.fill(self._SCREEN_COLOR_RGB)
 
-    def _draw_pixel_pygame(self, x, y, color):
-        pygame.draw.line(self.screen, color, (x, y), (x, y))
+    def clear(self):
+        self.framebuffer_surface.fill(self._SCREEN_COLOR_RGB)
 
     def draw_pixel(self, x, y):
-        self._draw_pixel_pygame(x, y, self._PIXEL_COLOR_RGB)
+        self.framebuffer_surface.set_at((x, y), self._PIXEL_COLOR_RGB)
 
     def clear_pixel(self, x, y):
-        self._draw_pixel_pygame(x, y, self._SCREEN_COLOR_RGB)
-
-    def refresh(self):
-        pygame.display.flip()
+        self.framebuffer_surface.set_at((x, y), self._SCREEN_COLOR_RGB)
+
+    def _get_window_rectangle(self, rectangle):
+        x, y, width, height = rectangle
+        window_width, window_height = self.window_size
+        left = x * window_width // self.width
+        top = y * window_height // self.height
+        right = -(-(x + width) * window_width // self.width)
+        bottom = -(-(y + height) * window_height // self.height)
+
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    def refresh(self, rectangles):
+        pygame.transform.scale(self.framebuffer_surface, self.window_size,
+                               self.screen)
+        pygame.display.update([self._get_window_rectangle(rectangle)
+                               for rectangle in rectangles])
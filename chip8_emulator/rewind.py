@@ -0,0 +1,176 @@
+import re
+from collections import deque
+from itertools import islice
+from .save_state import STATE_STRUCT, pack_state, unpack_state
+
+# Changed bytes separated by this few unchanged ones are stored in one run
+_MAX_RUN_GAP_BYTES = 3
+_CHANGED_RUN_PATTERN = re.compile(
+    rb'[^\x00]+(?:\x00{1,%d}[^\x00]+)*' % _MAX_RUN_GAP_BYTES)
+# Approximate cost of keeping a run offset and its bytes object around
+_RUN_OVERHEAD_BYTES = 8
+
+
+def _xor_bytes(first_bytes, second_bytes):
+    xor_int = int.from_bytes(first_bytes, 'big') \
+        ^ int.from_bytes(second_bytes, 'big')
+
+    return xor_int.to_bytes(len(first_bytes), 'big')
+
+
+def get_state_delta(previous_state, state):
+    xor_state = _xor_bytes(previous_state, state)
+
+    return tuple((run.start(), run.group())
+                 for run in _CHANGED_RUN_PATTERN.finditer(xor_state))
+
+
+def apply_state_delta(state, delta):
+    state = bytearray(state)
+
+    for offset, xor_run in delta:
+        run_end = offset + len(xor_run)
+        state[offset:run_end] = _xor_bytes(state[offset:run_end], xor_run)
+
+    return bytes(state)
+
+
+def _get_delta_size(delta):
+    return sum(len(xor_run) + _RUN_OVERHEAD_BYTES for _, xor_run in delta)
+
+
+class RewindFrame:
+
+    __slots__ = ('is_keyframe', 'payload', 'size')
+
+    def __init__(self, is_keyframe, payload, size):
+        self.is_keyframe = is_keyframe
+        self.payload = payload
+        self.size = size
+
+
+class RewindBuffer:
+
+    DEFAULT_MEMORY_LIMIT_BYTES = 4 * 1024 * 1024
+    DEFAULT_KEYFRAME_INTERVAL = 60
+
+    def __init__(self, chip8, memory_limit_bytes=DEFAULT_MEMORY_LIMIT_BYTES,
+                 keyframe_interval=DEFAULT_KEYFRAME_INTERVAL):
+        if memory_limit_bytes < STATE_STRUCT.size:
+            raise ValueError('The rewind memory limit must hold at least one '
+                             'state of {} bytes'.format(STATE_STRUCT.size))
+
+        self.chip8 = chip8
+        self.memory_limit_bytes = memory_limit_bytes
+        self.keyframe_interval = keyframe_interval
+        self.memory_usage_bytes = 0
+        self._frames = deque()
+        self._frames_since_keyframe = 0
+        self._last_state = None
+        self._last_frame_count = None
+
+    def __len__(self):
+        return len(self._frames)
+
+    def clear(self):
+        self._frames.clear()
+        self.memory_usage_bytes = 0
+        self._frames_since_keyframe = 0
+        self._last_state = None
+
+    def _append_frame(self, frame):
+        self._frames.append(frame)
+        self.memory_usage_bytes += frame.size
+
+    def _evict_oldest_frame(self):
+        oldest_frame = self._frames.popleft()
+        self.memory_usage_bytes -= oldest_frame.size
+
+        if self._frames and not self._frames[0].is_keyframe:
+            # The next frame becomes the keyframe its successors depend on
+            next_frame = self._frames[0]
+            next_state = apply_state_delta(oldest_frame.payload,
+                                           next_frame.payload)
+            self.memory_usage_bytes += len(next_state) - next_frame.size
+            self._frames[0] = RewindFrame(True, next_state, len(next_state))
+
+    def capture(self):
+        state = pack_state(self.chip8)
+
+        if self._last_state is None \
+                or self._frames_since_keyframe >= self.keyframe_interval:
+            self._append_frame(RewindFrame(True, state, len(state)))
+            self._frames_since_keyframe = 0
+        else:
+            delta = get_state_delta(self._last_state, state)
+            self._append_frame(RewindFrame(False, delta, _get_delta_size(delta)))
+
+        self._frames_since_keyframe += 1
+        self._last_state = state
+
+        while self.memory_usage_bytes > self.memory_limit_bytes:
+            self._evict_oldest_frame()
+
+    def capture_if_new_frame(self):
+        frame_count = self.chip8.delay_timer_thread.frame_count
+
+        if frame_count != self._last_frame_count:
+            self._last_frame_count = frame_count
+            self.capture()
+
+    def _get_newer_frames(self, frames):
+        # Newest first, the frames more recent than the one `frames` back
+        return islice(reversed(self._frames), frames)
+
+    def _get_state_backward(self, frames):
+        # XOR deltas are their own inverse, so they are undone newest first
+        state = self._last_state
+
+        for frame in self._get_newer_frames(frames):
+            state = apply_state_delta(state, frame.payload)
+
+        return state
+
+    def _get_state_forward(self, frames):
+        deltas = []
+
+        for frame in islice(reversed(self._frames), frames, None):
+            if frame.is_keyframe:
+                state = frame.payload
+                break
+
+            deltas.append(frame.payload)
+
+        for delta in reversed(deltas):
+            state = apply_state_delta(state, delta)
+
+        return state
+
+    def _get_state(self, frames):
+        if any(frame.is_keyframe for frame in self._get_newer_frames(frames)):
+            return self._get_state_forward(frames)
+
+        return self._get_state_backward(frames)
+
+    def step_back(self, frames=1):
+        frames = min(frames, len(self._frames) - 1)
+
+        if frames < 0:
+            return 0
+
+        state = self._get_state(frames)
+        unpack_state(self.chip8, state)
+
+        for _ in range(frames):
+            self.memory_usage_bytes -= self._frames.pop().size
+
+        self._last_state = state
+        self._frames_since_keyframe = 0
+
+        for frame in reversed(self._frames):
+            self._frames_since_keyframe += 1
+
+            if frame.is_keyframe:
+                break
+
+        return frames
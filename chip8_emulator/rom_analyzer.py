@@ -0,0 +1,207 @@
+from .opcode_parser import DECODE_TABLE
+
+JUMP_EDGE = 'jump'
+CALL_EDGE = 'call'
+RETURN_EDGE = 'return'
+SKIP_EDGE = 'skip'
+FALLTHROUGH_EDGE = 'fallthrough'
+
+SKIP_OPERATIONS = {'3xkk', '4xkk', '5xy0', '9xy0', 'ex9e', 'exa1'}
+# Operations changing I, ending the range of a sprite or data access
+_I_REGISTER_OPERATIONS = {'annn', 'fx1e', 'fx29'}
+_CONTROL_FLOW_OPERATIONS = {'00ee', '1nnn', '2nnn', 'bnnn'} | SKIP_OPERATIONS
+
+
+def get_instruction_successors(address, operation, parameters):
+    if operation == '1nnn':
+        return [(parameters[0], JUMP_EDGE)]
+    if operation == '2nnn':
+        return [(parameters[0], CALL_EDGE), (address + 2, FALLTHROUGH_EDGE)]
+    if operation in SKIP_OPERATIONS:
+        return [(address + 2, FALLTHROUGH_EDGE), (address + 4, SKIP_EDGE)]
+    if operation in ('00ee', 'bnnn'):
+        # Resolved at runtime: returns are linked to the call sites later
+        return []
+
+    return [(address + 2, FALLTHROUGH_EDGE)]
+
+
+def _get_data_access_length(operation, parameters):
+    if operation == 'dxyn':
+        return parameters[2]
+    if operation == 'fx33':
+        return 3
+    if operation in ('fx55', 'fx65'):
+        return parameters[0] + 1
+
+    return 0
+
+
+class RomAnalysis:
+
+    def __init__(self, address_start, address_end):
+        self.address_start = address_start
+        self.address_end = address_end
+        self.instructions = {}
+        self.edges = []
+        self.invalid_instructions = []
+        self.indirect_jumps = []
+        self.out_of_bounds_targets = []
+        self.code_addresses = set()
+        self.sprite_addresses = set()
+        self.data_addresses = set()
+
+    def get_block_leaders(self):
+        leaders = {self.address_start}
+        leaders.update(target for _, target, kind in self.edges
+                       if kind != FALLTHROUGH_EDGE)
+
+        return sorted(leader for leader in leaders if leader in self.instructions)
+
+    def is_code(self, address):
+        return address in self.code_addresses
+
+
+def _find_instructions(program_memory, analysis, visited_addresses,
+                       pending_addresses):
+    last_address = len(program_memory) - 2
+
+    while pending_addresses:
+        address = pending_addresses.pop()
+
+        if address in visited_addresses:
+            continue
+
+        visited_addresses.add(address)
+
+        if not 0 <= address <= last_address:
+            analysis.out_of_bounds_targets.append(address)
+            continue
+
+        opcode = (program_memory[address] << 8) | program_memory[address + 1]
+        operation, parameters = DECODE_TABLE[opcode]
+
+        if operation is None:
+            analysis.invalid_instructions.append((address, opcode))
+            continue
+
+        analysis.instructions[address] = (operation, parameters)
+        analysis.code_addresses.update((address, address + 1))
+
+        if operation == 'bnnn':
+            analysis.indirect_jumps.append(address)
+
+        for target, kind in get_instruction_successors(address, operation,
+                                                       parameters):
+            if operation == '2nnn' and kind == FALLTHROUGH_EDGE:
+                # Only reachable if the subroutine returns, see _link_returns
+                continue
+
+            analysis.edges.append((address, target, kind))
+            pending_addresses.append(target)
+
+
+def _find_subroutine_returns(analysis, subroutine_address,
+                             returning_call_addresses):
+    returns = []
+    visited_addresses = set()
+    pending_addresses = [subroutine_address]
+
+    while pending_addresses:
+        address = pending_addresses.pop()
+
+        if address in visited_addresses or address not in analysis.instructions:
+            continue
+
+        visited_addresses.add(address)
+        operation, parameters = analysis.instructions[address]
+
+        if operation == '00ee':
+            returns.append(address)
+
+        # Nested calls return to the instruction after them, if they return
+        pending_addresses.extend(
+            target for target, kind
+            in get_instruction_successors(address, operation, parameters)
+            if kind != CALL_EDGE and (operation != '2nnn'
+                                      or address in returning_call_addresses)
+        )
+
+    return returns
+
+
+def _find_returning_calls(program_memory, analysis, visited_addresses):
+    # The code after a call is only explored once its subroutine is seen to
+    # return, which may take exploring other return sites first
+    returning_call_addresses = set()
+    pending_addresses = [analysis.address_start]
+
+    while pending_addresses:
+        _find_instructions(program_memory, analysis, visited_addresses,
+                           pending_addresses)
+
+        for source, target, kind in analysis.edges:
+            if kind == CALL_EDGE and source not in returning_call_addresses \
+                    and _find_subroutine_returns(analysis, target,
+                                                 returning_call_addresses):
+                returning_call_addresses.add(source)
+                pending_addresses.append(source + 2)
+
+    return returning_call_addresses
+
+
+def _link_returns(analysis, returning_call_addresses):
+    return_sites_per_subroutine = {}
+
+    for source, target, kind in list(analysis.edges):
+        if kind == CALL_EDGE and source in returning_call_addresses:
+            analysis.edges.append((source, source + 2, FALLTHROUGH_EDGE))
+            return_sites_per_subroutine.setdefault(target, []).append(source + 2)
+
+    for subroutine_address, return_sites in return_sites_per_subroutine.items():
+        for return_address in _find_subroutine_returns(
+                analysis, subroutine_address, returning_call_addresses):
+            analysis.edges.extend((return_address, return_site, RETURN_EDGE)
+                                  for return_site in return_sites)
+
+
+def _find_data(analysis):
+    for address, (operation, parameters) in analysis.instructions.items():
+        if operation != 'annn':
+            continue
+
+        # Follow the straight line code using this I value
+        i_register = parameters[0]
+        instruction_address = address + 2
+
+        while instruction_address in analysis.instructions:
+            operation, parameters = analysis.instructions[instruction_address]
+            access_length = _get_data_access_length(operation, parameters)
+            accessed_addresses = range(i_register, i_register + access_length)
+
+            if operation == 'dxyn':
+                analysis.sprite_addresses.update(accessed_addresses)
+            else:
+                analysis.data_addresses.update(accessed_addresses)
+
+            if operation in _I_REGISTER_OPERATIONS \
+                    or operation in _CONTROL_FLOW_OPERATIONS:
+                break
+
+            instruction_address += 2
+
+    rom_addresses = set(range(analysis.address_start, analysis.address_end))
+    analysis.data_addresses |= rom_addresses - analysis.code_addresses \
+        - analysis.sprite_addresses
+    analysis.sprite_addresses -= analysis.code_addresses
+    analysis.data_addresses -= analysis.code_addresses
+
+
+def analyze_program_memory(program_memory, address_start, address_end):
+    analysis = RomAnalysis(address_start, address_end)
+    returning_call_addresses = _find_returning_calls(program_memory, analysis,
+                                                     set())
+    _link_returns(analysis, returning_call_addresses)
+    _find_data(analysis)
+
+    return analysis
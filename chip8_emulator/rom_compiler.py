@@ -0,0 +1,118 @@
+import hashlib
+import marshal
+import os
+import sys
+from . import __version__
+from .block_compiler import find_basic_block, generate_block_source
+from .block_compiler import get_block_function_name
+from .memory import Memory
+
+_COMPILED_ROM_EXTENSION = '.c8c'
+_COMPILED_ROM_HEADER = ('import random', '')
+
+
+def get_default_cache_directory():
+    cache_home = os.environ.get('XDG_CACHE_HOME',
+                                os.path.join(os.path.expanduser('~'), '.cache'))
+
+    return os.path.join(cache_home, 'chip8_emulator')
+
+
+def get_compiled_rom_path(rom_bytes, cache_directory):
+    rom_hash = hashlib.sha256(rom_bytes).hexdigest()
+    file_name = '{}-{}-{}{}'.format(rom_hash, __version__,
+                                    sys.implementation.cache_tag,
+                                    _COMPILED_ROM_EXTENSION)
+
+    return os.path.join(cache_directory, file_name)
+
+
+def _get_edge_targets(rom_analysis):
+    edge_targets = {}
+
+    for source, target, _ in rom_analysis.edges:
+        edge_targets.setdefault(source, []).append(target)
+
+    return edge_targets
+
+
+def find_static_blocks(program_memory, rom_analysis):
+    # Blocks follow the analysis' control flow, so that data after a call
+    # that never returns is not compiled as code
+    edge_targets = _get_edge_targets(rom_analysis)
+    blocks = {}
+    pending_addresses = rom_analysis.get_block_leaders()
+
+    while pending_addresses:
+        address = pending_addresses.pop()
+
+        if address in blocks or not rom_analysis.is_code(address):
+            continue
+
+        block = find_basic_block(program_memory, address)
+
+        if not block:
+            continue
+
+        blocks[address] = block
+        pending_addresses.extend(edge_targets.get(block[-1][0], ()))
+
+    return blocks
+
+
+def generate_rom_source(blocks):
+    lines = list(_COMPILED_ROM_HEADER)
+    block_entries = []
+
+    for address_start, block in sorted(blocks.items()):
+        function_name = get_block_function_name(address_start)
+        address_end = block[-1][0] + 2
+        lines.append(generate_block_source(block, function_name))
+        block_entries.append('    {}: ({}, {}),'.format(address_start,
+                                                        function_name,
+                                                        address_end))
+
+    lines.append('BLOCKS = {')
+    lines.extend(block_entries)
+    lines.append('}')
+
+    return '\n'.join(lines) + '\n'
+
+
+def compile_rom(rom_bytes):
+    memory = Memory()
+    memory.load_rom(rom_bytes)
+    blocks = find_static_blocks(memory.program_memory, memory.rom_analysis)
+    source = generate_rom_source(blocks)
+
+    return compile(source, '<chip8 rom>', 'exec')
+
+
+def save_compiled_rom(rom_bytes, cache_directory=None):
+    cache_directory = cache_directory or get_default_cache_directory()
+    compiled_rom_path = get_compiled_rom_path(rom_bytes, cache_directory)
+    temporary_path = '{}.{}.tmp'.format(compiled_rom_path, os.getpid())
+    os.makedirs(cache_directory, exist_ok=True)
+
+    with open(temporary_path, 'wb') as compiled_rom_handle:
+        marshal.dump(compile_rom(rom_bytes), compiled_rom_handle)
+
+    os.replace(temporary_path, compiled_rom_path)
+
+    return compiled_rom_path
+
+
+def load_compiled_blocks(rom_bytes, cache_directory=None):
+    cache_directory = cache_directory or get_default_cache_directory()
+    compiled_rom_path = get_compiled_rom_path(rom_bytes, cache_directory)
+
+    try:
+        with open(compiled_rom_path, 'rb') as compiled_rom_handle:
+            code = marshal.load(compiled_rom_handle)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+    namespace = {}
+    exec(code, namespace)
+
+    return namespace['BLOCKS']
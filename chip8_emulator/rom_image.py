@@ -0,0 +1,123 @@
+import importlib
+from collections import OrderedDict
+from .memory import Memory
+from .rom_compiler import load_compiled_blocks
+
+MAX_ROM_IMAGES = 64
+
+_ROM_LENGTH_BYTES = 2
+_SHARED_MEMORY_LENGTH = Memory.PROGRAM_MEMORY_LENGTH + _ROM_LENGTH_BYTES
+
+# Least recently used last
+_rom_images = OrderedDict()
+
+
+class RomImage:
+
+    __slots__ = ('rom_bytes', 'fusion_enabled', 'program_memory',
+                 'decoded_instructions', 'rom_analysis', 'shared_memory_block',
+                 '_compiled_blocks')
+
+    def __init__(self, rom_bytes, fusion_enabled=True,
+                 shared_memory_block=None):
+        memory = Memory(fusion_enabled)
+        memory.load_rom(rom_bytes)
+        self.rom_bytes = bytes(rom_bytes)
+        self.fusion_enabled = fusion_enabled
+        self.decoded_instructions = memory.decoded_instructions
+        self.rom_analysis = memory.rom_analysis
+        self.shared_memory_block = shared_memory_block
+        self._compiled_blocks = {}
+
+        if shared_memory_block is None:
+            self.program_memory = bytes(memory.program_memory)
+        else:
+            # Writable, but Memory copies a shared image before any write
+            self.program_memory = \
+                shared_memory_block.buf[:Memory.PROGRAM_MEMORY_LENGTH]
+
+    def get_compiled_blocks(self, cache_directory):
+        # Looked up on disk once, not every time a machine loads this ROM
+        if cache_directory not in self._compiled_blocks:
+            self._compiled_blocks[cache_directory] = load_compiled_blocks(
+                self.rom_bytes, cache_directory)
+
+        return self._compiled_blocks[cache_directory]
+
+    def close(self):
+        # Machines that loaded the image must be reset or dropped before
+        image_key = (self.rom_bytes, self.fusion_enabled)
+
+        if _rom_images.get(image_key) is self:
+            del _rom_images[image_key]
+
+        if self.shared_memory_block is not None:
+            self.program_memory.release()
+            self.shared_memory_block.close()
+            self.shared_memory_block = None
+
+
+def _add_rom_image(rom_image):
+    image_key = (rom_image.rom_bytes, rom_image.fusion_enabled)
+    _rom_images[image_key] = rom_image
+    _rom_images.move_to_end(image_key)
+
+    if len(_rom_images) > MAX_ROM_IMAGES:
+        # Only forgotten, machines using the image keep it alive
+        _rom_images.popitem(last=False)
+
+
+def get_rom_image(rom_bytes, fusion_enabled=True):
+    image_key = (bytes(rom_bytes), fusion_enabled)
+    rom_image = _rom_images.get(image_key)
+
+    if rom_image is None:
+        rom_image = RomImage(rom_bytes, fusion_enabled)
+        _add_rom_image(rom_image)
+    else:
+        _rom_images.move_to_end(image_key)
+
+    return rom_image
+
+
+def clear_rom_images():
+    _rom_images.clear()
+
+
+def _import_shared_memory():
+    # Sharing ROM images across processes needs Python 3.8 or later, older
+    # interpreters share them within one process only
+    try:
+        return importlib.import_module('multiprocessing.shared_memory')
+    except ImportError:
+        raise RuntimeError('Sharing ROM images across processes needs '
+                           'Python 3.8 or later') from None
+
+
+def share_rom_image(rom_bytes, name=None):
+    # The creating process owns the block and must close() and unlink() it
+    shared_memory = _import_shared_memory()
+    rom_image = get_rom_image(rom_bytes)
+    shared_memory_block = shared_memory.SharedMemory(
+        name=name, create=True, size=_SHARED_MEMORY_LENGTH)
+    shared_memory_block.buf[:Memory.PROGRAM_MEMORY_LENGTH] = \
+        rom_image.program_memory
+    shared_memory_block.buf[Memory.PROGRAM_MEMORY_LENGTH:] = \
+        len(rom_bytes).to_bytes(_ROM_LENGTH_BYTES, 'little')
+
+    return shared_memory_block
+
+
+def attach_rom_image(name, fusion_enabled=True):
+    # The attached image is detached with RomImage.close()
+    shared_memory = _import_shared_memory()
+    shared_memory_block = shared_memory.SharedMemory(name=name)
+    rom_length = int.from_bytes(
+        shared_memory_block.buf[Memory.PROGRAM_MEMORY_LENGTH:], 'little')
+    rom_end = Memory.PROGRAM_COUNTER_START + rom_length
+    rom_bytes = bytes(
+        shared_memory_block.buf[Memory.PROGRAM_COUNTER_START:rom_end])
+    rom_image = RomImage(rom_bytes, fusion_enabled, shared_memory_block)
+    _add_rom_image(rom_image)
+
+    return rom_image
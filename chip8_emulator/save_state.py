@@ -0,0 +1,94 @@
+import mmap
+import struct
+from array import array
+from .memory import Memory
+from .screen_proxy import ScreenProxy
+from .exceptions import InvalidSaveStateError
+
+STATE_MAGIC = b'C8ST'
+STATE_VERSION = 1
+
+# Fixed little-endian layout, so that a state is read with a single unpack
+STATE_STRUCT = struct.Struct(
+    '<4sH'  # Magic, version
+    '{}s'  # Program memory
+    '{}s'  # V registers
+    'HH'  # I register, program counter
+    '{}H'  # Stack
+    'B'  # Stack pointer
+    'BB'  # Delay timer, sound timer
+    'B'  # Pressed key
+    '{}s'  # Framebuffer
+    .format(Memory.PROGRAM_MEMORY_LENGTH, Memory.V_REGISTERS_LENGTH_BYTES,
+            Memory.STACK_DEPTH, ScreenProxy.FRAMEBUFFER_LENGTH_BYTES)
+)
+
+_NO_KEY_PRESSED = 0xFF
+
+
+def pack_state(chip8):
+    memory = chip8.memory
+    delay_timer, sound_timer = memory.get_timers()
+    pressed_key = chip8.keyboard.pressed_key
+
+    if pressed_key is None:
+        pressed_key = _NO_KEY_PRESSED
+
+    return STATE_STRUCT.pack(
+        STATE_MAGIC, STATE_VERSION,
+        bytes(memory.program_memory), bytes(memory.v_registers),
+        # Repeated Fx1E can carry I past 16 bits, as a 16 bit register would
+        # wrap it
+        memory.i_register & 0xFFFF, memory.program_counter,
+        *memory.stack,
+        memory.stack_pointer,
+        delay_timer, sound_timer,
+        pressed_key,
+        chip8.screen_proxy.get_framebuffer(),
+    )
+
+
+def unpack_state(chip8, state_buffer):
+    if len(state_buffer) != STATE_STRUCT.size:
+        raise InvalidSaveStateError(
+            'expected {} bytes, got {}'.format(STATE_STRUCT.size,
+                                               len(state_buffer)))
+
+    magic, version, program_memory, v_registers, i_register, \
+        program_counter, *state = STATE_STRUCT.unpack_from(state_buffer)
+
+    if magic != STATE_MAGIC:
+        raise InvalidSaveStateError('not a save state')
+    if version != STATE_VERSION:
+        raise InvalidSaveStateError('unsupported version {}'.format(version))
+
+    stack = state[:Memory.STACK_DEPTH]
+    stack_pointer, delay_timer, sound_timer, pressed_key, framebuffer = \
+        state[Memory.STACK_DEPTH:]
+
+    memory = chip8.memory
+    memory.load_bytes(0, program_memory)
+    memoryview(memory.v_registers)[:] = v_registers
+    memory.i_register = i_register
+    memory.program_counter = program_counter
+    memory.stack[:] = array('H', stack)
+    memory.stack_pointer = stack_pointer
+    memory.set_timers(delay_timer, sound_timer)
+
+    if pressed_key == _NO_KEY_PRESSED:
+        pressed_key = None
+
+    chip8.keyboard.pressed_key = pressed_key
+    chip8.screen_proxy.set_framebuffer(framebuffer)
+
+
+def save_state(chip8, state_path):
+    with open(state_path, 'wb') as state_handle:
+        state_handle.write(pack_state(chip8))
+
+
+def load_state(chip8, state_path):
+    with open(state_path, 'rb') as state_handle:
+        with mmap.mmap(state_handle.fileno(), 0,
+                       access=mmap.ACCESS_READ) as state_buffer:
+            unpack_state(chip8, state_buffer)
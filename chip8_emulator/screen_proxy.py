@@ -1,125 +1,225 @@
+from functools import lru_cache
 
-class ScreenProxy:
+SPRITE_CACHE_SIZE = 256
 
-    _SPRITE_WIDTH_BITS = 8
-    _SCALATION_FACTOR = 8
-    _WIDTH = 64 * _SCALATION_FACTOR
-    _HEIGHT = 32 * _SCALATION_FACTOR
+_LOGICAL_WIDTH = 64
+_SPRITE_WIDTH_BITS = 8
+_ROW_MASK = (1 << _LOGICAL_WIDTH) - 1
+_COLUMN_BITS = tuple(1 << (_LOGICAL_WIDTH - 1 - column)
+                     for column in range(_LOGICAL_WIDTH))
+
+
+def _get_sprite_row_mask(sprite_row, x_coordinate):
+    # Sprites wrap around horizontally, so the row is rotated
+    sprite_row <<= _LOGICAL_WIDTH - _SPRITE_WIDTH_BITS
+
+    return (sprite_row >> x_coordinate) \
+        | ((sprite_row << (_LOGICAL_WIDTH - x_coordinate)) & _ROW_MASK)
+
+
+# Row mask of every sprite byte drawn at every x coordinate
+SPRITE_ROW_MASKS = tuple(
+    tuple(_get_sprite_row_mask(sprite_row, x_coordinate)
+          for sprite_row in range(0x100))
+    for x_coordinate in range(_LOGICAL_WIDTH)
+)
+
+
+@lru_cache(maxsize=SPRITE_CACHE_SIZE)
+def get_sprite_rows(sprite_bytes, x_coordinate):
+    # Games draw the same few sprites over and over, so the mask and the
+    # columns to refresh of each row are kept
+    sprite_row_masks = SPRITE_ROW_MASKS[x_coordinate]
+
+    return tuple(
+        (sprite_row_masks[sprite_row],
+         tuple((x_coordinate + bit) % _LOGICAL_WIDTH
+               for bit in range(_SPRITE_WIDTH_BITS)
+               if sprite_row & (0x80 >> bit)))
+        for sprite_row in sprite_bytes
+    )
+
+
+def _get_wrapped_spans(start, length, limit):
+    end = start + length
+
+    if end <= limit:
+        return ((start, length),)
+
+    return ((start, limit - start), (0, end - limit))
+
+
+class DirtyRectangles:
+    # Logical (x, y, width, height) rectangles changed since the screen was
+    # last presented
+
+    __slots__ = ('width', 'height', '_rectangles', '_is_screen_dirty')
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self._rectangles = []
+        self._is_screen_dirty = False
+
+    def add_screen(self):
+        self._rectangles = [(0, 0, self.width, self.height)]
+        self._is_screen_dirty = True
+
+    def add_sprite(self, x_coordinate, y_coordinate, sprite_height):
+        if self._is_screen_dirty or not sprite_height:
+            return
+
+        # Wrapped sprites are split in up to four rectangles
+        for y_start, span_height in _get_wrapped_spans(
+                y_coordinate, sprite_height, self.height):
+            for x_start, span_width in _get_wrapped_spans(
+                    x_coordinate, _SPRITE_WIDTH_BITS, self.width):
+                self._rectangles.append(
+                    (x_start, y_start, span_width, span_height))
+
+    def pop(self):
+        rectangles = self._rectangles
+        self._rectangles = []
+        self._is_screen_dirty = False
+
+        return rectangles
+
+
+class BaseScreenProxy:
+    # Screen plumbing shared by the framebuffer engines, which keep the pixels
+    # and draw sprites into them
+
+    __slots__ = ('screen', 'collision', 'dirty_rectangles')
+
+    LOGICAL_WIDTH = _LOGICAL_WIDTH
+    LOGICAL_HEIGHT = 32
+    FRAMEBUFFER_LENGTH_BYTES = LOGICAL_WIDTH * LOGICAL_HEIGHT // 8
 
     def __init__(self, screen):
         self.screen = screen
-        self.screen.width = self._WIDTH
-        self.screen.height = self._HEIGHT
+        self.screen.width = self.LOGICAL_WIDTH
+        self.screen.height = self.LOGICAL_HEIGHT
         self.collision = False
-        self._init_screen_buffer_to_0()
+        self.dirty_rectangles = DirtyRectangles(self.LOGICAL_WIDTH,
+                                                self.LOGICAL_HEIGHT)
+
+    def _clear_pixels(self):
+        raise NotImplementedError
+
+    def _fork_pixels(self, forked_screen_proxy):
+        raise NotImplementedError
 
     def init_screen(self):
         self.screen.init()
 
     def clear_screen(self):
-        self._init_screen_buffer_to_0()
+        self._clear_pixels()
         self.screen.clear()
+        self.dirty_rectangles.add_screen()
+
+    def reset(self):
+        self.collision = False
+        self.clear_screen()
 
-    def _init_screen_buffer_to_0(self):
-        self._screen_buffer = [[0] * self._WIDTH for _ in range(self._HEIGHT)]
+    def present(self):
+        dirty_rectangles = self.dirty_rectangles.pop()
 
-    def _refresh_segment(self, segment, initial_x, initial_y):
-        segment_row_index = 0
-        current_y = initial_y
+        if dirty_rectangles:
+            self.screen.refresh(dirty_rectangles)
 
-        for segment_row in segment:
-            current_x = initial_x
-            segment_column_index = 0
-            for _ in segment_row:
-                if segment[segment_row_index][segment_column_index]:
-                    self.screen.draw_pixel(current_x, current_y)
-                else:
-                    self.screen.clear_pixel(current_x, current_y)
-                current_x += 1
-                segment_column_index += 1
-            segment_row_index += 1
-            current_y += 1
+    def fork(self, screen=None):
+        screen_proxy_class = type(self)
+        forked_screen_proxy = screen_proxy_class.__new__(screen_proxy_class)
+        forked_screen_proxy.screen = self.screen if screen is None else screen
+        forked_screen_proxy.collision = self.collision
+        forked_screen_proxy.dirty_rectangles = DirtyRectangles(
+            self.LOGICAL_WIDTH, self.LOGICAL_HEIGHT)
+        forked_screen_proxy.dirty_rectangles.add_screen()
+        self._fork_pixels(forked_screen_proxy)
 
-        self.screen.refresh()
+        return forked_screen_proxy
 
-    def _get_segment_bit_matrix_to_draw(self, row_index_begin,
-                                        column_index_begin, sprite_width,
-                                        sprite_height):
-        segment = []
 
-        row_index_end = row_index_begin + sprite_height
-        column_index_end = column_index_begin + sprite_width
+class ScreenProxy(BaseScreenProxy):
+    # The framebuffer is kept at the CHIP-8 resolution, one 64 bit integer
+    # per row with the leftmost pixel in the most significant bit. Scaling it
+    # up is left to the screen implementation. Draws only touch the screen's
+    # back buffer, present() shows the changed regions once per frame
 
-        for buffer_row in self._screen_buffer[row_index_begin:row_index_end]:
-            segment.append(buffer_row[column_index_begin:column_index_end])
+    __slots__ = ('_rows',)
 
-        return segment
+    _ROW_LENGTH_BYTES = BaseScreenProxy.LOGICAL_WIDTH // 8
+    _EMPTY_ROWS = (0,) * BaseScreenProxy.LOGICAL_HEIGHT
 
-    def _wrap_if_overflow(self, value, limit):
-        while value >= limit:
-            value = value - limit
+    def __init__(self, screen):
+        super().__init__(screen)
+        self._rows = list(self._EMPTY_ROWS)
+
+    def _clear_pixels(self):
+        self._rows[:] = self._EMPTY_ROWS
 
-        return value
+    def _fork_pixels(self, forked_screen_proxy):
+        # Rows are immutable integers, so copying the list is enough
+        forked_screen_proxy._rows = list(self._rows)
 
-    def _set_collision(self, pixel_before, pixel_after):
-        if pixel_before and not pixel_after:
-            self.collision = True
+    def get_logical_row(self, logical_row_index):
+        return self._rows[logical_row_index]
 
-    def _set_bit_row_to_screen_buffer(self, sprite_row_bitstring, buffer_row,
-                                      buffer_column):
-        for sprite_column_bitchar in sprite_row_bitstring:
-            sprite_column_bit_int = int(sprite_column_bitchar)
-            buffer_row = self._wrap_if_overflow(buffer_row, self._HEIGHT)
-            buffer_column = self._wrap_if_overflow(buffer_column, self._WIDTH)
-            pixel_before_xor = self._screen_buffer[buffer_row][buffer_column]
-            pixel_after_xor = pixel_before_xor ^ sprite_column_bit_int
-            self._set_collision(pixel_before_xor, pixel_after_xor)
-            self._screen_buffer[buffer_row][buffer_column] = pixel_after_xor
-            buffer_column += 1
+    def get_logical_rows(self):
+        return tuple(self._rows)
 
-    def _update_screen_buffer(self, sprite, buffer_row, buffer_column):
-        for sprite_row_int in sprite:
-            row_length_bits = self._SPRITE_WIDTH_BITS * self._SCALATION_FACTOR
-            bit_row_formatter = '{:0' + str(row_length_bits) + 'b}'
-            sprite_row_bitstring = bit_row_formatter.format(sprite_row_int)
-            self._set_bit_row_to_screen_buffer(sprite_row_bitstring,
-                                               buffer_row, buffer_column)
-            buffer_row += 1
+    def _refresh_lit_pixels(self, row, logical_row_index):
+        lit_pixels = row
 
-    def _scale_sprite_row(self, sprite_row):
-        scaled_sprite_row_bitstring = ''
-        original_sprite_row_bitstring = '{:08b}'.format(sprite_row)
+        while lit_pixels:
+            pixel_bit = lit_pixels & -lit_pixels
+            lit_pixels ^= pixel_bit
+            column = self.LOGICAL_WIDTH - pixel_bit.bit_length()
+            self.screen.draw_pixel(column, logical_row_index)
 
-        for sprite_bit in original_sprite_row_bitstring:
-            for _ in range(self._SCALATION_FACTOR):
-                scaled_sprite_row_bitstring += sprite_bit
+    def draw_sprite(self, sprite, x_coordinate, y_coordinate):
+        rows = self._rows
+        screen = self.screen
+        x_coordinate %= self.LOGICAL_WIDTH
+        y_coordinate %= self.LOGICAL_HEIGHT
+        logical_row_index = y_coordinate
+        collision = False
+        sprite_rows = get_sprite_rows(bytes(sprite), x_coordinate)
 
-        return scaled_sprite_row_bitstring
+        for sprite_row_mask, pixel_columns in sprite_rows:
+            row = rows[logical_row_index]
 
-    def _scale_sprite(self, sprite):
-        scaled_sprite = []
+            if row & sprite_row_mask:
+                collision = True
 
-        for sprite_row in sprite:
-            scaled_sprite_row_bitstring = self._scale_sprite_row(sprite_row)
-            scaled_sprite_row_int = int(scaled_sprite_row_bitstring, 2)
+            row ^= sprite_row_mask
+            rows[logical_row_index] = row
 
-            for _ in range(self._SCALATION_FACTOR):
-                scaled_sprite.append(scaled_sprite_row_int)
+            # Only the pixels under the sprite can have changed
+            for column in pixel_columns:
+                if row & _COLUMN_BITS[column]:
+                    screen.draw_pixel(column, logical_row_index)
+                else:
+                    screen.clear_pixel(column, logical_row_index)
 
-        return scaled_sprite
+            logical_row_index = (logical_row_index + 1) % self.LOGICAL_HEIGHT
 
-    def draw_sprite(self, sprite, buffer_column, buffer_row):
-        self.collision = False
-        scaled_sprite = self._scale_sprite(sprite)
-        buffer_column *= self._SCALATION_FACTOR
-        buffer_row *= self._SCALATION_FACTOR
-        self._update_screen_buffer(scaled_sprite, buffer_row, buffer_column)
+        self.collision = collision
+        self.dirty_rectangles.add_sprite(x_coordinate, y_coordinate,
+                                         len(sprite_rows))
 
-        sprite_width = 8 * self._SCALATION_FACTOR
-        sprite_height = len(scaled_sprite)
+    def get_framebuffer(self):
+        return b''.join(row.to_bytes(self._ROW_LENGTH_BYTES, 'big')
+                        for row in self._rows)
 
-        segment_to_draw = self._get_segment_bit_matrix_to_draw(
-            buffer_row, buffer_column, sprite_width, sprite_height
-        )
+    def set_framebuffer(self, framebuffer):
+        self.clear_screen()
 
-        self._refresh_segment(segment_to_draw, buffer_column, buffer_row)
+        for logical_row_index in range(self.LOGICAL_HEIGHT):
+            row_start = logical_row_index * self._ROW_LENGTH_BYTES
+            row = int.from_bytes(
+                framebuffer[row_start:row_start + self._ROW_LENGTH_BYTES],
+                'big')
+            self._rows[logical_row_index] = row
+            # Only lit pixels are drawn, the screen has just been cleared
+            self._refresh_lit_pixels(row, logical_row_index)
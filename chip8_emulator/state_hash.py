@@ -0,0 +1,110 @@
+import struct
+from collections import OrderedDict
+from .memory import Memory
+
+# I register, program counter, stack pointer, delay timer, sound timer
+_REGISTERS_STRUCT = struct.Struct('<HHBBB')
+
+
+class StateHasher:
+
+    PAGE_LENGTH_BYTES = Memory.PAGE_LENGTH_BYTES
+
+    def __init__(self, chip8):
+        self.chip8 = chip8
+        pages = len(chip8.memory.program_memory) // self.PAGE_LENGTH_BYTES
+        self._page_hashes = [None] * pages
+        chip8.memory.add_program_memory_write_listener(self._invalidate_pages)
+
+    def fork(self, chip8):
+        forked_state_hasher = StateHasher(chip8)
+        forked_state_hasher._page_hashes[:] = self._page_hashes
+
+        return forked_state_hasher
+
+    def close(self):
+        self.chip8.memory.remove_program_memory_write_listener(
+            self._invalidate_pages)
+
+    def _invalidate_pages(self, address_start, address_end):
+        first_page = address_start // self.PAGE_LENGTH_BYTES
+        last_page = (address_end - 1) // self.PAGE_LENGTH_BYTES
+
+        for page in range(first_page, last_page + 1):
+            self._page_hashes[page] = None
+
+    def _get_page_hash(self, page):
+        page_hash = self._page_hashes[page]
+
+        if page_hash is None:
+            page_start = page * self.PAGE_LENGTH_BYTES
+            page_bytes = self.chip8.memory.program_memory[
+                page_start:page_start + self.PAGE_LENGTH_BYTES]
+            page_hash = hash(bytes(page_bytes))
+            self._page_hashes[page] = page_hash
+
+        return page_hash
+
+    def _get_registers_bytes(self):
+        memory = self.chip8.memory
+        delay_timer, sound_timer = memory.get_timers()
+
+        return bytes(memory.v_registers) \
+            + memory.stack[:memory.stack_pointer].tobytes() \
+            + _REGISTERS_STRUCT.pack((memory.i_register or 0) & 0xFFFF,
+                                     memory.program_counter,
+                                     memory.stack_pointer, delay_timer,
+                                     sound_timer)
+
+    def get_state_hash(self):
+        page_hashes = tuple(self._get_page_hash(page)
+                            for page in range(len(self._page_hashes)))
+        # The screen is only 32 integers, it's cheaper to hash it every time
+        screen_rows = self.chip8.screen_proxy.get_logical_rows()
+
+        return hash((page_hashes, screen_rows, self._get_registers_bytes()))
+
+
+class TranspositionTable:
+
+    DEFAULT_CAPACITY = 0x10000
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, state_hash):
+        return state_hash in self._entries
+
+    def get(self, state_hash, default=None):
+        try:
+            value = self._entries[state_hash]
+        except KeyError:
+            self.misses += 1
+
+            return default
+
+        self._entries.move_to_end(state_hash)
+        self.hits += 1
+
+        return value
+
+    def put(self, state_hash, value=True):
+        self._entries[state_hash] = value
+        self._entries.move_to_end(state_hash)
+
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def visit(self, state_hash):
+        if self.get(state_hash) is not None:
+            return True
+
+        self.put(state_hash)
+
+        return False
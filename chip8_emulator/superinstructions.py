@@ -0,0 +1,66 @@
+# Frequent instruction sequences, found profiling roms/pong.rom, executed
+# by a single fused Chip8 operation. A control flow operation can only be
+# the last one of a sequence, or be skipped by the operation before it.
+FUSED_OPERATIONS = {
+    ('6xkk', '6xkk'): '6xkk_6xkk',
+    ('6xkk', 'exa1'): '6xkk_exa1',
+    ('6xkk', '8xy2'): '6xkk_8xy2',
+    ('annn', 'dxyn'): 'annn_dxyn',
+    ('7xkk', '3xkk'): '7xkk_3xkk',
+    ('3xkk', '1nnn'): '3xkk_1nnn',
+    ('fx07', '3xkk', '1nnn'): 'fx07_3xkk_1nnn',
+}
+FUSED_OPERATION_LENGTHS = {
+    fused_operation: len(operations)
+    for operations, fused_operation in FUSED_OPERATIONS.items()
+}
+MAX_FUSED_OPERATIONS = max(FUSED_OPERATION_LENGTHS.values())
+
+_FUSED_OPERATION_PREFIXES = {
+    operations[:length]
+    for operations in FUSED_OPERATIONS
+    for length in range(1, len(operations))
+}
+
+
+def fuse_instructions(instructions):
+    operations = ()
+    parameters = ()
+    fused_instruction = None
+
+    for operation, instruction_parameters in instructions:
+        operations += (operation,)
+        parameters += instruction_parameters
+
+        if operations in FUSED_OPERATIONS:
+            fused_instruction = (FUSED_OPERATIONS[operations], parameters)
+
+        if operations not in _FUSED_OPERATION_PREFIXES:
+            break
+
+    return fused_instruction
+
+
+def get_executed_instructions(operation, address, next_address):
+    executed_instructions = FUSED_OPERATION_LENGTHS.get(operation, 1)
+
+    # A jump ending a fused operation is not run if it was skipped
+    if operation.endswith('_1nnn') \
+            and next_address == address + 2 * executed_instructions:
+        executed_instructions -= 1
+
+    return executed_instructions
+
+
+def get_fusion_report(fusion_counts):
+    report = []
+
+    for fused_operation, count in fusion_counts.most_common():
+        saved_dispatches = count * (FUSED_OPERATION_LENGTHS[fused_operation] - 1)
+        report.append({
+            'operation': fused_operation,
+            'count': count,
+            'saved_dispatches': saved_dispatches,
+        })
+
+    return report
@@ -0,0 +1,111 @@
+from time import perf_counter
+from .block_compiler import BlockCache
+
+
+class TierStatistics:
+
+    def __init__(self):
+        self.promotions = 0
+        self.invalidations = 0
+        self.interpreted_instructions = 0
+        self.compiled_instructions = 0
+        self.interpreter_seconds = 0.0
+        self.compiled_seconds = 0.0
+
+    def as_dict(self):
+        return {
+            'promotions': self.promotions,
+            'invalidations': self.invalidations,
+            'interpreted_instructions': self.interpreted_instructions,
+            'compiled_instructions': self.compiled_instructions,
+            'interpreter_seconds': self.interpreter_seconds,
+            'compiled_seconds': self.compiled_seconds,
+        }
+
+
+class TieredExecutor:
+
+    DEFAULT_HOTNESS_THRESHOLD = 64
+    _ADDRESS_SPACE_LENGTH = 0x1000
+    _NO_EXECUTION_COUNTS = (0,) * _ADDRESS_SPACE_LENGTH
+    _INTERPRETER_TIER = 'interpreter'
+    _COMPILED_TIER = 'compiled'
+
+    def __init__(self, chip8, hotness_threshold=DEFAULT_HOTNESS_THRESHOLD):
+        self.chip8 = chip8
+        self.hotness_threshold = hotness_threshold
+        self.block_cache = BlockCache(chip8.memory)
+        self._statistics = TierStatistics()
+        self._execution_counts = [0] * self._ADDRESS_SPACE_LENGTH
+        self._tier = self._INTERPRETER_TIER
+        self._tier_start = perf_counter()
+
+    def reset(self):
+        self.block_cache.clear()
+        self._statistics = TierStatistics()
+        self._execution_counts[:] = self._NO_EXECUTION_COUNTS
+        self._tier = self._INTERPRETER_TIER
+        self._tier_start = perf_counter()
+
+    def fork(self, chip8):
+        forked_tiered_executor = TieredExecutor(chip8, self.hotness_threshold)
+        forked_tiered_executor.block_cache.add_blocks(
+            self.block_cache.get_blocks())
+
+        return forked_tiered_executor
+
+    def _switch_tier(self, tier):
+        now = perf_counter()
+        elapsed_seconds = now - self._tier_start
+
+        if self._tier == self._INTERPRETER_TIER:
+            self._statistics.interpreter_seconds += elapsed_seconds
+        else:
+            self._statistics.compiled_seconds += elapsed_seconds
+
+        self._tier = tier
+        self._tier_start = now
+
+    def _promote(self, address):
+        block = self.block_cache.get_block(address)
+
+        if block is not None:
+            self._statistics.promotions += 1
+
+        return block
+
+    def _run_compiled_block(self, block):
+        if self._tier is not self._COMPILED_TIER:
+            self._switch_tier(self._COMPILED_TIER)
+
+        self._statistics.compiled_instructions += block(self.chip8)
+        self.chip8.keyboard.listen()
+
+    def _interpret_instruction(self):
+        if self._tier is not self._INTERPRETER_TIER:
+            self._switch_tier(self._INTERPRETER_TIER)
+
+        self._statistics.interpreted_instructions += 1
+        self.chip8.step()
+
+    def step(self):
+        address = self.chip8.memory.program_counter
+        block = self.block_cache.get_compiled_block(address)
+
+        if block is None:
+            execution_count = self._execution_counts[address] + 1
+            self._execution_counts[address] = execution_count
+
+            if execution_count > self.hotness_threshold:
+                block = self._promote(address)
+
+        if block is None:
+            self._interpret_instruction()
+        else:
+            self._run_compiled_block(block)
+
+    def get_statistics(self):
+        self._switch_tier(self._tier)
+        self._statistics.invalidations = self.block_cache.invalidations
+
+        return self._statistics
@@ -0,0 +1,138 @@
+import math
+from time import perf_counter
+from .exceptions import InvalidDigitSpriteError, InvalidOpcodeError, \
+    MemoryAccessError, StackOverflowError, StackUnderflowError
+from .state_hash import StateHasher, TranspositionTable
+from .superinstructions import get_executed_instructions
+
+
+class StopReason:
+
+    INFINITE_LOOP = 'infinite_loop'
+    STACK_OVERFLOW = 'stack_overflow'
+    STACK_UNDERFLOW = 'stack_underflow'
+    PROGRAM_COUNTER_OUT_OF_BOUNDS = 'program_counter_out_of_bounds'
+    INVALID_OPCODE = 'invalid_opcode'
+    INVALID_DIGIT_SPRITE = 'invalid_digit_sprite'
+    MEMORY_ACCESS_OUT_OF_BOUNDS = 'memory_access_out_of_bounds'
+    INSTRUCTION_BUDGET_EXCEEDED = 'instruction_budget_exceeded'
+    TIME_BUDGET_EXCEEDED = 'time_budget_exceeded'
+
+    __slots__ = ('reason', 'program_counter', 'instructions', 'seconds',
+                 'message')
+
+    def __init__(self, reason, program_counter, instructions, seconds,
+                 message=None):
+        self.reason = reason
+        self.program_counter = program_counter
+        self.instructions = instructions
+        self.seconds = seconds
+        self.message = message
+
+    def as_dict(self):
+        return {
+            'reason': self.reason,
+            'program_counter': self.program_counter,
+            'instructions': self.instructions,
+            'seconds': self.seconds,
+            'message': self.message,
+        }
+
+
+_ERROR_STOP_REASONS = {
+    StackOverflowError: StopReason.STACK_OVERFLOW,
+    StackUnderflowError: StopReason.STACK_UNDERFLOW,
+    InvalidOpcodeError: StopReason.INVALID_OPCODE,
+    MemoryAccessError: StopReason.MEMORY_ACCESS_OUT_OF_BOUNDS,
+    InvalidDigitSpriteError: StopReason.INVALID_DIGIT_SPRITE,
+}
+# Spelled out, pylint cannot infer the exception types of tuple(dict)
+_STOPPING_ERRORS = (StackOverflowError, StackUnderflowError,
+                    InvalidOpcodeError, MemoryAccessError,
+                    InvalidDigitSpriteError)
+
+
+class Watchdog:
+    # Runs the machine headless until it stops by itself or misbehaves. The
+    # state is hashed every loop_check_interval instructions: being back in
+    # an already seen state means that the machine is looping without doing
+    # anything, as there is no input in a batch run
+
+    DEFAULT_LOOP_CHECK_INTERVAL = 64
+    DEFAULT_VISITED_STATES_CAPACITY = 0x1000
+    # Delay and sound timers tick every this many instructions instead of
+    # at 60 Hz, so that runs are deterministic
+    DEFAULT_INSTRUCTIONS_PER_TIMER_TICK = 10
+
+    def __init__(self, chip8, max_instructions=None, max_seconds=None,
+                 loop_check_interval=DEFAULT_LOOP_CHECK_INTERVAL,
+                 visited_states_capacity=DEFAULT_VISITED_STATES_CAPACITY,
+                 instructions_per_timer_tick=DEFAULT_INSTRUCTIONS_PER_TIMER_TICK):
+        self.chip8 = chip8
+        self.max_instructions = math.inf if max_instructions is None \
+            else max_instructions
+        self.max_seconds = math.inf if max_seconds is None else max_seconds
+        self.loop_check_interval = loop_check_interval
+        self.visited_states_capacity = visited_states_capacity
+        self.instructions_per_timer_tick = instructions_per_timer_tick
+
+    def _tick_timers(self):
+        self.chip8.memory.decrement_delay_timer()
+        self.chip8.memory.decrement_sound_timer()
+
+    def run(self, rom_bytes=None):
+        # Idle loops are fast-forwarded instead of slept through
+        headless = self.chip8.headless
+        self.chip8.headless = True
+        state_hasher = StateHasher(self.chip8)
+
+        try:
+            return self._run(rom_bytes, state_hasher)
+        finally:
+            state_hasher.close()
+            self.chip8.headless = headless
+
+    def _run(self, rom_bytes, state_hasher):
+        memory = self.chip8.memory
+        last_address = len(memory.program_memory) - 2
+        visited_states = TranspositionTable(self.visited_states_capacity)
+        instructions = 0
+        next_timer_tick = self.instructions_per_timer_tick
+        next_loop_check = self.loop_check_interval
+        start = perf_counter()
+
+        def stop(reason, message=None):
+            return StopReason(reason, memory.program_counter, instructions,
+                              perf_counter() - start, message)
+
+        try:
+            if rom_bytes is not None:
+                self.chip8.reset(rom_bytes)
+
+            while True:
+                address = memory.program_counter
+
+                if not 0 <= address <= last_address:
+                    return stop(StopReason.PROGRAM_COUNTER_OUT_OF_BOUNDS)
+                if instructions >= self.max_instructions:
+                    return stop(StopReason.INSTRUCTION_BUDGET_EXCEEDED)
+
+                # Fused operations run several instructions in one step
+                operation, _ = memory.get_current_instruction()
+                self.chip8.step()
+                instructions += get_executed_instructions(
+                    operation, address, memory.program_counter)
+
+                while instructions >= next_timer_tick:
+                    self._tick_timers()
+                    next_timer_tick += self.instructions_per_timer_tick
+
+                if instructions >= next_loop_check:
+                    next_loop_check += self.loop_check_interval
+
+                    if perf_counter() - start >= self.max_seconds:
+                        return stop(StopReason.TIME_BUDGET_EXCEEDED)
+                    if visited_states.visit(state_hasher.get_state_hash()):
+                        return stop(StopReason.INFINITE_LOOP)
+        except _STOPPING_ERRORS as error:
+            return stop(_ERROR_STOP_REASONS[type(error)], str(error))
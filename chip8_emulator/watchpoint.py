@@ -0,0 +1,23 @@
+class Watchpoint:
+
+    __slots__ = ('address_start', 'address_end', 'callback', 'value')
+
+    def __init__(self, address_start, address_end, callback, value=None):
+        self.address_start = address_start
+        self.address_end = address_end
+        self.callback = callback
+        self.value = value
+
+    def check(self, program_memory, address_start, address_end):
+        written_address_start = max(address_start, self.address_start)
+        written_address_end = min(address_end, self.address_end)
+
+        if written_address_start >= written_address_end:
+            return
+
+        if self.value is not None \
+                and self.value not in program_memory[written_address_start:
+                                                     written_address_end]:
+            return
+
+        self.callback(self, written_address_start, written_address_end)
@@ -0,0 +1,189 @@
+import unittest
+from unittest import mock
+from chip8_emulator import block_compiler
+from chip8_emulator.block_compiler import BlockCache
+from chip8_emulator.chip8 import Chip8
+from chip8_emulator.memory import Memory
+
+
+class BlockCompilerTest(unittest.TestCase):
+
+    def _init_program_memory(self, program, address=0x200):
+        program_memory = [0x00] * 0xE9F
+        program_memory[address:address + len(program)] = program
+
+        return program_memory
+
+    def _init_chip8(self, program):
+        chip8 = Chip8(mock.Mock(), mock.Mock())
+        chip8.memory.load_rom(bytes(program))
+        block_cache = BlockCache(chip8.memory)
+
+        return chip8, block_cache
+
+    def test_find_basic_block__ends_at_jump(self):
+        program = [0x60, 0x05, 0x71, 0x01, 0x12, 0x00, 0x62, 0x03]
+        program_memory = self._init_program_memory(program)
+
+        expected_block = [
+            (0x200, '6xkk', (0x0, 0x05)),
+            (0x202, '7xkk', (0x1, 0x01)),
+            (0x204, '1nnn', (0x200,)),
+        ]
+        actual_block = block_compiler.find_basic_block(program_memory, 0x200)
+
+        self.assertEqual(expected_block, actual_block)
+
+    def test_find_basic_block__ends_at_skip(self):
+        program = [0x60, 0x05, 0x30, 0x05, 0x12, 0x00]
+        program_memory = self._init_program_memory(program)
+
+        expected_block = [
+            (0x200, '6xkk', (0x0, 0x05)),
+            (0x202, '3xkk', (0x0, 0x05)),
+        ]
+        actual_block = block_compiler.find_basic_block(program_memory, 0x200)
+
+        self.assertEqual(expected_block, actual_block)
+
+    def test_find_basic_block__ends_after_program_memory_write(self):
+        program = [0xF2, 0x55, 0x60, 0x05]
+        program_memory = self._init_program_memory(program)
+
+        expected_block = [(0x200, 'fx55', (0x2,))]
+        actual_block = block_compiler.find_basic_block(program_memory, 0x200)
+
+        self.assertEqual(expected_block, actual_block)
+
+    def test_find_basic_block__stops_before_invalid_opcode(self):
+        program = [0x60, 0x05, 0x80, 0x08]
+        program_memory = self._init_program_memory(program)
+
+        expected_block = [(0x200, '6xkk', (0x0, 0x05))]
+        actual_block = block_compiler.find_basic_block(program_memory, 0x200)
+
+        self.assertEqual(expected_block, actual_block)
+
+    def test_compile_block__invalid_opcode(self):
+        program_memory = self._init_program_memory([0x80, 0x08])
+
+        expected = (None, 0x202)
+        actual = block_compiler.compile_block(program_memory, 0x200)
+
+        self.assertEqual(expected, actual)
+
+    def test_block__inline_operations(self):
+        program = [
+            0x60, 0xF0, 0x61, 0x20, 0x80, 0x14, 0x82, 0x0E, 0xA3, 0x00,
+            0xF1, 0x1E, 0x13, 0x00,
+        ]
+        chip8, block_cache = self._init_chip8(program)
+        block = block_cache.get_block(0x200)
+
+        executed_instructions = block(chip8)
+
+        self.assertEqual(7, executed_instructions)
+        self.assertEqual(0x10, chip8.memory.v_registers[0x0])
+        self.assertEqual(0x20, chip8.memory.v_registers[0x1])
+        self.assertEqual(0x00, chip8.memory.v_registers[0x2])
+        self.assertEqual(0x320, chip8.memory.i_register)
+        self.assertEqual(0x300, chip8.memory.program_counter)
+
+    def test_block__skip_taken(self):
+        program = [0x60, 0x05, 0x30, 0x05]
+        chip8, block_cache = self._init_chip8(program)
+
+        block_cache.get_block(0x200)(chip8)
+
+        self.assertEqual(0x206, chip8.memory.program_counter)
+
+    def test_block__skip_not_taken(self):
+        program = [0x60, 0x05, 0x40, 0x05]
+        chip8, block_cache = self._init_chip8(program)
+
+        block_cache.get_block(0x200)(chip8)
+
+        self.assertEqual(0x204, chip8.memory.program_counter)
+
+    def test_block__call_and_handler(self):
+        program = [0x60, 0x01, 0xF0, 0x29, 0x23, 0x00]
+        chip8, block_cache = self._init_chip8(program)
+
+        block_cache.get_block(0x200)(chip8)
+
+        self.assertEqual(0x005, chip8.memory.i_register)
+        self.assertEqual([0x204], chip8.memory.get_stack_addresses())
+        self.assertEqual(0x300, chip8.memory.program_counter)
+
+    def test_block__idle_loop_jump_calls_handler(self):
+        program = [0x12, 0x00]
+        chip8, block_cache = self._init_chip8(program)
+        mocked_1nnn = mock.Mock()
+        chip8.set_operation_handler('1nnn', mocked_1nnn)
+
+        block_cache.get_block(0x200)(chip8)
+
+        mocked_1nnn.assert_called_with(0x200)
+
+    def test_block__matches_interpreter(self):
+        with open('roms/pong.rom', 'rb') as rom_handle:
+            rom_bytes = rom_handle.read()
+        interpreted_chip8 = Chip8(mock.Mock(), mock.Mock())
+        interpreted_chip8.memory.fusion_enabled = False
+        interpreted_chip8.memory.load_rom(rom_bytes)
+        compiled_chip8 = Chip8(mock.Mock(), mock.Mock())
+        compiled_chip8.memory.load_rom(rom_bytes)
+        block_cache = BlockCache(compiled_chip8.memory)
+        compiled_chip8.keyboard.get_pressed_key.return_value = None
+        interpreted_chip8.keyboard.get_pressed_key.return_value = None
+
+        with mock.patch('random.getrandbits', return_value=0x5A):
+            for _ in range(30):
+                block = block_cache.get_block(
+                    compiled_chip8.memory.program_counter)
+                executed_instructions = block(compiled_chip8)
+
+                for _ in range(executed_instructions):
+                    interpreted_chip8.step()
+
+                self.assertEqual(interpreted_chip8.memory.program_counter,
+                                 compiled_chip8.memory.program_counter)
+                self.assertEqual(interpreted_chip8.memory.v_registers,
+                                 compiled_chip8.memory.v_registers)
+                self.assertEqual(interpreted_chip8.memory.i_register,
+                                 compiled_chip8.memory.i_register)
+                self.assertEqual(
+                    interpreted_chip8.memory.get_stack_addresses(),
+                    compiled_chip8.memory.get_stack_addresses())
+
+    def test_block_cache__caches_blocks(self):
+        memory = Memory()
+        memory.load_rom(bytes([0x60, 0x05, 0x12, 0x00]))
+        block_cache = BlockCache(memory)
+
+        block = block_cache.get_block(0x200)
+
+        self.assertIs(block, block_cache.get_block(0x200))
+
+    def test_block_cache__invalidated_by_program_memory_write(self):
+        memory = Memory()
+        memory.load_rom(bytes([0x60, 0x05, 0x12, 0x00]))
+        block_cache = BlockCache(memory)
+        block = block_cache.get_block(0x200)
+        memory.program_memory[0x203] = 0x04
+
+        memory.notify_program_memory_write(0x203, 0x204)
+
+        self.assertIsNone(block_cache.get_compiled_block(0x200))
+        self.assertIsNot(block, block_cache.get_block(0x200))
+        self.assertEqual(1, block_cache.invalidations)
+
+    def test_block_cache__not_invalidated_by_unrelated_write(self):
+        memory = Memory()
+        memory.load_rom(bytes([0x60, 0x05, 0x12, 0x00]))
+        block_cache = BlockCache(memory)
+        block = block_cache.get_block(0x200)
+
+        memory.notify_program_memory_write(0x300, 0x303)
+
+        self.assertIs(block, block_cache.get_block(0x200))
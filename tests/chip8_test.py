@@ -1,24 +1,32 @@
 import unittest
+from array import array
 from unittest import mock
+from chip8_emulator import rom_image
 from chip8_emulator.chip8 import Chip8
 from chip8_emulator.memory import Memory
+from chip8_emulator.exceptions import InvalidOpcodeError, MemoryAccessError
+from chip8_emulator.tiered_execution import TieredExecutor
 
 
 class Chip8Test(unittest.TestCase):
 
     def _init_chip8(self, program_counter=0x200, stack_pointer=0xEA0, stack=[],
                     v_registers=[0x00] * 16, i_register=None,
-                    program_memory=[None] * 4096, delay_timer=None, sound_timer=None):
+                    program_memory=None, delay_timer=None, sound_timer=None):
         screen_mock = mock.Mock()
         keyboard_mock = mock.Mock()
         memory = Memory()
         memory.program_counter = program_counter
-        memory.stack = stack
-        memory.v_registers = v_registers
+
+        for address in stack:
+            memory.add_to_stack(address)
+
+        memory.v_registers = array('B', v_registers)
         memory.i_register = i_register
-        memory.program_memory = program_memory
+        memory.program_memory = bytearray(program_memory or 4096)
         memory._delay_timer = delay_timer
-        memory.sound_timer = sound_timer
+        if sound_timer is not None:
+            memory._sound_timer = sound_timer
 
         chip8 = Chip8(screen_mock, keyboard_mock)
         chip8.memory = memory
@@ -69,14 +77,14 @@ class Chip8Test(unittest.TestCase):
         expected_program_counter = call_subroutine_at
         actual_program_counter = chip8.memory.program_counter
         expected_stack = [0x351, 0x215, 0x812, 0x4FA, 0x617]
-        actual_stack = chip8.memory.stack
+        actual_stack = chip8.memory.get_stack_addresses()
 
         self.assertEqual(expected_program_counter, actual_program_counter)
         self.assertEqual(expected_stack, actual_stack)
 
     def test_3xkk__equals(self):
         program_counter = 0x31A
-        v_registers = [None] * 16
+        v_registers = [0x00] * 16
         vx_index = 0x5
         v_registers[vx_index] = 0xAE
         chip8 = self._init_chip8(program_counter, v_registers=v_registers)
@@ -91,7 +99,7 @@ class Chip8Test(unittest.TestCase):
 
     def test_3xkk__not_equals(self):
         program_counter = 0x31A
-        v_registers = [None] * 16
+        v_registers = [0x00] * 16
         vx_index = 0x5
         v_registers[vx_index] = 0xAE
         chip8 = self._init_chip8(program_counter, v_registers=v_registers)
@@ -106,7 +114,7 @@ class Chip8Test(unittest.TestCase):
 
     def test_4xkk__not_equals(self):
         program_counter = 0xBAE
-        v_registers = [None] * 16
+        v_registers = [0x00] * 16
         vx_index = 0x2
         v_registers[vx_index] = 0x14
         chip8 = self._init_chip8(program_counter, v_registers=v_registers)
@@ -121,7 +129,7 @@ class Chip8Test(unittest.TestCase):
 
     def test_4xkk__equals(self):
         program_counter = 0xBAE
-        v_registers = [None] * 16
+        v_registers = [0x00] * 16
         vx_index = 0x2
         v_registers[vx_index] = 0x14
         chip8 = self._init_chip8(program_counter, v_registers=v_registers)
@@ -136,7 +144,7 @@ class Chip8Test(unittest.TestCase):
 
     def test_5xy0__equals(self):
         program_counter = 0x4FE
-        v_registers = [None] * 16
+        v_registers = [0x00] * 16
         vx_index = 0x5
         vy_index = 0x6
         v_registers[vx_index] = 0x14
@@ -152,7 +160,7 @@ class Chip8Test(unittest.TestCase):
 
     def test_5xy0__not_equals(self):
         program_counter = 0x4FE
-        v_registers = [None] * 16
+        v_registers = [0x00] * 16
         vx_index = 0x5
         vy_index = 0x6
         v_registers[vx_index] = 0x14
@@ -167,7 +175,7 @@ class Chip8Test(unittest.TestCase):
         self.assertEqual(expected_program_counter, actual_program_counter)
 
     def test_6xkk(self):
-        v_registers = [None] * 16
+        v_registers = [0x00] * 16
         vx_index = 0xA
         value = 0xEA
         chip8 = self._init_chip8(v_registers=v_registers)
@@ -181,7 +189,7 @@ class Chip8Test(unittest.TestCase):
 
     def test_7xkk(self):
         vx_index = 0x5
-        v_registers = [None] * 16
+        v_registers = [0x00] * 16
         v_registers[vx_index] = 0x38
         value_to_add = 0xAF
         chip8 = self._init_chip8(v_registers=v_registers)
@@ -196,7 +204,7 @@ class Chip8Test(unittest.TestCase):
     def test_8xy0(self):
         vx_index = 0x2
         vy_index = 0x4
-        v_registers = [None] * 16
+        v_registers = [0x00] * 16
         v_registers[vx_index] = 0xAE
         v_registers[vy_index] = 0x13
         chip8 = self._init_chip8(v_registers=v_registers)
@@ -211,7 +219,7 @@ class Chip8Test(unittest.TestCase):
     def test_8xy1(self):
         vx_index = 0x2
         vy_index = 0x4
-        v_registers = [None] * 16
+        v_registers = [0x00] * 16
         v_registers[vx_index] = 0xDE
         v_registers[vy_index] = 0x81
         chip8 = self._init_chip8(v_registers=v_registers)
@@ -226,7 +234,7 @@ class Chip8Test(unittest.TestCase):
     def test_8xy2(self):
         vx_index = 0x3
         vy_index = 0xF
-        v_registers = [None] * 16
+        v_registers = [0x00] * 16
         v_registers[vx_index] = 0xA8
         v_registers[vy_index] = 0x37
         chip8 = self._init_chip8(v_registers=v_registers)
@@ -241,7 +249,7 @@ class Chip8Test(unittest.TestCase):
     def test_8xy3(self):
         vx_index = 0x4
         vy_index = 0x5
-        v_registers = [None] * 16
+        v_registers = [0x00] * 16
         v_registers[vx_index] = 0x23
         v_registers[vy_index] = 0x61
         chip8 = self._init_chip8(v_registers=v_registers)
@@ -256,7 +264,7 @@ class Chip8Test(unittest.TestCase):
     def test_8xy4__lower_than_255(self):
         vx_index = 0x1
         vy_index = 0x6
-        v_registers = [None] * 16
+        v_registers = [0x00] * 16
         v_registers[vx_index] = 0x32
         v_registers[vy_index] = 0xAE
         chip8 = self._init_chip8(v_registers=v_registers)
@@ -275,7 +283,7 @@ class Chip8Test(unittest.TestCase):
     def test_8xy4__greater_than_255(self):
         vx_index = 0x1
         vy_index = 0x6
-        v_registers = [None] * 16
+        v_registers = [0x00] * 16
         v_registers[vx_index] = 0xFB
         v_registers[vy_index] = 0xC4
         chip8 = self._init_chip8(v_registers=v_registers)
@@ -294,7 +302,7 @@ class Chip8Test(unittest.TestCase):
     def test_8xy5__vx_greater_than_vy(self):
         vx_index = 0x1
         vy_index = 0x2
-        v_registers = [None] * 16
+        v_registers = [0x00] * 16
         v_registers[vx_index] = 0x15
         v_registers[vy_index] = 0x04
         chip8 = self._init_chip8(v_registers=v_registers)
@@ -313,7 +321,7 @@ class Chip8Test(unittest.TestCase):
     def test_8xy5__vx_lower_than_vy(self):
         vx_index = 0x1
         vy_index = 0x2
-        v_registers = [None] * 16
+        v_registers = [0x00] * 16
         v_registers[vx_index] = 0x04
         v_registers[vy_index] = 0x15
         chip8 = self._init_chip8(v_registers=v_registers)
@@ -331,7 +339,7 @@ class Chip8Test(unittest.TestCase):
 
     def test_8xy6__least_significant_bit_0(self):
         vx_index = 0x1
-        v_registers = [None] * 16
+        v_registers = [0x00] * 16
         v_registers[vx_index] = 0x5A
         chip8 = self._init_chip8(v_registers=v_registers)
 
@@ -348,7 +356,7 @@ class Chip8Test(unittest.TestCase):
 
     def test_8xy6__least_significant_bit_1(self):
         vx_index = 0x1
-        v_registers = [None] * 16
+        v_registers = [0x00] * 16
         v_registers[vx_index] = 0xAF
         chip8 = self._init_chip8(v_registers=v_registers)
 
@@ -366,7 +374,7 @@ class Chip8Test(unittest.TestCase):
     def test_8xy7__vy_greater_than_vx(self):
         vx_index = 0x1
         vy_index = 0x2
-        v_registers = [None] * 16
+        v_registers = [0x00] * 16
         v_registers[vx_index] = 0xE0
         v_registers[vy_index] = 0xF0
         chip8 = self._init_chip8(v_registers=v_registers)
@@ -385,7 +393,7 @@ class Chip8Test(unittest.TestCase):
     def test_8xy7__vy_lower_than_vx(self):
         vx_index = 0x1
         vy_index = 0x2
-        v_registers = [None] * 16
+        v_registers = [0x00] * 16
         v_registers[vx_index] = 0xE0
         v_registers[vy_index] = 0xC0
         chip8 = self._init_chip8(v_registers=v_registers)
@@ -403,7 +411,7 @@ class Chip8Test(unittest.TestCase):
 
     def test_8xye__least_significant_bit_0(self):
         vx_index = 0x1
-        v_registers = [None] * 16
+        v_registers = [0x00] * 16
         v_registers[vx_index] = 0x52
         chip8 = self._init_chip8(v_registers=v_registers)
 
@@ -418,9 +426,22 @@ class Chip8Test(unittest.TestCase):
         self.assertEqual(expected_vx_value, actual_vx_value)
         self.assertEqual(expected_vf_value, actual_vf_value)
 
+    def test_8xye__overflow(self):
+        vx_index = 0x1
+        v_registers = [0x00] * 16
+        v_registers[vx_index] = 0xC1
+        chip8 = self._init_chip8(v_registers=v_registers)
+
+        chip8._8xye(vx_index)
+
+        expected_vx_value = 0x82
+        actual_vx_value = chip8.memory.v_registers[vx_index]
+
+        self.assertEqual(expected_vx_value, actual_vx_value)
+
     def test_8xye__least_significant_bit_1(self):
         vx_index = 0x1
-        v_registers = [None] * 16
+        v_registers = [0x00] * 16
         v_registers[vx_index] = 0x71
         chip8 = self._init_chip8(v_registers=v_registers)
 
@@ -437,7 +458,7 @@ class Chip8Test(unittest.TestCase):
 
     def test_9xy0__not_equals(self):
         program_counter = 0x35F
-        v_registers = [None] * 16
+        v_registers = [0x00] * 16
         vx_index = 0x5
         vy_index = 0x6
         v_registers[vx_index] = 0x14
@@ -453,7 +474,7 @@ class Chip8Test(unittest.TestCase):
 
     def test_9xy0__equals(self):
         program_counter = 0x35F
-        v_registers = [None] * 16
+        v_registers = [0x00] * 16
         vx_index = 0x5
         vy_index = 0x6
         v_registers[vx_index] = 0x14
@@ -481,7 +502,7 @@ class Chip8Test(unittest.TestCase):
 
     def test_bnnn(self):
         program_counter = 0x7A1
-        v_registers = [None] * 16
+        v_registers = [0x00] * 16
         v_registers[0] = 0x14
         chip8 = self._init_chip8(program_counter, v_registers=v_registers)
 
@@ -495,7 +516,7 @@ class Chip8Test(unittest.TestCase):
 
     @mock.patch('random.getrandbits')
     def test_cxkk(self, mocked_getrandbits):
-        v_registers = [None] * 16
+        v_registers = [0x00] * 16
         vx_index = 0x4
         mocked_getrandbits.return_value = 0xAE
         input_value = 0x45
@@ -510,7 +531,8 @@ class Chip8Test(unittest.TestCase):
 
     def test_dxyn(self):
         screen_proxy_mock = mock.Mock()
-        v_registers = [None] * 16
+        screen_proxy_mock.collision = False
+        v_registers = [0x00] * 16
         vx_index = 0x4
         vy_index = 0x6
         vx_value = 0x15
@@ -529,7 +551,8 @@ class Chip8Test(unittest.TestCase):
 
         chip8._dxyn(vx_index, vy_index, len(sprite))
 
-        screen_proxy_mock.draw_sprite.assert_called_with(sprite, vx_value, vy_value)
+        screen_proxy_mock.draw_sprite.assert_called_with(bytes(sprite), vx_value,
+                                                         vy_value)
 
     def test_ex9e__equals(self):
         keyboard_mock = mock.Mock()
@@ -637,8 +660,19 @@ class Chip8Test(unittest.TestCase):
 
         self.assertEqual(expected_vx_value, actual_vx_value)
 
+    def test_fx0a__presents_screen_before_waiting(self):
+        chip8 = self._init_chip8()
+        chip8.screen_proxy.draw_sprite([0xFF], 0, 0)
+        chip8.keyboard.wait_for_key.side_effect = \
+            lambda: chip8.screen_proxy.screen.refresh.assert_called_once() or 0x1
+
+        chip8._fx0a(0x0)
+
+        chip8.screen_proxy.screen.refresh.assert_called_once_with(
+            [(0, 0, 8, 1)])
+
     def test_fx15(self):
-        v_registers = [None] * 16
+        v_registers = [0x00] * 16
         vx_index = 0x7
         v_registers[vx_index] = 0xAE
         chip8 = self._init_chip8(v_registers=v_registers)
@@ -651,7 +685,7 @@ class Chip8Test(unittest.TestCase):
         self.assertEqual(expected_delay_timer, actual_delay_timer)
 
     def test_fx18(self):
-        v_registers = [None] * 16
+        v_registers = [0x00] * 16
         vx_index = 0x3
         v_registers[vx_index] = 0x45
         chip8 = self._init_chip8(v_registers=v_registers)
@@ -664,7 +698,7 @@ class Chip8Test(unittest.TestCase):
         self.assertEqual(expected_sound_timer, actual_sound_timer)
 
     def test_fx1e(self):
-        v_registers = [None] * 16
+        v_registers = [0x00] * 16
         vx_index = 0x5
         v_registers[vx_index] = 0xAE
         i_register = 0xC15
@@ -694,8 +728,8 @@ class Chip8Test(unittest.TestCase):
         self.assertEqual(expected_i_register, actual_i_register)
 
     def test_fx33(self):
-        v_registers = [None] * 16
-        memory = [None] * 4096
+        v_registers = [0x00] * 16
+        memory = bytearray(4096)
         vx_index = 0x5
         v_registers[vx_index] = 0xAE
         i_register = 0xCE5
@@ -718,9 +752,27 @@ class Chip8Test(unittest.TestCase):
         self.assertEqual(expected_i2_memory_location_value,
                          actual_i2_memory_location_value)
 
+    def test_fx33__invalidates_decoded_instructions(self):
+        v_registers = [0x00] * 16
+        i_register = 0x300
+        chip8 = self._init_chip8(v_registers=v_registers,
+                                 i_register=i_register,
+                                 program_memory=[0x00] * 4096)
+        chip8.memory.decoded_instructions[0x2FA:0x304] = [('6xkk', (0, 0))] * 10
+
+        chip8._fx33(0x0)
+
+        # Fused instructions starting up to five bytes before are invalidated
+        expected_decoded_instructions = [('6xkk', (0, 0))] + [None] * 8 \
+            + [('6xkk', (0, 0))]
+        actual_decoded_instructions = chip8.memory.decoded_instructions[0x2FA:0x304]
+
+        self.assertEqual(expected_decoded_instructions,
+                         actual_decoded_instructions)
+
     def test_fx55(self):
         v_registers = [0x14, 0xF4, 0x61, 0xDE, 0xAE]
-        memory = [None] * 4096
+        memory = bytearray(4096)
         vx_index = 0x4
         i_register = 0x7A4
         chip8 = self._init_chip8(v_registers=v_registers,
@@ -751,10 +803,10 @@ class Chip8Test(unittest.TestCase):
                          actual_i4_memory_location_value)
 
     def test_fx65(self):
-        v_registers = [None] * 16
+        v_registers = [0x00] * 16
         vx_index = 0x4
         i_register = 0x5DA
-        memory = [None] * 4096
+        memory = bytearray(4096)
         memory[0x5DA] = 0x48
         memory[0x5DB] = 0xAE
         memory[0x5DC] = 0x81
@@ -811,3 +863,330 @@ class Chip8Test(unittest.TestCase):
         chip8._execute_operation(operation, parameters)
 
         self.assertTrue(mocked_8xy3.called)
+
+    @mock.patch('chip8_emulator.chip8.Chip8._dxyn')
+    def test_execute_operation__dxyn(self, mocked_dxyn):
+        operation = 'dxyn'
+        parameters = (0x1, 0x2, 0x5)
+        chip8 = self._init_chip8()
+
+        chip8._execute_operation(operation, parameters)
+
+        mocked_dxyn.assert_called_with(0x1, 0x2, 0x5)
+
+    def test_execute_operation__invalid(self):
+        program_memory = [0x00] * 4096
+        program_memory[0x2A0:0x2A2] = [0x81, 0x2F]
+        chip8 = self._init_chip8(program_counter=0x2A0,
+                                 program_memory=program_memory)
+
+        with self.assertRaises(InvalidOpcodeError) as context:
+            chip8._execute_operation(None, ())
+
+        self.assertEqual(0x812F, context.exception.opcode)
+        self.assertEqual(0x2A0, context.exception.address)
+
+    def test_3xkk_1nnn__skipped_jump(self):
+        v_registers = [0x00] * 16
+        v_registers[0x2] = 0x15
+        chip8 = self._init_chip8(program_counter=0x310, v_registers=v_registers)
+
+        chip8._3xkk_1nnn(0x2, 0x15, 0x200)
+
+        self.assertEqual(0x314, chip8.memory.program_counter)
+
+    def test_3xkk_1nnn__jump(self):
+        v_registers = [0x00] * 16
+        v_registers[0x2] = 0x14
+        chip8 = self._init_chip8(program_counter=0x310, v_registers=v_registers)
+
+        chip8._3xkk_1nnn(0x2, 0x15, 0x200)
+
+        self.assertEqual(0x200, chip8.memory.program_counter)
+
+    @mock.patch('chip8_emulator.chip8.sleep')
+    def test_fx07_3xkk_1nnn__timer_running(self, mocked_sleep):
+        program_memory = [0x00] * 4096
+        program_memory[0x21A:0x220] = [0xF0, 0x07, 0x30, 0x00, 0x12, 0x1A]
+        chip8 = self._init_chip8(program_counter=0x21A, delay_timer=0x05,
+                                 program_memory=program_memory)
+
+        chip8._fx07_3xkk_1nnn(0x0, 0x0, 0x00, 0x21A)
+
+        self.assertEqual(0x05, chip8.memory.v_registers[0x0])
+        self.assertEqual(0x21A, chip8.memory.program_counter)
+        self.assertTrue(mocked_sleep.called)
+
+    def test_fx07_3xkk_1nnn__timer_expired(self):
+        chip8 = self._init_chip8(program_counter=0x21A, delay_timer=0x00)
+
+        chip8._fx07_3xkk_1nnn(0x0, 0x0, 0x00, 0x21A)
+
+        self.assertEqual(0x220, chip8.memory.program_counter)
+
+    def test_execute_operation__counts_fused_operations(self):
+        chip8 = self._init_chip8(program_counter=0x310)
+        chip8.count_fused_operations = True
+        chip8._operations = chip8._get_operations()
+
+        chip8._execute_operation('6xkk_6xkk', (0x1, 0x2A, 0x2, 0x2B))
+
+        self.assertEqual(1, chip8.fusion_counts['6xkk_6xkk'])
+        self.assertEqual(0x2A, chip8.memory.v_registers[0x1])
+        self.assertEqual(0x2B, chip8.memory.v_registers[0x2])
+        self.assertEqual(0x314, chip8.memory.program_counter)
+
+    def test_execute_operation__fused_operations_not_counted(self):
+        chip8 = self._init_chip8(program_counter=0x310)
+
+        chip8._execute_operation('6xkk_6xkk', (0x1, 0x2A, 0x2, 0x2B))
+
+        self.assertEqual(0, sum(chip8.fusion_counts.values()))
+
+    def test_annn_dxyn(self):
+        screen_proxy_mock = mock.Mock()
+        screen_proxy_mock.collision = 0x00
+        v_registers = [0x00] * 16
+        v_registers[0x1] = 0x0A
+        v_registers[0x2] = 0x0C
+        chip8 = self._init_chip8(program_counter=0x204, v_registers=v_registers,
+                                 program_memory=[0x00] * 4096)
+        chip8.screen_proxy = screen_proxy_mock
+
+        chip8._annn_dxyn(0x2EA, 0x1, 0x2, 0x6)
+
+        self.assertEqual(0x2EA, chip8.memory.i_register)
+        self.assertEqual(0x208, chip8.memory.program_counter)
+        screen_proxy_mock.draw_sprite.assert_called_with(bytes(6), 0x0A, 0x0C)
+
+    def test_mainloop__fused_instructions_match_single_instructions(self):
+        with open('roms/pong.rom', 'rb') as rom_handle:
+            rom_bytes = rom_handle.read()
+        fused_chip8 = Chip8(mock.Mock(), mock.Mock(),
+                            count_fused_operations=True)
+        fused_chip8.memory.load_rom(rom_bytes)
+        single_chip8 = Chip8(mock.Mock(), mock.Mock())
+        single_chip8.memory.fusion_enabled = False
+        single_chip8.memory.load_rom(rom_bytes)
+        fused_chip8.keyboard.get_pressed_key.return_value = None
+        single_chip8.keyboard.get_pressed_key.return_value = None
+
+        for _ in range(100):
+            fused_chip8.step()
+
+            while single_chip8.memory.program_counter \
+                    != fused_chip8.memory.program_counter:
+                single_chip8.step()
+
+            self.assertEqual(single_chip8.memory.v_registers,
+                             fused_chip8.memory.v_registers)
+            self.assertEqual(single_chip8.memory.i_register,
+                             fused_chip8.memory.i_register)
+
+        self.assertGreater(sum(fused_chip8.fusion_counts.values()), 0)
+
+    @mock.patch('chip8_emulator.delay_timer_thread.DelayTimerThread.start')
+    @mock.patch('chip8_emulator.chip8.Chip8._get_rom_bytes')
+    def test_initialize__invalid_opcode(self, mocked_get_rom_bytes,
+                                        mocked_start):
+        mocked_get_rom_bytes.return_value = bytes([0x60, 0x01, 0x80, 0x08])
+        chip8 = Chip8(mock.Mock(), mock.Mock())
+
+        with self.assertRaises(InvalidOpcodeError) as context:
+            chip8._initialize('broken.rom')
+
+        self.assertEqual(0x8008, context.exception.opcode)
+        self.assertEqual(0x202, context.exception.address)
+        self.assertFalse(mocked_start.called)
+
+    def test_reset__data_after_call_without_return(self):
+        chip8 = Chip8(mock.Mock(), mock.Mock(), headless=True)
+
+        chip8.reset(bytes([0x22, 0x04, 0xFF, 0xFF, 0x12, 0x04]))
+        chip8.step()
+
+        self.assertEqual(0x204, chip8.memory.program_counter)
+
+    @mock.patch('chip8_emulator.chip8.sleep')
+    def test_1nnn__jump_to_itself_sleeps(self, mocked_sleep):
+        chip8 = self._init_chip8(program_counter=0x2E8)
+
+        chip8._1nnn(0x2E8)
+
+        self.assertEqual(0x2E8, chip8.memory.program_counter)
+        mocked_sleep.assert_called_with(chip8._IDLE_SLEEP_SECONDS)
+
+    @mock.patch('chip8_emulator.chip8.sleep')
+    def test_1nnn__jump_to_itself_headless(self, mocked_sleep):
+        chip8 = self._init_chip8(program_counter=0x2E8, delay_timer=0x20)
+        chip8.headless = True
+        chip8.memory._sound_timer = 0x10
+
+        chip8._1nnn(0x2E8)
+
+        self.assertEqual(0x00, chip8.memory._delay_timer)
+        self.assertEqual(0x00, chip8.memory._sound_timer)
+        self.assertFalse(mocked_sleep.called)
+
+    @mock.patch('chip8_emulator.chip8.sleep')
+    def test_1nnn__delay_timer_polling_headless(self, mocked_sleep):
+        program_memory = [0x00] * 4096
+        program_memory[0x21A:0x220] = [0xF3, 0x07, 0x33, 0x02, 0x12, 0x1A]
+        chip8 = self._init_chip8(program_counter=0x21E, delay_timer=0x30,
+                                 program_memory=program_memory)
+        chip8.headless = True
+        chip8.memory._sound_timer = 0x40
+
+        chip8._1nnn(0x21A)
+
+        self.assertEqual(0x02, chip8.memory._delay_timer)
+        self.assertEqual(0x12, chip8.memory._sound_timer)
+        self.assertEqual(0x21A, chip8.memory.program_counter)
+        self.assertFalse(mocked_sleep.called)
+
+    @mock.patch('chip8_emulator.chip8.sleep')
+    def test_1nnn__backward_jump_not_polling(self, mocked_sleep):
+        program_memory = [0x00] * 4096
+        program_memory[0x21A:0x220] = [0xF3, 0x07, 0x34, 0x02, 0x12, 0x1A]
+        chip8 = self._init_chip8(program_counter=0x21E, delay_timer=0x30,
+                                 program_memory=program_memory)
+
+        chip8._1nnn(0x21A)
+
+        self.assertEqual(0x21A, chip8.memory.program_counter)
+        self.assertFalse(mocked_sleep.called)
+
+    def test_fx55__out_of_bounds(self):
+        v_registers = [0x14, 0xF4, 0x61]
+        chip8 = self._init_chip8(v_registers=v_registers,
+                                 i_register=0xFFE,
+                                 program_memory=bytearray(4096))
+
+        with self.assertRaises(MemoryAccessError):
+            chip8._fx55(0x2)
+
+        self.assertEqual(0x200, chip8.memory.program_counter)
+
+    @mock.patch('random.getrandbits', return_value=0x5A)
+    def test_fork__runs_like_the_parent(self, mocked_getrandbits):
+        with open('roms/pong.rom', 'rb') as rom_handle:
+            rom_bytes = rom_handle.read()
+        chip8 = Chip8(mock.Mock(), mock.Mock(), headless=True)
+        chip8.memory.load_rom(rom_bytes)
+
+        for _ in range(50):
+            chip8.step()
+
+        forked_chip8 = chip8.fork(mock.Mock())
+
+        for _ in range(50):
+            chip8.step()
+            forked_chip8.step()
+
+        self.assertEqual(chip8.memory.program_counter,
+                         forked_chip8.memory.program_counter)
+        self.assertEqual(chip8.memory.v_registers,
+                         forked_chip8.memory.v_registers)
+        self.assertEqual(chip8.screen_proxy.get_framebuffer(),
+                         forked_chip8.screen_proxy.get_framebuffer())
+        self.assertIsNot(chip8.memory, forked_chip8.memory)
+        self.assertEqual(forked_chip8.memory,
+                         forked_chip8._operations['6xkk'].__self__.memory)
+
+    def test_fork__tiered_executor_shares_compiled_blocks(self):
+        chip8 = self._init_chip8(program_memory=[0x00] * 0x200 + [0x60, 0x01, 0x12, 0x00])
+        chip8.tiered_executor = TieredExecutor(chip8, 0)
+        chip8.tiered_executor.step()
+
+        forked_chip8 = chip8.fork()
+
+        self.assertIsNot(chip8.tiered_executor, forked_chip8.tiered_executor)
+        self.assertIs(forked_chip8, forked_chip8.tiered_executor.chip8)
+        self.assertIsNotNone(
+            forked_chip8.tiered_executor.block_cache.get_compiled_block(0x200))
+
+    @mock.patch('random.getrandbits', return_value=0x5A)
+    def test_reset__runs_like_a_new_machine(self, mocked_getrandbits):
+        with open('roms/pong.rom', 'rb') as rom_handle:
+            rom_bytes = rom_handle.read()
+        keyboard_mock = mock.Mock()
+        chip8 = Chip8(mock.Mock(), keyboard_mock, headless=True)
+        chip8.memory.load_rom(rom_bytes)
+
+        for _ in range(50):
+            chip8.step()
+
+        memory = chip8.memory
+        keyboard_mock.pressed_key = 0x4
+        chip8.reset(rom_bytes)
+        new_chip8 = Chip8(mock.Mock(), mock.Mock(), headless=True)
+        new_chip8.memory.load_rom(rom_bytes)
+
+        for _ in range(50):
+            chip8.step()
+            new_chip8.step()
+
+        self.assertIs(memory, chip8.memory)
+        self.assertIsNone(keyboard_mock.pressed_key)
+        self.assertEqual(new_chip8.memory.program_memory,
+                         chip8.memory.program_memory)
+        self.assertEqual(new_chip8.memory.v_registers,
+                         chip8.memory.v_registers)
+        self.assertEqual(new_chip8.screen_proxy.get_framebuffer(),
+                         chip8.screen_proxy.get_framebuffer())
+
+    @mock.patch('chip8_emulator.rom_image.load_compiled_blocks')
+    def test_reset__loads_compiled_blocks_once(self,
+                                               mocked_load_compiled_blocks):
+        mocked_load_compiled_blocks.return_value = None
+        rom_image.clear_rom_images()
+        self.addCleanup(rom_image.clear_rom_images)
+        chip8 = Chip8(mock.Mock(), mock.Mock(), headless=True)
+
+        chip8.reset(bytes([0x12, 0x00]))
+        chip8.reset(bytes([0x12, 0x00]))
+
+        mocked_load_compiled_blocks.assert_called_once_with(bytes([0x12, 0x00]),
+                                                            None)
+
+    def test_reset__invalid_rom(self):
+        chip8 = self._init_chip8()
+
+        with self.assertRaises(InvalidOpcodeError):
+            chip8.reset(bytes([0xFF, 0xFF]))
+
+    def test_stop(self):
+        chip8 = Chip8(mock.Mock(), mock.Mock())
+        chip8.delay_timer_thread.start()
+
+        chip8.stop()
+
+        self.assertFalse(chip8.delay_timer_thread.is_alive())
+
+    def test_fx55__triggers_watchpoint(self):
+        v_registers = [0x14, 0xF4, 0x61]
+        chip8 = self._init_chip8(v_registers=v_registers, i_register=0x7A4)
+        callback = mock.Mock()
+        watchpoint = chip8.memory.add_watchpoint(0x7A5, 0x7A6, callback,
+                                                 value=0xF4)
+
+        chip8._fx55(0x2)
+
+        callback.assert_called_once_with(watchpoint, 0x7A5, 0x7A6)
+        self.assertEqual([0x7], chip8.memory.get_dirty_pages())
+
+    def test_get_presenting_step__presents_once_per_frame(self):
+        chip8 = self._init_chip8()
+        step = mock.Mock(side_effect=lambda: chip8.screen_proxy.draw_sprite(
+            [0x80], 0, 0))
+        presenting_step = chip8._get_presenting_step(step)
+
+        presenting_step()
+        presenting_step()
+        chip8.delay_timer_thread.frame_count += 1
+        presenting_step()
+        presenting_step()
+
+        self.assertEqual(4, step.call_count)
+        chip8.screen_proxy.screen.refresh.assert_called_once_with(
+            [(0, 0, 8, 1)] * 3)
@@ -0,0 +1,121 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from chip8_emulator import save_state
+from chip8_emulator.chip8 import Chip8
+from chip8_emulator.memory_profiler import MemoryProfiler
+
+
+class MemoryProfilerTest(unittest.TestCase):
+
+    def _init_chip8(self, rom_bytes, profile_memory=True):
+        keyboard_mock = mock.Mock()
+        keyboard_mock.pressed_key = None
+        keyboard_mock.get_pressed_key.return_value = None
+        chip8 = Chip8(mock.Mock(), keyboard_mock, headless=True,
+                      profile_memory=profile_memory)
+        chip8.reset(rom_bytes)
+
+        return chip8
+
+    def test_init__disabled_profiler_keeps_operations(self):
+        chip8 = self._init_chip8(b'\x12\x00', profile_memory=False)
+        profiler = MemoryProfiler(chip8)
+
+        self.assertIsNone(chip8.memory_profiler)
+        self.assertFalse(profiler.enabled)
+        self.assertEqual(chip8._get_operations(), chip8._operations)
+
+    def test_step__counts_fetches_reads_and_writes(self):
+        rom_bytes = bytes([
+            0x60, 0x7B,  # V0 = 123
+            0xA3, 0x00,  # I = 0x300
+            0xF0, 0x33,  # BCD of V0 at I
+            0xF2, 0x65,  # V0..V2 = I
+            0xD0, 0x13,  # Draw 3 bytes at I
+            0x12, 0x0A,  # Loop forever
+        ])
+        chip8 = self._init_chip8(rom_bytes)
+        profiler = chip8.memory_profiler
+
+        for _ in range(5):
+            profiler.step()
+
+        self.assertEqual([1] * 10, list(profiler.fetch_counts[0x200:0x20A]))
+        self.assertEqual([1, 1, 1, 0], list(profiler.write_counts[0x300:0x304]))
+        self.assertEqual([2, 2, 2, 0], list(profiler.read_counts[0x300:0x304]))
+        self.assertEqual(bytes([1, 2, 3]), bytes(chip8.memory.v_registers[:3]))
+
+        report = profiler.get_report()
+
+        self.assertEqual((10, 6, 3),
+                         (report['fetches'], report['reads'], report['writes']))
+        self.assertEqual({'address': 0x300, 'fetches': 0, 'reads': 2,
+                          'writes': 1}, report['addresses'][-3])
+
+    def test_step__counts_fused_instructions(self):
+        chip8 = self._init_chip8(bytes([0xA2, 0x00, 0xD0, 0x02, 0x12, 0x04]))
+        profiler = chip8.memory_profiler
+
+        profiler.step()
+
+        self.assertEqual('annn_dxyn', chip8.memory.decoded_instructions[0x200][0])
+        self.assertEqual([1] * 4, list(profiler.fetch_counts[0x200:0x204]))
+        self.assertEqual([1] * 2, list(profiler.read_counts[0x200:0x202]))
+
+    def test_disable(self):
+        chip8 = self._init_chip8(bytes([0xA3, 0x00, 0xF0, 0x33, 0x12, 0x04]))
+        profiler = chip8.memory_profiler
+
+        profiler.disable()
+        chip8.step()
+        chip8.step()
+
+        self.assertFalse(profiler.enabled)
+        self.assertEqual(chip8._get_operations(), chip8._operations)
+        self.assertEqual(0, sum(profiler.get_access_counts()))
+
+    def test_reset__clears_counts(self):
+        chip8 = self._init_chip8(bytes([0x12, 0x00]))
+        chip8.memory_profiler.step()
+
+        chip8.reset(bytes([0x12, 0x00]))
+
+        self.assertEqual(0, sum(chip8.memory_profiler.get_access_counts()))
+
+    def test_load_state__not_counted_as_writes(self):
+        chip8 = self._init_chip8(bytes([0xA3, 0x00, 0xF0, 0x33, 0x12, 0x04]))
+        profiler = chip8.memory_profiler
+
+        for _ in range(3):
+            profiler.step()
+
+        with tempfile.TemporaryDirectory() as directory:
+            state_path = os.path.join(directory, 'state.c8s')
+            save_state.save_state(chip8, state_path)
+            save_state.load_state(chip8, state_path)
+
+        self.assertEqual(3, profiler.get_report()['writes'])
+        self.assertEqual([1, 1, 1], list(profiler.write_counts[0x300:0x303]))
+
+    def test_save_report__save_heatmap(self):
+        with open('roms/pong.rom', 'rb') as rom_handle:
+            chip8 = self._init_chip8(rom_handle.read())
+        profiler = chip8.memory_profiler
+
+        for _ in range(500):
+            profiler.step()
+
+        with tempfile.TemporaryDirectory() as directory:
+            report_path = os.path.join(directory, 'report.json')
+            heatmap_path = os.path.join(directory, 'heatmap.png')
+            profiler.save_report(report_path)
+            profiler.save_heatmap(heatmap_path)
+
+            with open(report_path) as report_handle:
+                report = json.load(report_handle)
+
+            self.assertEqual(profiler.get_report(), report)
+            self.assertGreater(os.path.getsize(heatmap_path), 0)
@@ -1,6 +1,10 @@
 import unittest
 from unittest import mock
 from chip8_emulator.memory import Memory
+from chip8_emulator.rom_image import get_rom_image
+from chip8_emulator.exceptions import (InvalidDigitSpriteError,
+                                       MemoryAccessError, StackOverflowError,
+                                       StackUnderflowError)
 
 
 class MemoryTest(unittest.TestCase):
@@ -34,6 +38,17 @@ class MemoryTest(unittest.TestCase):
 
         self.assertEqual(expected_opcode, actual_opcode)
 
+    def test_get_current_opcode_int(self):
+        program_memory = [None] * 4096
+        program_counter = 0x30F
+        program_memory[0x30E:0x312] = [0xA2, 0xEA, 0xDA, 0xB6]
+        memory = self._init_memory(program_memory, program_counter)
+
+        expected_opcode = 0xEADA
+        actual_opcode = memory.get_current_opcode_int()
+
+        self.assertEqual(expected_opcode, actual_opcode)
+
     def test_load_rom(self):
         memory = self._init_memory()
         rom_path = 'roms/pong.rom'
@@ -68,7 +83,7 @@ class MemoryTest(unittest.TestCase):
             0xD4, 0x55, 0x0, 0xEE, 0x80, 0x80, 0x80, 0x80, 0x80, 0x80,
             0x80, 0x0, 0x0, 0x0, 0x0, 0x0
         ]
-        expected_program_memory = [0x00] * 0xE9F
+        expected_program_memory = bytearray(0x1000)
         expected_program_memory[0x200:0x200+len(expected_rom)] = expected_rom
         actual_program_memory = memory.program_memory
 
@@ -78,10 +93,64 @@ class MemoryTest(unittest.TestCase):
 
         self.assertEqual(expected_program_memory, actual_program_memory)
 
+    def test_load_rom__decodes_instructions(self):
+        memory = self._init_memory()
+        memory.fusion_enabled = False
+        rom_bytes = bytes([0x6A, 0x02, 0xA2, 0xEA, 0xDA, 0xB6])
+
+        memory.load_rom(rom_bytes)
+
+        self.assertEqual(('6xkk', (0xA, 0x02)), memory.decoded_instructions[0x200])
+        self.assertEqual(('annn', (0x2EA,)), memory.decoded_instructions[0x202])
+        self.assertEqual(('dxyn', (0xA, 0xB, 0x6)), memory.decoded_instructions[0x204])
+
+    def test_load_rom__fuses_instructions(self):
+        memory = self._init_memory()
+        rom_bytes = bytes([0x6A, 0x02, 0xA2, 0xEA, 0xDA, 0xB6])
+
+        memory.load_rom(rom_bytes)
+
+        self.assertEqual(('6xkk', (0xA, 0x02)), memory.decoded_instructions[0x200])
+        self.assertEqual(('annn_dxyn', (0x2EA, 0xA, 0xB, 0x6)),
+                         memory.decoded_instructions[0x202])
+        self.assertEqual(('dxyn', (0xA, 0xB, 0x6)), memory.decoded_instructions[0x204])
+
+    def test_load_rom__fuses_longest_sequence(self):
+        memory = self._init_memory()
+        rom_bytes = bytes([0xF0, 0x07, 0x30, 0x00, 0x12, 0x00])
+
+        memory.load_rom(rom_bytes)
+
+        self.assertEqual(('fx07_3xkk_1nnn', (0x0, 0x0, 0x00, 0x200)),
+                         memory.decoded_instructions[0x200])
+        self.assertEqual(('3xkk_1nnn', (0x0, 0x00, 0x200)),
+                         memory.decoded_instructions[0x202])
+
+    def test_get_current_instruction(self):
+        memory = self._init_memory(program_counter=0x202)
+        memory.load_rom(bytes([0x6A, 0x02, 0xA2, 0xEA]))
+
+        expected_instruction = ('annn', (0x2EA,))
+        actual_instruction = memory.get_current_instruction()
+
+        self.assertEqual(expected_instruction, actual_instruction)
+
+    def test_notify_program_memory_write(self):
+        memory = self._init_memory(program_counter=0x202)
+        memory.load_rom(bytes([0x6A, 0x02, 0xA2, 0xEA, 0xDA, 0xB6]))
+        memory.program_memory[0x203:0x205] = [0x12, 0x61]
+
+        memory.notify_program_memory_write(0x203, 0x205)
+
+        self.assertIsNone(memory.decoded_instructions[0x200])
+        self.assertIsNone(memory.decoded_instructions[0x202])
+        self.assertIsNone(memory.decoded_instructions[0x204])
+        self.assertEqual(('annn', (0x212,)), memory.get_current_instruction())
+
     def test_load_digit_sprites(self):
         memory = self._init_memory()
 
-        expected_program_memory = [0x00] * 0xE9F
+        expected_program_memory = bytearray(0x1000)
         expected_program_memory[0x000:0x050] = [
             0xF0, 0x90, 0x90, 0x90, 0xF0,  # 0
             0x20, 0x60, 0x20, 0x20, 0x70,  # 1
@@ -113,6 +182,15 @@ class MemoryTest(unittest.TestCase):
 
         self.assertEqual(expected_sprite_address, actual_sprite_address)
 
+    def test_get_address_of_preloaded_sprite__not_a_digit(self):
+        memory = self._init_memory(program_counter=0x2A4)
+
+        with self.assertRaises(InvalidDigitSpriteError) as context:
+            memory.get_address_of_preloaded_sprite(0x20)
+
+        self.assertEqual(0x20, context.exception.digit)
+        self.assertEqual(0x2A4, context.exception.address)
+
     def test_decrement_delay_timer__greater_than_0(self):
         initial_delay_timer = 174
         memory = self._init_memory(delay_timer=initial_delay_timer)
@@ -134,3 +212,250 @@ class MemoryTest(unittest.TestCase):
         actual_delay_timer = memory._delay_timer
 
         self.assertEqual(expected_delay_timer, actual_delay_timer)
+
+    def test_fast_forward_timers(self):
+        memory = self._init_memory(delay_timer=0x30)
+        memory._sound_timer = 0x10
+
+        memory.fast_forward_timers(0x05)
+
+        self.assertEqual(0x05, memory._delay_timer)
+        self.assertEqual(0x00, memory._sound_timer)
+
+    def test_fast_forward_timers__already_expired(self):
+        memory = self._init_memory(delay_timer=0x02)
+        memory._sound_timer = 0x10
+
+        memory.fast_forward_timers(0x05)
+
+        self.assertEqual(0x02, memory._delay_timer)
+        self.assertEqual(0x10, memory._sound_timer)
+
+    def test_read_bytes(self):
+        memory = self._init_memory()
+        memory.program_memory[0x300:0x303] = b'\x12\x34\x56'
+
+        actual_bytes = memory.read_bytes(0x300, 3)
+        memory.program_memory[0x301] = 0x78
+
+        self.assertIsInstance(actual_bytes, memoryview)
+        self.assertEqual(b'\x12\x78\x56', actual_bytes)
+
+    def test_read_bytes__out_of_bounds(self):
+        memory = self._init_memory()
+
+        with self.assertRaises(MemoryAccessError):
+            memory.read_bytes(0xFFE, 3)
+
+    def test_write_bytes(self):
+        memory = self._init_memory()
+        listener = mock.Mock()
+        memory.add_program_memory_write_listener(listener)
+
+        memory.write_bytes(0x300, [0x12, 0x34])
+
+        self.assertEqual(b'\x12\x34', memory.program_memory[0x300:0x302])
+        listener.assert_called_with(0x300, 0x302)
+
+    def test_write_bytes__out_of_bounds(self):
+        memory = self._init_memory()
+
+        with self.assertRaises(MemoryAccessError):
+            memory.write_bytes(-1, [0x12, 0x34])
+
+    def test_add_to_stack(self):
+        memory = self._init_memory()
+
+        memory.add_to_stack(0x204)
+        memory.add_to_stack(0x3A2)
+
+        self.assertEqual([0x204, 0x3A2], memory.get_stack_addresses())
+        self.assertEqual(0x3A2, memory.pop_from_stack())
+        self.assertEqual([0x204], memory.get_stack_addresses())
+
+    def test_add_to_stack__overflow(self):
+        memory = self._init_memory(program_counter=0x2F0)
+
+        for _ in range(memory.STACK_DEPTH):
+            memory.add_to_stack(0x2F0)
+
+        with self.assertRaises(StackOverflowError) as context:
+            memory.add_to_stack(0x2F0)
+
+        self.assertEqual(0x2F0, context.exception.address)
+        self.assertEqual(memory.STACK_DEPTH, memory.stack_pointer)
+
+    def test_pop_from_stack__underflow(self):
+        memory = self._init_memory(program_counter=0x2F0)
+
+        with self.assertRaises(StackUnderflowError) as context:
+            memory.pop_from_stack()
+
+        self.assertEqual(0x2F0, context.exception.address)
+
+    def test_slots(self):
+        memory = self._init_memory()
+
+        with self.assertRaises(AttributeError):
+            memory.sound_timer = 0x10
+
+    def test_fork(self):
+        memory = self._init_memory(delay_timer=0x20)
+        memory.load_rom(bytes([0x60, 0x05, 0x12, 0x00]))
+        memory.add_to_stack(0x204)
+        memory.v_registers[0x3] = 0x33
+
+        forked_memory = memory.fork()
+        forked_memory.write_bytes(0x200, [0x61, 0x07])
+        forked_memory.v_registers[0x3] = 0x44
+        forked_memory.add_to_stack(0x206)
+
+        self.assertEqual(('6xkk', (0x0, 0x05)),
+                         memory.decode_opcode(0x200))
+        self.assertEqual(('6xkk', (0x1, 0x07)),
+                         forked_memory.get_current_instruction())
+        self.assertEqual(0x33, memory.v_registers[0x3])
+        self.assertEqual([0x204], memory.get_stack_addresses())
+        self.assertEqual([0x204, 0x206], forked_memory.get_stack_addresses())
+        self.assertEqual((0x20, 0x00), forked_memory.get_timers())
+
+    def test_reset(self):
+        memory = self._init_memory(delay_timer=0x20)
+        memory.load_rom(bytes([0x60, 0x05, 0x12, 0x00]))
+        memory.add_to_stack(0x204)
+        memory.v_registers[0x3] = 0x33
+        memory.i_register = 0x300
+        memory.program_counter = 0x202
+        program_memory = memory.program_memory
+        v_registers = memory.v_registers
+
+        memory.reset()
+
+        expected_memory = Memory()
+
+        self.assertIs(program_memory, memory.program_memory)
+        self.assertIs(v_registers, memory.v_registers)
+        self.assertEqual(expected_memory.program_memory, memory.program_memory)
+        self.assertEqual(expected_memory.v_registers, memory.v_registers)
+        self.assertEqual([], memory.get_stack_addresses())
+        self.assertEqual(0x000, memory.i_register)
+        self.assertEqual(0x200, memory.program_counter)
+        self.assertEqual((0x00, 0x00), memory.get_timers())
+        self.assertIsNone(memory.decoded_instructions[0x200])
+
+    def test_reset__without_clearing_program_memory(self):
+        memory = self._init_memory()
+        memory.load_rom_image(get_rom_image(bytes([0x60, 0x05, 0x12, 0x02])))
+        program_memory = memory.program_memory
+        memory.v_registers[0x3] = 0x33
+
+        memory.reset(clear_program_memory=False)
+
+        self.assertIs(program_memory, memory.program_memory)
+        self.assertEqual(0x00, memory.v_registers[0x3])
+        self.assertEqual(0x200, memory.program_counter)
+
+    def test_write_bytes__marks_dirty_pages(self):
+        memory = self._init_memory()
+        memory.clear_dirty_pages()
+
+        memory.write_bytes(0x2FF, [0x12, 0x34])
+        memory.write_bytes(0x7A0, [0x56])
+
+        self.assertEqual([0x2, 0x3, 0x7], memory.get_dirty_pages())
+
+        memory.clear_dirty_pages()
+
+        self.assertEqual([], memory.get_dirty_pages())
+
+    def test_load_bytes__not_a_program_write(self):
+        memory = self._init_memory()
+        memory_listener = mock.Mock()
+        program_write_listener = mock.Mock()
+        memory.add_program_memory_write_listener(memory_listener)
+        memory.add_program_memory_write_listener(program_write_listener,
+                                                 program_writes_only=True)
+
+        memory.load_bytes(0x300, [0x01, 0x02])
+        memory.write_bytes(0x304, [0x03])
+
+        memory_listener.assert_has_calls([mock.call(0x300, 0x302),
+                                          mock.call(0x304, 0x305)])
+        program_write_listener.assert_called_once_with(0x304, 0x305)
+        self.assertEqual(bytes([0x01, 0x02]),
+                         bytes(memory.program_memory[0x300:0x302]))
+
+    def test_remove_program_memory_write_listener__program_writes_only(self):
+        memory = self._init_memory()
+        listener = mock.Mock()
+        memory.add_program_memory_write_listener(listener,
+                                                 program_writes_only=True)
+
+        memory.remove_program_memory_write_listener(listener)
+        memory.write_bytes(0x300, [0x01])
+
+        self.assertFalse(listener.called)
+
+    def test_add_watchpoint__range(self):
+        memory = self._init_memory()
+        callback = mock.Mock()
+        watchpoint = memory.add_watchpoint(0x300, 0x304, callback)
+
+        memory.write_bytes(0x2FE, [0x01, 0x02, 0x03])
+        memory.write_bytes(0x304, [0x04])
+
+        callback.assert_called_once_with(watchpoint, 0x300, 0x301)
+
+    def test_add_watchpoint__value(self):
+        memory = self._init_memory()
+        callback = mock.Mock()
+        watchpoint = memory.add_watchpoint(0x300, 0x302, callback, value=0x2A)
+
+        memory.write_bytes(0x300, [0x01, 0x02])
+        memory.write_bytes(0x301, [0x2A])
+
+        callback.assert_called_once_with(watchpoint, 0x301, 0x302)
+
+    def test_remove_watchpoint(self):
+        memory = self._init_memory()
+        callback = mock.Mock()
+        watchpoint = memory.add_watchpoint(0x300, 0x304, callback)
+
+        memory.remove_watchpoint(watchpoint)
+        memory.write_bytes(0x300, [0x01])
+
+        self.assertFalse(callback.called)
+        self.assertEqual([], memory._program_write_listeners)
+
+    def test_add_watchpoint__not_fired_by_loads_and_resets(self):
+        memory = self._init_memory()
+        callback = mock.Mock()
+        memory.add_watchpoint(0x000, 0x1000, callback)
+
+        memory.load_rom(bytes([0x60, 0x05, 0x12, 0x02]))
+        memory.load_rom_image(get_rom_image(bytes([0x12, 0x00])))
+        memory.load_bytes(0x300, [0x01])
+        memory.reset()
+
+        self.assertFalse(callback.called)
+
+        memory.write_bytes(0x300, [0x01])
+
+        callback.assert_called_once()
+
+    def test_reset__notifies_after_loading_digit_sprites(self):
+        memory = self._init_memory()
+        notified_sprites = []
+        memory.add_program_memory_write_listener(
+            lambda address_start, address_end: notified_sprites.append(
+                tuple(memory.program_memory[0x000:0x005])))
+
+        memory.reset()
+
+        self.assertEqual([Memory.PRELOADED_SPRITES[0x000]], notified_sprites)
+
+    def test_add_watchpoint__out_of_bounds(self):
+        memory = self._init_memory()
+
+        with self.assertRaises(MemoryAccessError):
+            memory.add_watchpoint(0xFFE, 0x1002, mock.Mock())
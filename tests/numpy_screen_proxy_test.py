@@ -0,0 +1,137 @@
+import unittest
+from unittest import mock
+from unittest.mock import Mock
+from chip8_emulator.chip8 import Chip8
+from chip8_emulator.numpy_screen_proxy import NumpyScreenProxy, numpy
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class NumpyScreenProxyTest(unittest.TestCase):
+
+    def _init_screen_proxy(self):
+        screen_proxy = NumpyScreenProxy(Mock())
+        screen_proxy.init_screen()
+
+        return screen_proxy
+
+    def test_draw_sprite(self):
+        screen_proxy = self._init_screen_proxy()
+
+        screen_proxy.draw_sprite(b'\xC3\x81', 10, 20)
+
+        self.assertEqual(0xC3 << 46, screen_proxy.get_logical_row(20))
+        self.assertEqual(0x81 << 46, screen_proxy.get_logical_row(21))
+        self.assertFalse(screen_proxy.collision)
+        screen_proxy.screen.draw_pixel.assert_any_call(10, 20)
+        screen_proxy.screen.draw_pixel.assert_any_call(17, 21)
+        self.assertEqual(6, screen_proxy.screen.draw_pixel.call_count)
+
+        screen_proxy.present()
+
+        screen_proxy.screen.refresh.assert_called_once_with([(10, 20, 8, 2)])
+
+    def test_draw_sprite__collision(self):
+        screen_proxy = self._init_screen_proxy()
+        screen_proxy.draw_sprite(b'\xFF', 0, 0)
+
+        screen_proxy.draw_sprite(memoryview(b'\x01'), 0, 0)
+
+        self.assertTrue(screen_proxy.collision)
+        self.assertEqual(0xFE << 56, screen_proxy.get_logical_row(0))
+        screen_proxy.screen.clear_pixel.assert_called_once_with(7, 0)
+
+    def test_draw_sprite__wraps_around(self):
+        screen_proxy = self._init_screen_proxy()
+
+        screen_proxy.draw_sprite(b'\xFF\x81', 64 + 60, 31)
+
+        self.assertEqual((0xF << 60) | 0xF, screen_proxy.get_logical_row(31))
+        self.assertEqual((0x1 << 60) | 0x8, screen_proxy.get_logical_row(0))
+
+    def test_draw_sprite__wraps_around_with_collision(self):
+        screen_proxy = self._init_screen_proxy()
+        screen_proxy.draw_sprite(b'\xFF\x81', 60, 31)
+
+        screen_proxy.draw_sprite(b'\x81', 60, 31)
+
+        self.assertTrue(screen_proxy.collision)
+        self.assertEqual((0xE << 60) | 0x7, screen_proxy.get_logical_row(31))
+        self.assertEqual((0x1 << 60) | 0x8, screen_proxy.get_logical_row(0))
+        screen_proxy.screen.clear_pixel.assert_any_call(60, 31)
+        screen_proxy.screen.clear_pixel.assert_any_call(3, 31)
+
+    def test_get_framebuffer_array(self):
+        screen_proxy = self._init_screen_proxy()
+        framebuffer_array = screen_proxy.get_framebuffer_array()
+
+        screen_proxy.draw_sprite(b'\x80', 3, 2)
+
+        self.assertEqual((32, 64), framebuffer_array.shape)
+        self.assertEqual(1, framebuffer_array[2, 3])
+        self.assertEqual(1, framebuffer_array.sum())
+        self.assertFalse(framebuffer_array.flags.writeable)
+
+    def test_clear_screen(self):
+        screen_proxy = self._init_screen_proxy()
+        screen_proxy.draw_sprite(b'\xFF', 0, 0)
+
+        screen_proxy.clear_screen()
+
+        self.assertEqual((0,) * 32, screen_proxy.get_logical_rows())
+        screen_proxy.screen.clear.assert_called()
+
+    def test_get_framebuffer__set_framebuffer(self):
+        framebuffer = bytearray(256)
+        framebuffer[0x09] = 0xFF
+        framebuffer[0x11] = 0x81
+        screen_proxy = self._init_screen_proxy()
+
+        screen_proxy.set_framebuffer(framebuffer)
+
+        self.assertEqual(bytes(framebuffer), screen_proxy.get_framebuffer())
+        screen_proxy.screen.draw_pixel.assert_any_call(8, 1)
+        screen_proxy.screen.draw_pixel.assert_any_call(15, 2)
+        self.assertEqual(10, screen_proxy.screen.draw_pixel.call_count)
+
+    def test_fork(self):
+        screen_proxy = self._init_screen_proxy()
+        screen_proxy.draw_sprite(b'\xFF', 0, 0)
+
+        forked_screen_proxy = screen_proxy.fork()
+        forked_screen_proxy.draw_sprite(b'\x81', 0, 2)
+
+        self.assertEqual(0xFF << 56, forked_screen_proxy.get_logical_row(0))
+        self.assertEqual(0, screen_proxy.get_logical_row(2))
+
+    @mock.patch('random.getrandbits')
+    def test_chip8__runs_like_the_python_engine(self, mocked_getrandbits):
+        mocked_getrandbits.return_value = 0x5A
+
+        with open('roms/pong.rom', 'rb') as rom_handle:
+            rom_bytes = rom_handle.read()
+
+        chip8s = [Chip8(Mock(), Mock(), headless=True, screen_engine=engine)
+                  for engine in ('python', 'numpy')]
+
+        for chip8 in chip8s:
+            chip8.keyboard.get_pressed_key.return_value = None
+            chip8.reset(rom_bytes)
+
+            for _ in range(2000):
+                chip8.step()
+
+        python_chip8, numpy_chip8 = chip8s
+
+        self.assertIsInstance(numpy_chip8.screen_proxy, NumpyScreenProxy)
+        self.assertEqual(python_chip8.screen_proxy.get_framebuffer(),
+                         numpy_chip8.screen_proxy.get_framebuffer())
+        self.assertEqual(python_chip8.memory.v_registers,
+                         numpy_chip8.memory.v_registers)
+
+
+class NumpyScreenProxyWithoutNumpyTest(unittest.TestCase):
+
+    @mock.patch('chip8_emulator.numpy_screen_proxy.numpy', None)
+    def test_init__numpy_not_installed(self):
+        with self.assertRaises(ImportError):
+            NumpyScreenProxy(Mock())
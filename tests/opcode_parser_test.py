@@ -539,3 +539,53 @@ class OpcodeParserTest(unittest.TestCase):
         actual = opcode_parser._get_byte_last_nibble_hex(byte)
 
         self.assertEqual(expected, actual)
+
+    def test_decode_operation_and_parameters__8xy3(self):
+        opcode = 0x8BA3
+
+        expected = ('8xy3', (0xB, 0xA))
+        actual = opcode_parser.decode_operation_and_parameters(opcode)
+
+        self.assertEqual(expected, actual)
+
+    def test_decode_operation_and_parameters__8xy6(self):
+        opcode = 0x8276
+
+        expected = ('8xy6', (0x2,))
+        actual = opcode_parser.decode_operation_and_parameters(opcode)
+
+        self.assertEqual(expected, actual)
+
+    def test_decode_operation_and_parameters__dxyn(self):
+        opcode = 0xDF08
+
+        expected = ('dxyn', (0xF, 0x0, 0x8))
+        actual = opcode_parser.decode_operation_and_parameters(opcode)
+
+        self.assertEqual(expected, actual)
+
+    def test_decode_operation_and_parameters__invalid(self):
+        invalid_opcodes = [0x0123, 0x5121, 0x8008, 0x9ABF, 0xE19F, 0xF2FF]
+
+        for opcode in invalid_opcodes:
+            expected = opcode_parser.INVALID_OPERATION
+            actual = opcode_parser.decode_operation_and_parameters(opcode)
+
+            self.assertEqual(expected, actual)
+
+    def test_decode_table__matches_parser(self):
+        single_parameter_operations = ('8xy6', '8xye')
+
+        for opcode_int, (operation, parameters) in enumerate(opcode_parser.DECODE_TABLE):
+            if operation is None:
+                continue
+
+            opcode = opcode_int.to_bytes(2, byteorder='big')
+            expected_operation, expected_parameters = \
+                opcode_parser.parse_operation_and_parameters(opcode)
+
+            if expected_operation in single_parameter_operations:
+                expected_parameters = expected_parameters[:1]
+
+            self.assertEqual(expected_operation, operation)
+            self.assertEqual(tuple(expected_parameters), parameters)
@@ -0,0 +1,60 @@
+import os
+import unittest
+from unittest import mock
+import pygame
+from chip8_emulator.pygame_screen import PygameScreen
+
+
+class PygameScreenTest(unittest.TestCase):
+
+    def setUp(self):
+        environment_patcher = mock.patch.dict(os.environ,
+                                              {'SDL_VIDEODRIVER': 'dummy'})
+        environment_patcher.start()
+        self.addCleanup(environment_patcher.stop)
+        pygame.display.init()
+        self.addCleanup(pygame.display.quit)
+
+    def _init_screen(self, *arguments):
+        screen = PygameScreen(*arguments)
+        screen.width = 64
+        screen.height = 32
+        screen.init()
+
+        return screen
+
+    def test_init(self):
+        screen = self._init_screen()
+
+        self.assertEqual((512, 256), screen.screen.get_size())
+        self.assertEqual((64, 32), screen.framebuffer_surface.get_size())
+
+    def test_init__window_size(self):
+        screen = self._init_screen(8, (640, 480))
+
+        self.assertEqual((640, 480), screen.screen.get_size())
+
+    def test_draw_pixel__refresh(self):
+        screen = self._init_screen(4)
+        screen.draw_pixel(3, 2)
+        screen.draw_pixel(4, 2)
+        screen.clear_pixel(4, 2)
+
+        self.assertEqual((0, 0, 0), screen.screen.get_at((12, 8))[:3])
+
+        screen.refresh([(3, 2, 2, 1)])
+
+        self.assertEqual((255, 255, 255), screen.screen.get_at((12, 8))[:3])
+        self.assertEqual((255, 255, 255), screen.screen.get_at((15, 11))[:3])
+        self.assertEqual((0, 0, 0), screen.screen.get_at((16, 8))[:3])
+
+    @mock.patch('pygame.display.update')
+    def test_refresh__updates_scaled_rectangles(self, mocked_update):
+        screen = self._init_screen(8, (100, 50))
+
+        screen.refresh([(0, 0, 8, 1), (62, 31, 2, 1)])
+
+        mocked_update.assert_called_once_with([
+            pygame.Rect(0, 0, 13, 2),
+            pygame.Rect(96, 48, 4, 2),
+        ])
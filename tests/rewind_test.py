@@ -0,0 +1,126 @@
+import unittest
+from unittest import mock
+from chip8_emulator import rewind
+from chip8_emulator.chip8 import Chip8
+from chip8_emulator.save_state import STATE_STRUCT, pack_state
+
+
+class RewindTest(unittest.TestCase):
+
+    def setUp(self):
+        with open('roms/pong.rom', 'rb') as rom_handle:
+            self.rom_bytes = rom_handle.read()
+
+    def _init_chip8(self):
+        keyboard_mock = mock.Mock()
+        keyboard_mock.pressed_key = None
+        keyboard_mock.get_pressed_key.return_value = None
+        chip8 = Chip8(mock.Mock(), keyboard_mock, headless=True)
+        chip8.memory.load_rom(self.rom_bytes)
+
+        return chip8
+
+    def _run_frames(self, chip8, rewind_buffer, frames):
+        states = []
+
+        for _ in range(frames):
+            for _ in range(10):
+                chip8.step()
+
+            rewind_buffer.capture()
+            states.append(pack_state(chip8))
+
+        return states
+
+    def test_get_state_delta__apply_state_delta(self):
+        previous_state = bytes([0x00, 0x12, 0x34, 0x00, 0x00, 0x00, 0x00, 0x56])
+        state = bytes([0x00, 0x12, 0x30, 0x00, 0x01, 0x00, 0x00, 0x56])
+
+        delta = rewind.get_state_delta(previous_state, state)
+
+        self.assertEqual(((2, b'\x04\x00\x01'),), delta)
+        self.assertEqual(state, rewind.apply_state_delta(previous_state, delta))
+        self.assertEqual(previous_state, rewind.apply_state_delta(state, delta))
+
+    def test_capture__stores_deltas_between_keyframes(self):
+        chip8 = self._init_chip8()
+        rewind_buffer = rewind.RewindBuffer(chip8, keyframe_interval=4)
+
+        self._run_frames(chip8, rewind_buffer, 9)
+
+        expected_keyframes = [True, False, False, False] * 2 + [True]
+        actual_keyframes = [frame.is_keyframe
+                            for frame in rewind_buffer._frames]
+
+        self.assertEqual(expected_keyframes, actual_keyframes)
+        self.assertTrue(all(frame.size < STATE_STRUCT.size // 10
+                            for frame in rewind_buffer._frames
+                            if not frame.is_keyframe))
+
+    def test_step_back(self):
+        chip8 = self._init_chip8()
+        rewind_buffer = rewind.RewindBuffer(chip8, keyframe_interval=4)
+        states = self._run_frames(chip8, rewind_buffer, 10)
+
+        rewound_frames = rewind_buffer.step_back(6)
+
+        self.assertEqual(6, rewound_frames)
+        self.assertEqual(states[3], pack_state(chip8))
+        self.assertEqual(4, len(rewind_buffer))
+
+    def test_step_back__across_keyframes(self):
+        chip8 = self._init_chip8()
+        rewind_buffer = rewind.RewindBuffer(chip8, keyframe_interval=3)
+        states = self._run_frames(chip8, rewind_buffer, 10)
+
+        rewind_buffer.step_back(1)
+        rewind_buffer.step_back(7)
+
+        self.assertEqual(states[1], pack_state(chip8))
+
+    def test_step_back__then_continue(self):
+        chip8 = self._init_chip8()
+        rewind_buffer = rewind.RewindBuffer(chip8, keyframe_interval=4)
+        self._run_frames(chip8, rewind_buffer, 6)
+        rewind_buffer.step_back(3)
+        states = self._run_frames(chip8, rewind_buffer, 4)
+
+        rewind_buffer.step_back(2)
+
+        self.assertEqual(states[1], pack_state(chip8))
+
+    def test_step_back__clamped_to_oldest_frame(self):
+        chip8 = self._init_chip8()
+        rewind_buffer = rewind.RewindBuffer(chip8)
+        states = self._run_frames(chip8, rewind_buffer, 3)
+
+        rewound_frames = rewind_buffer.step_back(10)
+
+        self.assertEqual(2, rewound_frames)
+        self.assertEqual(states[0], pack_state(chip8))
+
+    def test_capture__memory_limit(self):
+        chip8 = self._init_chip8()
+        memory_limit_bytes = STATE_STRUCT.size + 300
+        rewind_buffer = rewind.RewindBuffer(chip8, memory_limit_bytes,
+                                            keyframe_interval=100)
+        states = self._run_frames(chip8, rewind_buffer, 20)
+
+        rewound_frames = rewind_buffer.step_back(len(rewind_buffer) - 1)
+
+        self.assertLessEqual(rewind_buffer.memory_usage_bytes,
+                             memory_limit_bytes)
+        self.assertLess(rewound_frames, 19)
+        self.assertTrue(rewind_buffer._frames[0].is_keyframe)
+        self.assertEqual(states[-1 - rewound_frames], pack_state(chip8))
+
+    def test_capture_if_new_frame(self):
+        chip8 = self._init_chip8()
+        rewind_buffer = rewind.RewindBuffer(chip8)
+
+        rewind_buffer.capture_if_new_frame()
+        rewind_buffer.capture_if_new_frame()
+        chip8.delay_timer_thread.frame_count += 1
+        rewind_buffer.capture_if_new_frame()
+
+        self.assertEqual(2, len(rewind_buffer))
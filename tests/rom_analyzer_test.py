@@ -0,0 +1,136 @@
+import unittest
+from chip8_emulator import rom_analyzer
+from chip8_emulator.memory import Memory
+
+
+class RomAnalyzerTest(unittest.TestCase):
+
+    def _analyze(self, program):
+        memory = Memory()
+        memory.load_rom(bytes(program))
+
+        return memory.rom_analysis
+
+    def test_analyze_program_memory__edges(self):
+        program = [
+            0x30, 0x05,  # 0x200: skip next if V0 == 0x05
+            0x22, 0x08,  # 0x202: call 0x208
+            0x12, 0x00,  # 0x204: jump to 0x200
+            0x00, 0x00,  # 0x206: never reached
+            0x00, 0xEE,  # 0x208: return
+        ]
+
+        analysis = self._analyze(program)
+
+        expected_edges = [
+            (0x200, 0x202, rom_analyzer.FALLTHROUGH_EDGE),
+            (0x200, 0x204, rom_analyzer.SKIP_EDGE),
+            (0x202, 0x208, rom_analyzer.CALL_EDGE),
+            (0x202, 0x204, rom_analyzer.FALLTHROUGH_EDGE),
+            (0x204, 0x200, rom_analyzer.JUMP_EDGE),
+            (0x208, 0x204, rom_analyzer.RETURN_EDGE),
+        ]
+        actual_edges = analysis.edges
+
+        self.assertCountEqual(expected_edges, actual_edges)
+        self.assertEqual([], analysis.invalid_instructions)
+        self.assertFalse(analysis.is_code(0x206))
+
+    def test_analyze_program_memory__call_without_return(self):
+        program = [
+            0x22, 0x04,  # 0x200: call 0x204
+            0xFF, 0xFF,  # 0x202: data, the subroutine never returns
+            0x12, 0x04,  # 0x204: jump to itself
+        ]
+
+        analysis = self._analyze(program)
+
+        expected_edges = [
+            (0x200, 0x204, rom_analyzer.CALL_EDGE),
+            (0x204, 0x204, rom_analyzer.JUMP_EDGE),
+        ]
+        actual_edges = analysis.edges
+
+        self.assertCountEqual(expected_edges, actual_edges)
+        self.assertEqual([], analysis.invalid_instructions)
+        self.assertFalse(analysis.is_code(0x202))
+
+    def test_analyze_program_memory__nested_calls(self):
+        program = [
+            0x22, 0x08,  # 0x200: call 0x208
+            0x12, 0x02,  # 0x202: jump to itself
+            0x00, 0xEE,  # 0x204: return
+            0x12, 0x06,  # 0x206: jump to itself
+            0x22, 0x04,  # 0x208: call 0x204, which returns
+            0x22, 0x06,  # 0x20A: call 0x206, which doesn't return
+            0xFF, 0xFF,  # 0x20C: data
+        ]
+
+        analysis = self._analyze(program)
+
+        self.assertIn((0x204, 0x20A, rom_analyzer.RETURN_EDGE), analysis.edges)
+        self.assertEqual([], analysis.invalid_instructions)
+        self.assertFalse(analysis.is_code(0x202))
+        self.assertFalse(analysis.is_code(0x20C))
+
+    def test_analyze_program_memory__sprite_and_data(self):
+        program = [
+            0xA2, 0x0A,  # 0x200: I = 0x20A
+            0xD0, 0x13,  # 0x202: draw 3 rows at I
+            0xA2, 0x0D,  # 0x204: I = 0x20D
+            0xF0, 0x33,  # 0x206: BCD of V0 at I
+            0x12, 0x08,  # 0x208: jump to itself
+            0x18, 0x3C, 0x18,  # 0x20A: sprite
+            0x00, 0x00, 0x00,  # 0x20D: BCD scratch
+        ]
+
+        analysis = self._analyze(program)
+
+        self.assertEqual(set(range(0x200, 0x20A)), analysis.code_addresses)
+        self.assertEqual({0x20A, 0x20B, 0x20C}, analysis.sprite_addresses)
+        self.assertEqual({0x20D, 0x20E, 0x20F}, analysis.data_addresses)
+
+    def test_analyze_program_memory__invalid_opcode(self):
+        program = [0x60, 0x01, 0x80, 0x08]
+
+        analysis = self._analyze(program)
+
+        self.assertEqual([(0x202, 0x8008)], analysis.invalid_instructions)
+
+    def test_analyze_program_memory__indirect_jump(self):
+        program = [0xB3, 0x00]
+
+        analysis = self._analyze(program)
+
+        self.assertEqual([0x200], analysis.indirect_jumps)
+        self.assertEqual([], analysis.edges)
+
+    def test_analyze_program_memory__pong(self):
+        with open('roms/pong.rom', 'rb') as rom_handle:
+            rom_bytes = rom_handle.read()
+
+        analysis = self._analyze(rom_bytes)
+
+        self.assertEqual([], analysis.invalid_instructions)
+        self.assertEqual(set(range(0x2EA, 0x2F1)), analysis.sprite_addresses)
+        self.assertTrue(analysis.is_code(0x2E8))
+        self.assertFalse(analysis.is_code(0x2EA))
+
+    def test_get_block_leaders(self):
+        program = [0x30, 0x05, 0x60, 0x01, 0x12, 0x00]
+
+        analysis = self._analyze(program)
+
+        expected_leaders = [0x200, 0x204]
+        actual_leaders = analysis.get_block_leaders()
+
+        self.assertEqual(expected_leaders, actual_leaders)
+
+    def test_load_rom__predecodes_only_code(self):
+        program = [0x12, 0x04, 0x60, 0x01, 0x12, 0x04]
+        memory = Memory()
+
+        memory.load_rom(bytes(program))
+
+        self.assertIsNone(memory.decoded_instructions[0x202])
+        self.assertEqual(('1nnn', (0x204,)), memory.decoded_instructions[0x204])
@@ -0,0 +1,115 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from chip8_emulator import rom_compiler
+from chip8_emulator.chip8 import Chip8
+from chip8_emulator.memory import Memory
+
+
+class RomCompilerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_directory = tempfile.TemporaryDirectory()
+
+        with open('roms/pong.rom', 'rb') as rom_handle:
+            self.rom_bytes = rom_handle.read()
+
+    def tearDown(self):
+        self.cache_directory.cleanup()
+
+    def _find_static_blocks(self, program):
+        memory = Memory()
+        memory.load_rom(bytes(program))
+
+        return rom_compiler.find_static_blocks(memory.program_memory,
+                                               memory.rom_analysis)
+
+    def test_find_static_blocks__follows_static_control_flow(self):
+        # 0x200: 3005 (skip) -> 0x202: 2206 (call) / 0x204: 1200 (jump)
+        # 0x206: 00EE is only reachable through the call
+        program = [0x30, 0x05, 0x22, 0x06, 0x12, 0x00, 0x00, 0xEE]
+
+        expected_addresses = [0x200, 0x202, 0x204, 0x206]
+        actual_addresses = sorted(self._find_static_blocks(program))
+
+        self.assertEqual(expected_addresses, actual_addresses)
+
+    def test_find_static_blocks__skips_dynamic_jump_targets(self):
+        # 0x200: B300 jumps to 0x300 + V0, which is not followed
+        program = [0xB3, 0x00]
+
+        expected_addresses = [0x200]
+        actual_addresses = sorted(self._find_static_blocks(program))
+
+        self.assertEqual(expected_addresses, actual_addresses)
+
+    def test_find_static_blocks__skips_code_after_non_returning_call(self):
+        # 0x200: 2206 calls 0x206, which loops forever, so 0x202 is data
+        program = [0x22, 0x06, 0x60, 0x01, 0x12, 0x04, 0x12, 0x06]
+
+        expected_addresses = [0x200, 0x206]
+        actual_addresses = sorted(self._find_static_blocks(program))
+
+        self.assertEqual(expected_addresses, actual_addresses)
+
+    def test_find_static_blocks__excludes_data(self):
+        blocks = self._find_static_blocks(self.rom_bytes)
+        # Pong sprites are stored from 0x2EA
+        last_code_address = max(block[-1][0] for block in blocks.values())
+
+        self.assertIn(0x200, blocks)
+        self.assertLess(last_code_address, 0x2EA)
+
+    def test_get_compiled_rom_path__depends_on_rom_content(self):
+        rom_path = rom_compiler.get_compiled_rom_path(
+            self.rom_bytes, self.cache_directory.name)
+        other_rom_path = rom_compiler.get_compiled_rom_path(
+            self.rom_bytes + b'\x00', self.cache_directory.name)
+
+        self.assertNotEqual(rom_path, other_rom_path)
+        self.assertIn(rom_compiler.__version__, os.path.basename(rom_path))
+
+    def test_load_compiled_blocks__not_compiled(self):
+        compiled_blocks = rom_compiler.load_compiled_blocks(
+            self.rom_bytes, self.cache_directory.name)
+
+        self.assertIsNone(compiled_blocks)
+
+    def test_save_compiled_rom__loaded_blocks_match_static_blocks(self):
+        rom_compiler.save_compiled_rom(self.rom_bytes,
+                                       self.cache_directory.name)
+
+        compiled_blocks = rom_compiler.load_compiled_blocks(
+            self.rom_bytes, self.cache_directory.name)
+        static_blocks = self._find_static_blocks(self.rom_bytes)
+
+        self.assertEqual(sorted(static_blocks), sorted(compiled_blocks))
+
+        for address, block in static_blocks.items():
+            expected_address_end = block[-1][0] + 2
+            actual_address_end = compiled_blocks[address][1]
+            self.assertEqual(expected_address_end, actual_address_end)
+
+    @mock.patch('chip8_emulator.delay_timer_thread.DelayTimerThread.start')
+    def test_initialize__uses_compiled_rom(self, mocked_start):
+        rom_compiler.save_compiled_rom(self.rom_bytes,
+                                       self.cache_directory.name)
+        chip8 = Chip8(mock.Mock(), mock.Mock(),
+                      code_cache_directory=self.cache_directory.name)
+
+        chip8._initialize('roms/pong.rom')
+        chip8.tiered_executor.step()
+        statistics = chip8.tiered_executor.get_statistics()
+
+        self.assertEqual(0, statistics.interpreted_instructions)
+        self.assertGreater(statistics.compiled_instructions, 0)
+
+    @mock.patch('chip8_emulator.delay_timer_thread.DelayTimerThread.start')
+    def test_initialize__interprets_without_compiled_rom(self, mocked_start):
+        chip8 = Chip8(mock.Mock(), mock.Mock(),
+                      code_cache_directory=self.cache_directory.name)
+
+        chip8._initialize('roms/pong.rom')
+
+        self.assertIsNone(chip8.tiered_executor)
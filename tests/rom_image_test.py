@@ -0,0 +1,153 @@
+import multiprocessing
+import sys
+import unittest
+from unittest import mock
+from chip8_emulator import rom_image
+from chip8_emulator.chip8 import Chip8
+from chip8_emulator.memory import Memory
+
+
+def _run_attached_rom_image(shared_memory_name):
+    attached_rom_image = rom_image.attach_rom_image(shared_memory_name)
+    memory = Memory()
+    memory.load_rom_image(attached_rom_image)
+    program_memory = bytes(memory.program_memory)
+    memory.reset()
+    attached_rom_image.close()
+
+    return program_memory
+
+
+class RomImageTest(unittest.TestCase):
+
+    def setUp(self):
+        with open('roms/pong.rom', 'rb') as rom_handle:
+            self.rom_bytes = rom_handle.read()
+
+    def tearDown(self):
+        rom_image.clear_rom_images()
+
+    def _init_chip8(self):
+        chip8 = Chip8(mock.Mock(), mock.Mock(), headless=True)
+        chip8.reset(self.rom_bytes)
+
+        return chip8
+
+    def test_get_rom_image__cached(self):
+        first_rom_image = rom_image.get_rom_image(self.rom_bytes)
+        second_rom_image = rom_image.get_rom_image(self.rom_bytes)
+        single_rom_image = rom_image.get_rom_image(self.rom_bytes, False)
+
+        self.assertIs(first_rom_image, second_rom_image)
+        self.assertIsNot(first_rom_image, single_rom_image)
+
+    def test_load_rom_image__matches_load_rom(self):
+        memory = Memory()
+        memory.load_rom(self.rom_bytes)
+        image_memory = Memory()
+
+        image_memory.load_rom_image(rom_image.get_rom_image(self.rom_bytes))
+
+        self.assertEqual(bytes(memory.program_memory),
+                         bytes(image_memory.program_memory))
+        self.assertEqual(memory.decoded_instructions,
+                         image_memory.decoded_instructions)
+
+    def test_load_rom_image__copies_on_first_write(self):
+        first_chip8 = self._init_chip8()
+        second_chip8 = self._init_chip8()
+        shared_program_memory = first_chip8.memory.program_memory
+
+        self.assertIs(shared_program_memory, second_chip8.memory.program_memory)
+        self.assertIs(first_chip8.memory.decoded_instructions,
+                      second_chip8.memory.decoded_instructions)
+
+        first_chip8.memory.write_bytes(0x300, [0x12, 0x00])
+
+        self.assertIsNot(shared_program_memory,
+                         first_chip8.memory.program_memory)
+        self.assertIs(shared_program_memory, second_chip8.memory.program_memory)
+        self.assertEqual(0x12, first_chip8.memory.program_memory[0x300])
+        self.assertEqual(0x00, second_chip8.memory.program_memory[0x300])
+        self.assertIsNone(first_chip8.memory.decoded_instructions[0x300])
+        self.assertEqual(('1nnn', (0x200,)),
+                         first_chip8.memory.decode_opcode(0x300))
+
+    def test_load_rom_image__fork_keeps_sharing(self):
+        chip8 = self._init_chip8()
+
+        forked_chip8 = chip8.fork()
+
+        self.assertIs(chip8.memory.program_memory,
+                      forked_chip8.memory.program_memory)
+
+    @unittest.skipIf(sys.version_info < (3, 8), 'shared_memory needs Python 3.8')
+    def test_share_rom_image__attach_in_worker_process(self):
+        shared_rom_image = rom_image.share_rom_image(self.rom_bytes)
+        self.addCleanup(shared_rom_image.unlink)
+        self.addCleanup(shared_rom_image.close)
+        context = multiprocessing.get_context('spawn')
+
+        with context.Pool(1) as pool:
+            program_memory = pool.apply(_run_attached_rom_image,
+                                        (shared_rom_image.name,))
+
+        expected_program_memory = rom_image.get_rom_image(
+            self.rom_bytes).program_memory
+
+        self.assertEqual(expected_program_memory, program_memory)
+
+    @unittest.skipIf(sys.version_info < (3, 8), 'shared_memory needs Python 3.8')
+    def test_attach_rom_image(self):
+        shared_rom_image = rom_image.share_rom_image(self.rom_bytes)
+        self.addCleanup(shared_rom_image.unlink)
+        self.addCleanup(shared_rom_image.close)
+        rom_image.clear_rom_images()
+
+        attached_rom_image = rom_image.attach_rom_image(shared_rom_image.name)
+        self.addCleanup(attached_rom_image.close)
+        chip8 = self._init_chip8()
+
+        self.assertIs(attached_rom_image, rom_image.get_rom_image(self.rom_bytes))
+        self.assertIs(attached_rom_image.program_memory,
+                      chip8.memory.program_memory)
+
+        chip8.memory.write_bytes(0x200, [0x12, 0x00])
+
+        self.assertEqual(self.rom_bytes[:2],
+                         bytes(attached_rom_image.program_memory[0x200:0x202]))
+
+    @unittest.skipIf(sys.version_info < (3, 8), 'shared_memory needs Python 3.8')
+    def test_close__detaches_and_forgets_the_image(self):
+        shared_rom_image = rom_image.share_rom_image(self.rom_bytes)
+        self.addCleanup(shared_rom_image.unlink)
+        self.addCleanup(shared_rom_image.close)
+        attached_rom_image = rom_image.attach_rom_image(shared_rom_image.name)
+
+        attached_rom_image.close()
+
+        self.assertIsNone(attached_rom_image.shared_memory_block)
+        self.assertIsNot(attached_rom_image,
+                         rom_image.get_rom_image(self.rom_bytes))
+        self.assertEqual(self.rom_bytes[:2],
+                         bytes(shared_rom_image.buf[0x200:0x202]))
+
+    @mock.patch.dict(sys.modules, {'multiprocessing.shared_memory': None})
+    def test_share_rom_image__without_shared_memory(self):
+        with self.assertRaisesRegex(RuntimeError, 'Python 3.8'):
+            rom_image.share_rom_image(self.rom_bytes)
+
+        with self.assertRaisesRegex(RuntimeError, 'Python 3.8'):
+            rom_image.attach_rom_image('chip8_rom')
+
+    @mock.patch('chip8_emulator.rom_image.MAX_ROM_IMAGES', 2)
+    def test_get_rom_image__evicts_least_recently_used(self):
+        first_rom_image = rom_image.get_rom_image(b'\x12\x00')
+        second_rom_image = rom_image.get_rom_image(b'\x12\x02')
+        rom_image.get_rom_image(b'\x12\x00')
+
+        rom_image.get_rom_image(b'\x12\x04')
+
+        self.assertIs(first_rom_image, rom_image.get_rom_image(b'\x12\x00'))
+        self.assertIsNot(second_rom_image,
+                         rom_image.get_rom_image(b'\x12\x02'))
@@ -0,0 +1,118 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from chip8_emulator import save_state
+from chip8_emulator.chip8 import Chip8
+from chip8_emulator.exceptions import InvalidSaveStateError
+
+
+class SaveStateTest(unittest.TestCase):
+
+    def setUp(self):
+        self.state_directory = tempfile.TemporaryDirectory()
+        self.state_path = os.path.join(self.state_directory.name, 'pong.c8s')
+
+        with open('roms/pong.rom', 'rb') as rom_handle:
+            self.rom_bytes = rom_handle.read()
+
+    def tearDown(self):
+        self.state_directory.cleanup()
+
+    def _init_chip8(self):
+        keyboard_mock = mock.Mock()
+        keyboard_mock.pressed_key = None
+        chip8 = Chip8(mock.Mock(), keyboard_mock, headless=True)
+        chip8.memory.load_rom(self.rom_bytes)
+
+        return chip8
+
+    def _get_machine_state(self, chip8):
+        memory = chip8.memory
+
+        return (
+            bytes(memory.program_memory), memory.v_registers.tolist(),
+            memory.i_register, memory.program_counter,
+            memory.get_stack_addresses(), memory.get_timers(),
+            chip8.keyboard.pressed_key, chip8.screen_proxy.get_framebuffer(),
+        )
+
+    def test_save_state__load_state(self):
+        chip8 = self._init_chip8()
+
+        for _ in range(100):
+            chip8.step()
+
+        chip8.memory.add_to_stack(0x2A4)
+        chip8.memory.set_timers(0x1E, 0x05)
+        chip8.keyboard.pressed_key = 0xC
+        chip8.save_state(self.state_path)
+        restored_chip8 = self._init_chip8()
+        restored_chip8.load_state(self.state_path)
+
+        expected_state = self._get_machine_state(chip8)
+        actual_state = self._get_machine_state(restored_chip8)
+
+        self.assertEqual(expected_state, actual_state)
+
+    @mock.patch('random.getrandbits', return_value=0x5A)
+    def test_load_state__runs_like_the_saved_machine(self, mocked_getrandbits):
+        chip8 = self._init_chip8()
+
+        for _ in range(50):
+            chip8.step()
+
+        chip8.save_state(self.state_path)
+        restored_chip8 = self._init_chip8()
+        restored_chip8.load_state(self.state_path)
+
+        for _ in range(50):
+            chip8.step()
+            restored_chip8.step()
+
+        self.assertEqual(self._get_machine_state(chip8),
+                         self._get_machine_state(restored_chip8))
+
+    def test_pack_state__fixed_size(self):
+        chip8 = self._init_chip8()
+
+        state_bytes = save_state.pack_state(chip8)
+
+        self.assertEqual(save_state.STATE_STRUCT.size, len(state_bytes))
+        self.assertEqual(save_state.STATE_MAGIC, state_bytes[:4])
+
+    def test_pack_state__i_register_at_maximum(self):
+        chip8 = self._init_chip8()
+        restored_chip8 = self._init_chip8()
+        chip8.memory.i_register = 0xFFFF
+
+        save_state.unpack_state(restored_chip8, save_state.pack_state(chip8))
+
+        self.assertEqual(0xFFFF, restored_chip8.memory.i_register)
+
+    def test_pack_state__i_register_past_16_bits(self):
+        chip8 = self._init_chip8()
+        restored_chip8 = self._init_chip8()
+        chip8.memory.i_register = 0xFFFF
+        chip8.memory.v_registers[0x0] = 0x02
+        chip8.memory.write_bytes(0x200, [0xF0, 0x1E])
+
+        chip8.step()
+        save_state.unpack_state(restored_chip8, save_state.pack_state(chip8))
+
+        self.assertEqual(0x0001, restored_chip8.memory.i_register)
+
+    def test_unpack_state__unsupported_version(self):
+        chip8 = self._init_chip8()
+        state_bytes = bytearray(save_state.pack_state(chip8))
+        state_bytes[4] = save_state.STATE_VERSION + 1
+
+        with self.assertRaises(InvalidSaveStateError):
+            save_state.unpack_state(chip8, state_bytes)
+
+    def test_unpack_state__truncated(self):
+        chip8 = self._init_chip8()
+        state_bytes = save_state.pack_state(chip8)
+
+        with self.assertRaises(InvalidSaveStateError):
+            save_state.unpack_state(chip8, state_bytes[:-1])
@@ -1,212 +1,221 @@
 import unittest
-from unittest.mock import Mock, call, patch
-from chip8_emulator.screen_proxy import ScreenProxy
+from unittest.mock import Mock, call
+from chip8_emulator.screen_proxy import ScreenProxy, DirtyRectangles, \
+    SPRITE_ROW_MASKS, get_sprite_rows
 
 
 class ScreenProxyTest(unittest.TestCase):
 
-    def _init_screen_proxy(self, screen_buffer=None, scalation_factor=1):
+    def _init_screen_proxy(self, rows=None):
         screen_implementation_mock = Mock()
         screen_proxy = ScreenProxy(screen_implementation_mock)
-        screen_proxy._SCALATION_FACTOR = scalation_factor
 
-        if screen_buffer is not None:
-            screen_proxy._screen_buffer = screen_buffer
+        if rows is not None:
+            screen_proxy._rows = list(rows)
 
         screen_proxy.init_screen()
 
         return screen_proxy
 
-    def _init_screen_buffer_with_sprite(self, sprite, x, y):
-        screen_buffer = [[0] * 128 for i in range(64)]
-        x_index = x
+    def _get_rows_with_sprite(self, sprite, x, y):
+        rows = [0] * 32
 
-        for pixel_int_row in sprite:
-            y_index = y
-            pixel_row_bits_string = '{:08b}'.format(pixel_int_row)
+        for row_index, sprite_row in enumerate(sprite):
+            rows[y + row_index] = sprite_row << (56 - x)
 
-            for row_bit_string in pixel_row_bits_string:
-                row_bit_int = int(row_bit_string)
-                screen_buffer[x_index][y_index] = row_bit_int
-                y_index += 1
+        return rows
 
-            x_index += 1
+    def test_init(self):
+        screen_proxy = self._init_screen_proxy()
+
+        self.assertEqual(64, screen_proxy.screen.width)
+        self.assertEqual(32, screen_proxy.screen.height)
+        self.assertEqual((0,) * 32, screen_proxy.get_logical_rows())
+        screen_proxy.screen.init.assert_called()
+
+    def test_sprite_row_masks(self):
+        self.assertEqual(0xC3 << 56, SPRITE_ROW_MASKS[0][0xC3])
+        self.assertEqual(0xC3 << 46, SPRITE_ROW_MASKS[10][0xC3])
+        self.assertEqual(0xC3, SPRITE_ROW_MASKS[56][0xC3])
+
+    def test_sprite_row_masks__wrap_around(self):
+        expected_mask = (0x3 << 60) | 0xC
+        actual_mask = SPRITE_ROW_MASKS[60][0xC3]
+
+        self.assertEqual(expected_mask, actual_mask)
+
+    def test_get_sprite_rows(self):
+        expected_sprite_rows = (
+            ((0x3 << 60) | 0xC, (60, 61, 2, 3)),
+            (0, ()),
+        )
+        actual_sprite_rows = get_sprite_rows(bytes([0xC3, 0x00]), 60)
+
+        self.assertEqual(expected_sprite_rows, actual_sprite_rows)
+
+    def test_draw_sprite__caches_sprite_rows(self):
+        screen_proxy = self._init_screen_proxy()
+        screen_proxy.draw_sprite(memoryview(b'\x20\x60\x20\x20\x70'), 3, 4)
+        hits = get_sprite_rows.cache_info().hits
+
+        screen_proxy.draw_sprite(memoryview(b'\x20\x60\x20\x20\x70'), 3, 4)
 
-        return screen_buffer
+        self.assertEqual(hits + 1, get_sprite_rows.cache_info().hits)
+        self.assertEqual(0, screen_proxy.get_logical_row(4))
 
-    def test_update_screen_buffer(self):
+    def test_draw_sprite(self):
         init_sprite = [0x18, 0x3C, 0x7E, 0x7E, 0x3C, 0x18, 0x18, 0x18, 0x18]
         x0 = 10
         y0 = 20
-        screen_buffer = self._init_screen_buffer_with_sprite(
-            init_sprite, x0, y0)
-        screen_proxy = self._init_screen_proxy(screen_buffer)
+        screen_proxy = self._init_screen_proxy(
+            self._get_rows_with_sprite(init_sprite, x0, y0))
 
         input_sprite = [0x66, 0x42, 0x00, 0x00, 0x42, 0x66, 0x66, 0x66, 0x66]
-        screen_proxy._update_screen_buffer(input_sprite, x0, y0)
+        screen_proxy.draw_sprite(input_sprite, x0, y0)
 
         expected_sprite = [0x7E, 0x7E, 0x7E,
                            0x7E, 0x7E, 0x7E, 0x7E, 0x7E, 0x7E]
-        expected_screen_buffer = self._init_screen_buffer_with_sprite(
-            expected_sprite, x0, y0
-        )
-        actual_screen_buffer = screen_proxy._screen_buffer
+        expected_rows = self._get_rows_with_sprite(expected_sprite, x0, y0)
 
-        self.assertEqual(expected_screen_buffer, actual_screen_buffer)
+        self.assertEqual(tuple(expected_rows), screen_proxy.get_logical_rows())
+        self.assertFalse(screen_proxy.collision)
+        screen_proxy.screen.refresh.assert_not_called()
+        self.assertEqual([(x0, y0, 8, 9)], screen_proxy.dirty_rectangles.pop())
 
-    def test_scale_sprite_x2(self):
-        screen_proxy = self._init_screen_proxy()
-        screen_proxy._SCALATION_FACTOR = 2
-        original_sprite = [0xFF, 0xC0, 0xC0, 0xC0, 0xC0, 0xFF]  # C
-
-        expected_sprite = [
-            0xFFFF, 0xFFFF,
-            0xF000, 0xF000,
-            0xF000, 0xF000,
-            0xF000, 0xF000,
-            0xF000, 0xF000,
-            0xFFFF, 0xFFFF,
-        ]
-        actual_sprite = screen_proxy._scale_sprite(original_sprite)
-
-        self.assertEqual(expected_sprite, actual_sprite)
-
-    def test_scale_sprite_x3(self):
+    def test_draw_sprite__collision(self):
         screen_proxy = self._init_screen_proxy()
-        screen_proxy._SCALATION_FACTOR = 3
-        original_sprite = [0xFF, 0xC0, 0xC0, 0xC0, 0xC0, 0xFF]  # C
-
-        expected_sprite = [
-            0xFFFFFF, 0xFFFFFF, 0xFFFFFF,
-            0xFC0000, 0xFC0000, 0xFC0000,
-            0xFC0000, 0xFC0000, 0xFC0000,
-            0xFC0000, 0xFC0000, 0xFC0000,
-            0xFC0000, 0xFC0000, 0xFC0000,
-            0xFFFFFF, 0xFFFFFF, 0xFFFFFF,
-        ]
-        actual_sprite = screen_proxy._scale_sprite(original_sprite)
-
-        self.assertEqual(expected_sprite, actual_sprite)
-
-    def test_get_sprite_bit_matrix_to_draw(self):
-        original_sprite = [0xFF, 0xC0, 0xC0, 0xC0, 0xC0, 0xFF]  # C
-        sprite_x = 20
-        sprite_y = 10
-        screen_buffer = self._init_screen_buffer_with_sprite(original_sprite,
-                                                             sprite_x, sprite_y)
-        screen_proxy = self._init_screen_proxy(screen_buffer)
-
-        expected_sprite = [[0] * 8 for _ in range(6)]
-        expected_sprite[0] = [1] * 8
-        expected_sprite[1] = [1, 1, 0, 0, 0, 0, 0, 0]
-        expected_sprite[2] = [1, 1, 0, 0, 0, 0, 0, 0]
-        expected_sprite[3] = [1, 1, 0, 0, 0, 0, 0, 0]
-        expected_sprite[4] = [1, 1, 0, 0, 0, 0, 0, 0]
-        expected_sprite[5] = [1] * 8
-
-        actual_sprite = screen_proxy._get_segment_bit_matrix_to_draw(
-            sprite_x, sprite_y, 8, 6)
-
-        self.assertEqual(expected_sprite, actual_sprite)
-
-    def test_wrap_if_overflow__overflow(self):
+        screen_proxy.draw_sprite([0xFF], 0, 0)
+
+        screen_proxy.draw_sprite([0x01], 0, 0)
+
+        self.assertTrue(screen_proxy.collision)
+        self.assertEqual(0xFE << 56, screen_proxy.get_logical_row(0))
+
+    def test_draw_sprite__collision_is_reset(self):
         screen_proxy = self._init_screen_proxy()
-        row_overflow = 23
-        row = screen_proxy._HEIGHT + row_overflow
+        screen_proxy.draw_sprite([0xFF], 0, 0)
+        screen_proxy.draw_sprite([0x01], 0, 0)
 
-        expected_row = row - screen_proxy._HEIGHT
-        actual_row = screen_proxy._wrap_if_overflow(row, screen_proxy._HEIGHT)
+        screen_proxy.draw_sprite([0x01], 0, 1)
 
-        self.assertEqual(expected_row, actual_row)
+        self.assertFalse(screen_proxy.collision)
 
-    def test_set_collision__collision(self):
+    def test_draw_sprite__wraps_around(self):
         screen_proxy = self._init_screen_proxy()
-        pixel_before = 1
-        pixel_after = 0
 
-        screen_proxy._set_collision(pixel_before, pixel_after)
+        screen_proxy.draw_sprite([0xFF, 0x81], 64 + 60, 31)
 
-        actual_collision = screen_proxy.collision
+        self.assertEqual((0xF << 60) | 0xF, screen_proxy.get_logical_row(31))
+        self.assertEqual((0x1 << 60) | 0x8, screen_proxy.get_logical_row(0))
 
-        self.assertTrue(actual_collision)
+    def test_draw_sprite__refreshes_sprite_pixels(self):
+        screen_proxy = self._init_screen_proxy()
+        screen_proxy.draw_sprite([0xA0], 10, 5)
+
+        screen_proxy.draw_sprite([0x00, 0xF0], 10, 4)
+
+        screen_proxy.screen.draw_pixel.assert_has_calls([
+            call(10, 5), call(12, 5),
+            call(11, 5), call(13, 5),
+        ])
+        screen_proxy.screen.clear_pixel.assert_has_calls([
+            call(10, 5), call(12, 5),
+        ])
+        self.assertEqual(4, screen_proxy.screen.draw_pixel.call_count)
+        self.assertEqual(2, screen_proxy.screen.clear_pixel.call_count)
 
-    def test_set_collision__no_collision(self):
+    def test_clear_screen(self):
         screen_proxy = self._init_screen_proxy()
-        pixel_before = 0
-        pixel_after = 0
+        screen_proxy.draw_sprite([0xFF], 0, 0)
+
+        screen_proxy.clear_screen()
+
+        self.assertEqual((0,) * 32, screen_proxy.get_logical_rows())
+        screen_proxy.screen.clear.assert_called()
 
-        screen_proxy._set_collision(pixel_before, pixel_after)
+    def test_present(self):
+        screen_proxy = self._init_screen_proxy()
+        screen_proxy.draw_sprite([0xFF], 0, 0)
+        screen_proxy.draw_sprite([0xFF, 0xFF], 62, 31)
 
-        actual_collision = screen_proxy.collision
+        screen_proxy.present()
+        screen_proxy.present()
 
-        self.assertFalse(actual_collision)
+        screen_proxy.screen.refresh.assert_called_once_with([
+            (0, 0, 8, 1),
+            (62, 31, 2, 1), (0, 31, 6, 1),
+            (62, 0, 2, 1), (0, 0, 6, 1),
+        ])
 
-    def test_refresh_segment(self):
-        initial_x = 10
-        initial_y = 5
-        screen_segment = [[0] * 8 for _ in range(5)]
-        screen_segment[1] = [1, 0, 1, 0, 1, 0, 1, 0]
-        screen_segment[4] = [1, 1, 1, 1, 0, 0, 0, 0]
+    def test_present__after_clear_screen(self):
         screen_proxy = self._init_screen_proxy()
+        screen_proxy.draw_sprite([0xFF], 0, 0)
+        screen_proxy.clear_screen()
+        screen_proxy.draw_sprite([0xFF], 8, 8)
 
-        screen_proxy._refresh_segment(screen_segment, initial_x, initial_y)
-
-        expected_draw_pixel_calls = [
-            call(10, 6), call(12, 6), call(14, 6), call(16, 6),
-            call(10, 9), call(11, 9), call(12, 9), call(13, 9),
-        ]
-        expected_clear_pixel_calls = [
-            call(10, 5), call(11, 5), call(12, 5), call(13, 5), call(
-                14, 5), call(15, 5), call(16, 5), call(17, 5),
-            call(11, 6), call(13, 6), call(15, 6), call(17, 6),
-            call(10, 7), call(11, 7), call(12, 7), call(13, 7), call(
-                14, 7), call(15, 7), call(16, 7), call(17, 7),
-            call(10, 8), call(11, 8), call(12, 8), call(13, 8), call(
-                14, 8), call(15, 8), call(16, 8), call(17, 8),
-            call(14, 9), call(15, 9), call(16, 9), call(17, 9),
-        ]
-        screen_proxy.screen.draw_pixel.assert_has_calls(
-            expected_draw_pixel_calls
-        )
-        screen_proxy.screen.clear_pixel.assert_has_calls(
-            expected_clear_pixel_calls
-        )
-        screen_proxy.screen.refresh.assert_called()
-
-    @patch('chip8_emulator.screen_proxy.ScreenProxy._update_screen_buffer')
-    @patch('chip8_emulator.screen_proxy.ScreenProxy._get_segment_bit_matrix_to_draw')
-    @patch('chip8_emulator.screen_proxy.ScreenProxy._refresh_segment')
-    def test_draw_sprite(self, mocked_refresh_segment,
-                         mocked_get_segment_bit_matrix_to_draw,
-                         mocked_update_screen_buffer):
-        scalation_factor = 2
-        sprite = [0xFF, 0x00, 0xFF]
-        scaled_sprite = [0xFFFF, 0xFFFF, 0x0000, 0x0000, 0xFFFF, 0xFFFF]
-        x = 10
-        y = 5
-        scaled_x = x * scalation_factor
-        scaled_y = y * scalation_factor
-        screen_proxy = self._init_screen_proxy(
-            scalation_factor=scalation_factor
-        )
+        screen_proxy.present()
 
-        mocked_get_segment_bit_matrix_to_draw.return_value = 'mocked_matrix'
+        screen_proxy.screen.refresh.assert_called_once_with([(0, 0, 64, 32)])
 
-        screen_proxy.draw_sprite(sprite, x, y)
+    def test_dirty_rectangles__empty_sprite(self):
+        dirty_rectangles = DirtyRectangles(64, 32)
 
-        mocked_update_screen_buffer.assert_called_with(
-            scaled_sprite, scaled_y, scaled_x
-        )
-        mocked_get_segment_bit_matrix_to_draw.assert_called_with(
-            scaled_y, scaled_x, 16, len(scaled_sprite)
-        )
-        mocked_refresh_segment.assert_called_with(
-            'mocked_matrix', scaled_x, scaled_y
-        )
+        dirty_rectangles.add_sprite(10, 10, 0)
 
-    def test_clear_screen(self):
+        self.assertEqual([], dirty_rectangles.pop())
+
+    def test_get_framebuffer(self):
+        sprite = [0xFF, 0x81]
         screen_proxy = self._init_screen_proxy()
+        screen_proxy.draw_sprite(sprite, 8, 1)
 
-        screen_proxy.clear_screen()
+        expected_framebuffer = bytearray(256)
+        expected_framebuffer[0x09] = 0xFF
+        expected_framebuffer[0x11] = 0x81
+        actual_framebuffer = screen_proxy.get_framebuffer()
+
+        self.assertEqual(bytes(expected_framebuffer), actual_framebuffer)
 
+    def test_set_framebuffer(self):
+        framebuffer = bytearray(256)
+        framebuffer[0x09] = 0xFF
+        framebuffer[0x11] = 0x81
+        screen_proxy = self._init_screen_proxy()
+
+        screen_proxy.set_framebuffer(framebuffer)
+
+        self.assertEqual(bytes(framebuffer), screen_proxy.get_framebuffer())
+        screen_proxy.screen.clear.assert_called()
+        screen_proxy.screen.draw_pixel.assert_any_call(8, 1)
+        screen_proxy.screen.draw_pixel.assert_any_call(15, 2)
+        self.assertEqual(10, screen_proxy.screen.draw_pixel.call_count)
+        screen_proxy.screen.clear_pixel.assert_not_called()
+        self.assertEqual([(0, 0, 64, 32)], screen_proxy.dirty_rectangles.pop())
+
+    def test_fork(self):
+        screen_proxy = self._init_screen_proxy()
+        screen_proxy.draw_sprite([0xFF], 0, 0)
+        forked_screen_mock = Mock()
+
+        forked_screen_proxy = screen_proxy.fork(forked_screen_mock)
+        forked_screen_proxy.draw_sprite([0x81], 0, 2)
+        screen_proxy.draw_sprite([0x80], 0, 3)
+
+        self.assertEqual(0xFF << 56, forked_screen_proxy.get_logical_row(0))
+        self.assertEqual(0, screen_proxy.get_logical_row(2))
+        self.assertEqual(0x81 << 56, forked_screen_proxy.get_logical_row(2))
+        self.assertEqual(0, forked_screen_proxy.get_logical_row(3))
+        self.assertIs(forked_screen_mock, forked_screen_proxy.screen)
+
+    def test_reset(self):
+        screen_proxy = ScreenProxy(Mock())
+        screen_proxy.draw_sprite([0xFF, 0xFF], 0, 0)
+        screen_proxy.draw_sprite([0xFF], 0, 0)
+        forked_screen_proxy = screen_proxy.fork()
+
+        screen_proxy.reset()
+
+        self.assertEqual(bytes(256), screen_proxy.get_framebuffer())
+        self.assertNotEqual(bytes(256), forked_screen_proxy.get_framebuffer())
+        self.assertFalse(screen_proxy.collision)
         screen_proxy.screen.clear.assert_called()
@@ -0,0 +1,99 @@
+import unittest
+from unittest import mock
+from chip8_emulator.chip8 import Chip8
+from chip8_emulator.state_hash import StateHasher, TranspositionTable
+
+
+class StateHashTest(unittest.TestCase):
+
+    def _init_chip8(self):
+        with open('roms/pong.rom', 'rb') as rom_handle:
+            rom_bytes = rom_handle.read()
+        chip8 = Chip8(mock.Mock(), mock.Mock(), headless=True)
+        chip8.memory.load_rom(rom_bytes)
+
+        return chip8
+
+    @mock.patch('random.getrandbits', return_value=0x5A)
+    def test_get_state_hash__matches_full_rehash(self, mocked_getrandbits):
+        chip8 = self._init_chip8()
+        state_hasher = StateHasher(chip8)
+        state_hasher.get_state_hash()
+
+        for _ in range(100):
+            chip8.step()
+            state_hash = state_hasher.get_state_hash()
+
+        self.assertEqual(StateHasher(chip8).get_state_hash(), state_hash)
+
+    def test_get_state_hash__memory_write(self):
+        chip8 = self._init_chip8()
+        state_hasher = StateHasher(chip8)
+        initial_state_hash = state_hasher.get_state_hash()
+
+        chip8.memory.write_bytes(0x3A0, [0x01])
+
+        self.assertIsNone(state_hasher._page_hashes[0x3])
+        self.assertIsNotNone(state_hasher._page_hashes[0x2])
+        self.assertNotEqual(initial_state_hash, state_hasher.get_state_hash())
+
+        chip8.memory.write_bytes(0x3A0, [0x00])
+
+        self.assertEqual(initial_state_hash, state_hasher.get_state_hash())
+
+    def test_get_state_hash__registers(self):
+        chip8 = self._init_chip8()
+        state_hasher = StateHasher(chip8)
+        initial_state_hash = state_hasher.get_state_hash()
+
+        chip8.memory.v_registers[0x4] = 0x10
+        changed_state_hash = state_hasher.get_state_hash()
+        chip8.memory.v_registers[0x4] = 0x00
+
+        self.assertNotEqual(initial_state_hash, changed_state_hash)
+        self.assertEqual(initial_state_hash, state_hasher.get_state_hash())
+
+    def test_get_state_hash__framebuffer(self):
+        chip8 = self._init_chip8()
+        state_hasher = StateHasher(chip8)
+        initial_state_hash = state_hasher.get_state_hash()
+
+        chip8.screen_proxy.draw_sprite([0x80], 0x3F, 0x1F)
+        drawn_state_hash = state_hasher.get_state_hash()
+        chip8.screen_proxy.draw_sprite([0x80], 0x3F, 0x1F)
+
+        self.assertNotEqual(initial_state_hash, drawn_state_hash)
+        self.assertEqual(initial_state_hash, state_hasher.get_state_hash())
+
+    def test_fork(self):
+        chip8 = self._init_chip8()
+        state_hasher = StateHasher(chip8)
+        state_hash = state_hasher.get_state_hash()
+        forked_chip8 = chip8.fork()
+
+        forked_state_hasher = state_hasher.fork(forked_chip8)
+        forked_chip8.memory.write_bytes(0x3A0, [0x01])
+
+        self.assertEqual(state_hash, state_hasher.get_state_hash())
+        self.assertNotEqual(state_hash, forked_state_hasher.get_state_hash())
+
+    def test_transposition_table__visit(self):
+        transposition_table = TranspositionTable()
+
+        self.assertFalse(transposition_table.visit(0x1234))
+        self.assertTrue(transposition_table.visit(0x1234))
+        self.assertEqual(1, transposition_table.hits)
+        self.assertEqual(1, transposition_table.misses)
+
+    def test_transposition_table__evicts_least_recently_used(self):
+        transposition_table = TranspositionTable(capacity=2)
+        transposition_table.put(0x1, 'first')
+        transposition_table.put(0x2, 'second')
+        transposition_table.get(0x1)
+
+        transposition_table.put(0x3, 'third')
+
+        self.assertEqual(2, len(transposition_table))
+        self.assertIn(0x1, transposition_table)
+        self.assertNotIn(0x2, transposition_table)
+        self.assertEqual('third', transposition_table.get(0x3))
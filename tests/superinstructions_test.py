@@ -0,0 +1,64 @@
+import unittest
+from collections import Counter
+from chip8_emulator import superinstructions
+
+
+class SuperinstructionsTest(unittest.TestCase):
+
+    def test_fuse_instructions__pair(self):
+        instructions = [('annn', (0x2EA,)), ('dxyn', (0x1, 0x2, 0x6)),
+                        ('6xkk', (0x0, 0x01))]
+
+        expected = ('annn_dxyn', (0x2EA, 0x1, 0x2, 0x6))
+        actual = superinstructions.fuse_instructions(instructions)
+
+        self.assertEqual(expected, actual)
+
+    def test_fuse_instructions__triple(self):
+        instructions = [('fx07', (0x0,)), ('3xkk', (0x0, 0x00)),
+                        ('1nnn', (0x21A,))]
+
+        expected = ('fx07_3xkk_1nnn', (0x0, 0x0, 0x00, 0x21A))
+        actual = superinstructions.fuse_instructions(instructions)
+
+        self.assertEqual(expected, actual)
+
+    def test_fuse_instructions__no_fusion(self):
+        instructions = [('fx07', (0x0,)), ('3xkk', (0x0, 0x00)),
+                        ('6xkk', (0x0, 0x01))]
+
+        actual = superinstructions.fuse_instructions(instructions)
+
+        self.assertIsNone(actual)
+
+    def test_fuse_instructions__invalid_operation(self):
+        instructions = [('6xkk', (0x0, 0x01)), (None, ())]
+
+        actual = superinstructions.fuse_instructions(instructions)
+
+        self.assertIsNone(actual)
+
+    def test_get_executed_instructions(self):
+        self.assertEqual(1, superinstructions.get_executed_instructions(
+            '6xkk', 0x200, 0x202))
+        self.assertEqual(2, superinstructions.get_executed_instructions(
+            'annn_dxyn', 0x200, 0x204))
+        self.assertEqual(3, superinstructions.get_executed_instructions(
+            'fx07_3xkk_1nnn', 0x200, 0x200))
+
+    def test_get_executed_instructions__skipped_jump(self):
+        self.assertEqual(2, superinstructions.get_executed_instructions(
+            'fx07_3xkk_1nnn', 0x200, 0x206))
+        self.assertEqual(1, superinstructions.get_executed_instructions(
+            '3xkk_1nnn', 0x200, 0x204))
+
+    def test_get_fusion_report(self):
+        fusion_counts = Counter({'annn_dxyn': 10, 'fx07_3xkk_1nnn': 20})
+
+        expected = [
+            {'operation': 'fx07_3xkk_1nnn', 'count': 20, 'saved_dispatches': 40},
+            {'operation': 'annn_dxyn', 'count': 10, 'saved_dispatches': 10},
+        ]
+        actual = superinstructions.get_fusion_report(fusion_counts)
+
+        self.assertEqual(expected, actual)
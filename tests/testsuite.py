@@ -6,6 +6,20 @@ from .opcode_parser_test import OpcodeParserTest
 from .screen_proxy_test import ScreenProxyTest
 from .memory_test import MemoryTest
 from .pygame_keyboard_test import PygameKeyboardTest
+from .pygame_screen_test import PygameScreenTest
+from .block_compiler_test import BlockCompilerTest
+from .tiered_execution_test import TieredExecutionTest
+from .rom_compiler_test import RomCompilerTest
+from .superinstructions_test import SuperinstructionsTest
+from .rom_analyzer_test import RomAnalyzerTest
+from .save_state_test import SaveStateTest
+from .rewind_test import RewindTest
+from .state_hash_test import StateHashTest
+from .rom_image_test import RomImageTest
+from .memory_profiler_test import MemoryProfilerTest
+from .watchdog_test import WatchdogTest
+from .numpy_screen_proxy_test import NumpyScreenProxyTest, \
+    NumpyScreenProxyWithoutNumpyTest
 
 
 def suite():
@@ -16,6 +30,20 @@ def suite():
     suite.addTest(unittest.makeSuite(ScreenProxyTest))
     suite.addTest(unittest.makeSuite(MemoryTest))
     suite.addTest(unittest.makeSuite(PygameKeyboardTest))
+    suite.addTest(unittest.makeSuite(PygameScreenTest))
+    suite.addTest(unittest.makeSuite(BlockCompilerTest))
+    suite.addTest(unittest.makeSuite(TieredExecutionTest))
+    suite.addTest(unittest.makeSuite(RomCompilerTest))
+    suite.addTest(unittest.makeSuite(SuperinstructionsTest))
+    suite.addTest(unittest.makeSuite(RomAnalyzerTest))
+    suite.addTest(unittest.makeSuite(SaveStateTest))
+    suite.addTest(unittest.makeSuite(RewindTest))
+    suite.addTest(unittest.makeSuite(StateHashTest))
+    suite.addTest(unittest.makeSuite(RomImageTest))
+    suite.addTest(unittest.makeSuite(MemoryProfilerTest))
+    suite.addTest(unittest.makeSuite(WatchdogTest))
+    suite.addTest(unittest.makeSuite(NumpyScreenProxyTest))
+    suite.addTest(unittest.makeSuite(NumpyScreenProxyWithoutNumpyTest))
 
     return suite
 
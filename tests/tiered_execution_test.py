@@ -0,0 +1,94 @@
+import unittest
+from unittest import mock
+from chip8_emulator.chip8 import Chip8
+from chip8_emulator.tiered_execution import TieredExecutor
+
+
+class TieredExecutionTest(unittest.TestCase):
+
+    # 6005 7101 1202: V1 is incremented forever by the loop at 0x202
+    _LOOP_PROGRAM = bytes([0x60, 0x05, 0x71, 0x01, 0x12, 0x02])
+
+    def _init_chip8(self, hotness_threshold):
+        chip8 = Chip8(mock.Mock(), mock.Mock(), hotness_threshold)
+        chip8.memory.load_rom(self._LOOP_PROGRAM)
+
+        return chip8
+
+    def test_init__interpreter_only_by_default(self):
+        chip8 = Chip8(mock.Mock(), mock.Mock())
+
+        self.assertIsNone(chip8.tiered_executor)
+
+    def test_step__cold_code_is_interpreted(self):
+        chip8 = self._init_chip8(hotness_threshold=10)
+        tiered_executor = chip8.tiered_executor
+
+        for _ in range(3):
+            tiered_executor.step()
+
+        statistics = tiered_executor.get_statistics()
+
+        self.assertEqual(0x202, chip8.memory.program_counter)
+        self.assertEqual(0x01, chip8.memory.v_registers[0x1])
+        self.assertEqual(3, statistics.interpreted_instructions)
+        self.assertEqual(0, statistics.compiled_instructions)
+        self.assertEqual(0, statistics.promotions)
+
+    def test_step__hot_block_is_promoted(self):
+        chip8 = self._init_chip8(hotness_threshold=2)
+        tiered_executor = chip8.tiered_executor
+
+        # 6005, then 7101 and 1202 interpreted twice before 0x202 is hot
+        for _ in range(8):
+            tiered_executor.step()
+
+        statistics = tiered_executor.get_statistics()
+
+        self.assertEqual(1, statistics.promotions)
+        self.assertEqual(5, statistics.interpreted_instructions)
+        self.assertEqual(6, statistics.compiled_instructions)
+        self.assertEqual(0x05, chip8.memory.v_registers[0x1])
+        self.assertIsNotNone(
+            tiered_executor.block_cache.get_compiled_block(0x202))
+
+    def test_step__threshold_0_compiles_on_first_visit(self):
+        chip8 = self._init_chip8(hotness_threshold=0)
+        tiered_executor = chip8.tiered_executor
+
+        tiered_executor.step()
+
+        statistics = tiered_executor.get_statistics()
+
+        self.assertEqual(1, statistics.promotions)
+        self.assertEqual(0, statistics.interpreted_instructions)
+        self.assertEqual(3, statistics.compiled_instructions)
+
+    def test_get_statistics__invalidations(self):
+        chip8 = self._init_chip8(hotness_threshold=0)
+        tiered_executor = chip8.tiered_executor
+        tiered_executor.step()
+
+        chip8.memory.notify_program_memory_write(0x202, 0x203)
+        statistics = tiered_executor.get_statistics()
+
+        self.assertEqual(1, statistics.invalidations)
+
+    def test_get_statistics__time_per_tier(self):
+        chip8 = self._init_chip8(hotness_threshold=2)
+        tiered_executor = chip8.tiered_executor
+
+        for _ in range(8):
+            tiered_executor.step()
+
+        statistics = tiered_executor.get_statistics()
+
+        self.assertGreater(statistics.interpreter_seconds, 0.0)
+        self.assertGreater(statistics.compiled_seconds, 0.0)
+
+    def test_default_hotness_threshold(self):
+        chip8 = Chip8(mock.Mock(), mock.Mock())
+        tiered_executor = TieredExecutor(chip8)
+
+        self.assertEqual(TieredExecutor.DEFAULT_HOTNESS_THRESHOLD,
+                         tiered_executor.hotness_threshold)
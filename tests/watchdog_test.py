@@ -0,0 +1,166 @@
+import unittest
+from unittest import mock
+from chip8_emulator.chip8 import Chip8
+from chip8_emulator.watchdog import StopReason, Watchdog
+
+
+class WatchdogTest(unittest.TestCase):
+
+    def _init_chip8(self):
+        keyboard_mock = mock.Mock()
+        keyboard_mock.pressed_key = None
+        keyboard_mock.get_pressed_key.return_value = None
+
+        return Chip8(mock.Mock(), keyboard_mock, headless=True)
+
+    def _run(self, rom_bytes, **watchdog_arguments):
+        chip8 = self._init_chip8()
+
+        return Watchdog(chip8, **watchdog_arguments).run(rom_bytes)
+
+    def test_run__jump_to_itself(self):
+        stop_reason = self._run(bytes([0x12, 0x00]))
+
+        self.assertEqual(StopReason.INFINITE_LOOP, stop_reason.reason)
+        self.assertEqual(0x200, stop_reason.program_counter)
+        self.assertEqual(2 * Watchdog.DEFAULT_LOOP_CHECK_INTERVAL,
+                         stop_reason.instructions)
+
+    def test_run__loop_without_state_change(self):
+        rom_bytes = bytes([
+            0x60, 0x00,  # V0 = 0
+            0x70, 0x01,  # V0 += 1
+            0x12, 0x02,  # Back to V0 += 1, V0 wraps around every 256 loops
+        ])
+
+        stop_reason = self._run(rom_bytes, loop_check_interval=7)
+
+        self.assertEqual(StopReason.INFINITE_LOOP, stop_reason.reason)
+        self.assertLessEqual(stop_reason.instructions, 8 * 2 * 256)
+
+    def test_run__timer_loop_is_not_infinite(self):
+        rom_bytes = bytes([
+            0x60, 0xFF,  # V0 = 255
+            0xF0, 0x15,  # Delay timer = V0
+            0xF1, 0x07,  # V1 = delay timer
+            0x31, 0x00,  # Skip if V1 == 0
+            0x12, 0x04,  # Back to V1 = delay timer
+            0x00, 0xEE,  # Return without a call
+        ])
+
+        stop_reason = self._run(rom_bytes, loop_check_interval=1)
+
+        self.assertEqual(StopReason.STACK_UNDERFLOW, stop_reason.reason)
+        self.assertEqual(0x20A, stop_reason.program_counter)
+        self.assertIn('Stack underflow', stop_reason.message)
+
+    def test_run__stack_overflow(self):
+        stop_reason = self._run(bytes([0x22, 0x00, 0x00, 0xEE]))
+
+        self.assertEqual(StopReason.STACK_OVERFLOW, stop_reason.reason)
+        self.assertEqual(16, stop_reason.instructions)
+
+    def test_run__program_counter_out_of_bounds(self):
+        stop_reason = self._run(bytes([0x1F, 0xFF]))
+
+        self.assertEqual(StopReason.PROGRAM_COUNTER_OUT_OF_BOUNDS,
+                         stop_reason.reason)
+        self.assertEqual(0xFFF, stop_reason.program_counter)
+
+    def test_run__memory_access_out_of_bounds(self):
+        stop_reason = self._run(bytes([0xAF, 0xFF, 0xF3, 0x55, 0x12, 0x04]))
+
+        self.assertEqual(StopReason.MEMORY_ACCESS_OUT_OF_BOUNDS,
+                         stop_reason.reason)
+        self.assertEqual(0x202, stop_reason.program_counter)
+
+    def test_run__invalid_opcode(self):
+        stop_reason = self._run(bytes([0x12, 0x02, 0xFF, 0xFF]))
+
+        self.assertEqual(StopReason.INVALID_OPCODE, stop_reason.reason)
+        self.assertEqual(0, stop_reason.instructions)
+
+    def test_run__i_register_starts_at_zero(self):
+        for rom_bytes in (bytes([0xD0, 0x05, 0x12, 0x02]),
+                          bytes([0xF0, 0x33, 0x12, 0x02]),
+                          bytes([0xF0, 0x55, 0x12, 0x02])):
+            stop_reason = self._run(rom_bytes)
+
+            self.assertEqual(StopReason.INFINITE_LOOP, stop_reason.reason)
+
+    def test_run__invalid_digit_sprite(self):
+        stop_reason = self._run(bytes([0x60, 0x20, 0xF0, 0x29, 0x12, 0x04]))
+
+        self.assertEqual(StopReason.INVALID_DIGIT_SPRITE, stop_reason.reason)
+        self.assertEqual(0x202, stop_reason.program_counter)
+        self.assertEqual(1, stop_reason.instructions)
+
+    def test_run__counts_fused_instructions(self):
+        rom_bytes = bytes([0x60, 0x01, 0x61, 0x02, 0x62, 0x03, 0x12, 0x06])
+
+        stop_reason = self._run(rom_bytes, max_instructions=2)
+
+        self.assertEqual(StopReason.INSTRUCTION_BUDGET_EXCEEDED,
+                         stop_reason.reason)
+        self.assertEqual(0x204, stop_reason.program_counter)
+        self.assertEqual(2, stop_reason.instructions)
+
+    @mock.patch('chip8_emulator.chip8.sleep')
+    def test_run__idle_loops_are_not_slept(self, mocked_sleep):
+        chip8 = self._init_chip8()
+        chip8.headless = False
+
+        stop_reason = Watchdog(chip8).run(bytes([
+            0x60, 0xFF,  # V0 = 255
+            0xF0, 0x15,  # Delay timer = V0
+            0xF1, 0x07,  # V1 = delay timer
+            0x31, 0x00,  # Skip if V1 == 0
+            0x12, 0x04,  # Back to V1 = delay timer
+            0x12, 0x0A,  # Jump to itself
+        ]))
+
+        self.assertEqual(StopReason.INFINITE_LOOP, stop_reason.reason)
+        self.assertEqual(0x20A, stop_reason.program_counter)
+        self.assertFalse(mocked_sleep.called)
+        self.assertFalse(chip8.headless)
+
+    def test_run__instruction_budget(self):
+        stop_reason = self._run(bytes([0x70, 0x01, 0x12, 0x00]),
+                                max_instructions=100)
+
+        self.assertEqual(StopReason.INSTRUCTION_BUDGET_EXCEEDED,
+                         stop_reason.reason)
+        self.assertEqual(100, stop_reason.instructions)
+
+    @mock.patch('chip8_emulator.watchdog.perf_counter')
+    def test_run__time_budget(self, mocked_perf_counter):
+        mocked_perf_counter.side_effect = range(100)
+
+        stop_reason = self._run(bytes([0x70, 0x01, 0x12, 0x00]),
+                                max_seconds=3)
+
+        self.assertEqual(StopReason.TIME_BUDGET_EXCEEDED, stop_reason.reason)
+        self.assertEqual(3 * Watchdog.DEFAULT_LOOP_CHECK_INTERVAL,
+                         stop_reason.instructions)
+
+    def test_run__removes_state_hasher_listener(self):
+        chip8 = self._init_chip8()
+        write_listeners = list(chip8.memory._program_memory_write_listeners)
+
+        Watchdog(chip8).run(bytes([0x12, 0x00]))
+
+        self.assertEqual(write_listeners,
+                         chip8.memory._program_memory_write_listeners)
+
+    def test_run_batch(self):
+        chip8 = self._init_chip8()
+
+        stop_reason = chip8.run_batch(bytes([0x12, 0x00]), max_instructions=10)
+
+        self.assertEqual({
+            'reason': StopReason.INSTRUCTION_BUDGET_EXCEEDED,
+            'program_counter': 0x200,
+            'instructions': 10,
+            'seconds': stop_reason.seconds,
+            'message': None,
+        }, stop_reason.as_dict())